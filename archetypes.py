@@ -0,0 +1,131 @@
+# archetypes.py
+
+from collections import namedtuple
+
+import asset_cache
+import config
+import gamelog
+
+# ============================================================================
+# 🐱 고양이 원형 표 (CatArchetype)
+# ============================================================================
+# 예전 EnemyCat은 매 틱 update()에서 get_jump_velocity(self.color_name),
+# get_gravity(self.color_name)를 호출해서, 호출할 때마다 색상 이름(문자열)으로
+# 딕셔너리를 새로 만들고 값을 찾았습니다. 색상, 점프 간격, 체력도 마찬가지였습니다.
+#
+# 이 모듈은 config.py의 색상별 설정을 처음 한 번만 읽어서
+# 색상마다 바뀌지 않는(immutable) 원형(archetype) 레코드를 만듭니다.
+#   - 크기에 맞춰 미리 크기 조정/좌우 반전한 이미지
+#   - 이동 속도, 점프 간격, 점프 속도, 중력
+#   - 스테이지별 체력 표 (1 ~ MAX_STAGE)
+# 고양이는 원형을 참조만 하고, update()에서는 속성만 읽습니다.
+
+_log_asset = gamelog.get_logger("asset")
+
+# 색상 이름 -> 대체 사각형 색상 (이미지 로드 실패 시)
+_FALLBACK_RGB = {
+    "yellow": config.YELLOW,
+    "black": config.BLACK,
+    "white": config.WHITE,
+}
+
+
+def cat_hp(base_hp, stage):
+    """
+    스테이지별 고양이 체력을 계산합니다.
+
+    - 기본 체력은 색상별로 다름 (config.ENEMY_CAT_BASE_HP)
+    - 스테이지가 올라갈수록 체력이 증가 (config.ENEMY_CAT_STAGE_MULTIPLIER)
+      예: 배율 0.5면 스테이지 1 = 1.0배, 스테이지 2 = 1.5배, 스테이지 3 = 2.0배
+    """
+    return int(base_hp * (1 + (stage - 1) * config.ENEMY_CAT_STAGE_MULTIPLIER))
+
+
+class CatArchetype(namedtuple("CatArchetype", [
+        "color_name",     # 색상 이름 ("yellow", "black", "white")
+        "color",          # RGB 색상 값 (이미지가 없을 때 사각형 색)
+        "size",           # (너비, 높이)
+        "speed",          # 틱당 왼쪽 이동 픽셀
+        "jump_interval",  # 점프 간격 (밀리초)
+        "jump_velocity",  # 점프 속도 (음수 = 위로)
+        "gravity",        # 틱당 낙하 속도 증가량
+        "base_hp",        # 스테이지 1 기준 체력
+        "hp_by_stage",    # 스테이지 1 ~ MAX_STAGE 체력 튜플
+        "score",          # 처치 점수
+        "image",          # 크기 조정 + 좌우 반전된 공유 Surface (직접 수정하면 안 됨)
+])):
+    """
+    색상별 고양이 원형 (한 번 만들면 바뀌지 않는 레코드)
+    """
+
+    __slots__ = ()
+
+    def hp(self, stage):
+        """스테이지별 체력 (표에 없는 스테이지는 같은 공식으로 계산)"""
+        if 1 <= stage <= len(self.hp_by_stage):
+            return self.hp_by_stage[stage - 1]
+        return cat_hp(self.base_hp, stage)
+
+
+def _jump_setting(color_name, name):
+    """색상별 점프 설정 (예: YELLOW_CAT_GRAVITY), 없는 색상은 흰 고양이 값 사용"""
+    default = getattr(config, f"WHITE_CAT_{name}")
+    return getattr(config, f"{color_name.upper()}_CAT_{name}", default)
+
+
+def _load_cat_image(color_name, size, color):
+    """assets/cat_{색상}.png를 크기 조정 + 좌우 반전해서 가져옵니다 (실패 시 색상 사각형)."""
+    try:
+        # 고양이는 왼쪽으로 이동하므로 좌우 반전
+        return asset_cache.get_image(f"assets/cat_{color_name}.png", size, flip=True)
+    except:
+        _log_asset.warning("⚠️ %s 고양이 이미지 로드 실패 - 기본 사각형 사용", color_name)
+        return asset_cache.get_fallback(f"cat_{color_name}", size, color)
+
+
+def build_cat_archetypes():
+    """
+    config.py 설정으로 색상별 고양이 원형을 만듭니다.
+
+    Returns:
+        dict: 색상 이름 -> CatArchetype (config.ENEMY_CAT_SIZE의 순서)
+    """
+    archetypes = {}
+    for color_name, size in config.ENEMY_CAT_SIZE.items():
+        color = _FALLBACK_RGB.get(color_name, config.WHITE)
+        base_hp = config.ENEMY_CAT_BASE_HP.get(color_name, 1)
+        archetypes[color_name] = CatArchetype(
+            color_name=color_name,
+            color=color,
+            size=tuple(size),
+            speed=config.ENEMY_CAT_SPEED[color_name],
+            jump_interval=_jump_setting(color_name, "JUMP_INTERVAL"),
+            jump_velocity=_jump_setting(color_name, "JUMP_VELOCITY"),
+            gravity=_jump_setting(color_name, "GRAVITY"),
+            base_hp=base_hp,
+            hp_by_stage=tuple(cat_hp(base_hp, stage) for stage in range(1, config.MAX_STAGE + 1)),
+            score=config.SCORE_PER_CAT.get(color_name, 0),
+            image=_load_cat_image(color_name, tuple(size), color),
+        )
+    return archetypes
+
+
+_cat_archetypes = None  # 처음 사용할 때 build_cat_archetypes()로 만듦
+
+
+def cat_archetypes():
+    """색상 이름 -> CatArchetype 표 (처음 호출할 때 한 번만 만듦)"""
+    global _cat_archetypes
+    if _cat_archetypes is None:
+        _cat_archetypes = build_cat_archetypes()
+    return _cat_archetypes
+
+
+def get_cat_archetype(color_name):
+    """
+    색상별 고양이 원형을 반환합니다.
+
+    Raises:
+        KeyError: config.ENEMY_CAT_SIZE에 없는 색상
+    """
+    return cat_archetypes()[color_name]
@@ -0,0 +1,190 @@
+# asset_cache.py
+
+import pygame
+
+# ============================================================================
+# 🖼️ 스프라이트 이미지 캐시 (Asset Cache)
+# ============================================================================
+# 고양이, 수리검, 돌 등은 스폰될 때마다 같은 PNG 파일을 다시 읽고
+# 크기 조정/좌우 반전을 반복했습니다.
+# 이 모듈은 (경로, 크기, 반전) 조합마다 이미지를 한 번만 만들어 두고
+# 이후에는 같은 Surface를 공유해서 돌려줍니다.
+#
+# 픽셀 충돌(config.COLLISION_MODE = "mask")에 쓰는 마스크도 이미지와 같은 (경로, 크기, 반전)
+# 변형마다 한 번만 만듭니다. 로드에 실패했을 때의 대체 이미지(단색 사각형/원)도
+# get_fallback()으로 ("fallback", 이름, 크기, 색상, 모양)마다 한 번만 만들어 공유하므로
+# 스폰할 때마다 Surface나 마스크가 새로 생기지 않습니다.
+
+
+class AssetCache:
+    """
+    이미지 변형 캐시 클래스
+
+    주요 기능:
+    - 원본 PNG는 경로당 한 번만 디스크에서 디코딩
+    - (경로, 크기, 좌우 반전) 변형마다 한 번만 scale/flip 수행
+    - 로드 실패도 기억하여 같은 파일을 반복해서 읽지 않음
+    - hit/miss 통계 제공 (스폰 시 디스크 I/O가 0인지 확인용)
+    - 로드 실패 시의 대체 이미지도 변형마다 한 번만 만듦 (get_fallback)
+    - 이미지 변형별 충돌 마스크 캐시 (get_mask)
+
+    반환되는 Surface는 여러 스프라이트가 공유하므로 직접 수정하면 안 됩니다.
+    """
+
+    def __init__(self):
+        self._sources = {}   # 경로 -> 디코딩된 원본 Surface
+        self._images = {}    # (경로, 크기, 반전) -> 완성된 Surface
+        self._failures = {}  # (경로, 크기, 반전) -> 로드 실패 예외 (종류, 인자)
+        self.hits = 0        # 캐시에서 바로 돌려준 횟수
+        self.misses = 0      # 새로 만들어야 했던 횟수
+        self.disk_loads = 0  # 실제로 파일을 읽은 횟수
+        self._masks = {}     # (경로, 크기, 반전) -> 충돌 마스크
+        self._variants = {}  # id(완성된 Surface) -> (경로, 크기, 반전) (_images가 Surface를 들고 있어 id가 바뀌지 않음)
+
+    def get_image(self, path, size=None, flip=False):
+        """
+        캐시된 이미지 변형을 반환합니다.
+
+        Args:
+            path: 이미지 파일 경로 (예: "assets/shuriken.png")
+            size: (너비, 높이) 튜플, None이면 원본 크기
+            flip: True면 좌우 반전
+
+        Returns:
+            pygame.Surface: 공유 Surface (읽기 전용으로 사용)
+
+        Raises:
+            pygame.error, OSError: 이미지 로드 실패 시 (실패도 캐시됨)
+        """
+        key = (path, tuple(size) if size is not None else None, bool(flip))
+
+        image = self._images.get(key)
+        if image is not None:
+            self.hits += 1
+            return image
+
+        error = self._failures.get(key)
+        if error is not None:
+            # 이미 실패한 파일은 다시 읽지 않고 같은 오류를 알림
+            # (저장한 예외 객체를 다시 raise하면 __traceback__에 호출 프레임이 계속 쌓여
+            #  프레임의 지역 변수(스프라이트 등)가 해제되지 않으므로 매번 새 예외를 만듦)
+            self.hits += 1
+            error_type, args = error
+            raise error_type(*args)
+
+        self.misses += 1
+        try:
+            image = self._source(path)
+            if key[1] is not None:
+                image = pygame.transform.scale(image, key[1])
+            if key[2]:
+                image = pygame.transform.flip(image, True, False)
+        except (pygame.error, OSError) as e:
+            self._failures[key] = (type(e), e.args)
+            raise
+
+        self._images[key] = image
+        self._variants[id(image)] = key
+        return image
+
+    def _source(self, path):
+        """경로당 한 번만 PNG를 디코딩하여 원본 Surface를 반환합니다."""
+        source = self._sources.get(path)
+        if source is None:
+            source = pygame.image.load(path)
+            self.disk_loads += 1
+            # 화면이 없는 환경(헤드리스)에서는 convert_alpha()를 쓸 수 없음
+            if pygame.display.get_init() and pygame.display.get_surface() is not None:
+                source = source.convert_alpha()
+            self._sources[path] = source
+        return source
+
+    def get_fallback(self, name, size, color, shape="rect"):
+        """
+        이미지 로드에 실패했을 때 쓸 대체 이미지를 반환합니다 (변형마다 한 번만 만들어 공유).
+
+        Args:
+            name: 대체 이미지 이름 (예: "mouse", 같은 크기/색상이어도 용도별로 구분)
+            size: (너비, 높이) 튜플
+            color: 채울 색상
+            shape: "rect"(불투명 사각형) 또는 "circle"(투명 배경의 원)
+
+        Returns:
+            pygame.Surface: 공유 Surface (읽기 전용으로 사용, get_mask()도 한 번만 만듦)
+        """
+        key = ("fallback", name, tuple(size), tuple(color), shape)
+        image = self._images.get(key)
+        if image is None:
+            width, height = key[2]
+            if shape == "circle":
+                image = pygame.Surface((width, height), pygame.SRCALPHA)
+                pygame.draw.circle(image, color, (width // 2, height // 2), min(width, height) // 2)
+            else:
+                image = pygame.Surface((width, height))
+                image.fill(color)
+            self._images[key] = image
+            self._variants[id(image)] = key
+        return image
+
+    def get_mask(self, image):
+        """
+        이미지의 충돌 마스크를 반환합니다 (get_image()의 변형마다 한 번만 만듦).
+
+        Args:
+            image: get_image()가 돌려준 공유 Surface (또는 스프라이트의 image)
+
+        Returns:
+            pygame.mask.Mask: 불투명한 픽셀(알파 127 초과)이 1인 마스크 (읽기 전용으로 사용)
+
+        get_image()/get_fallback()이 만들지 않은 Surface는 매번 새로 만들고 캐시하지 않습니다.
+        """
+        key = self._variants.get(id(image))
+        if key is None:
+            return pygame.mask.from_surface(image)
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = pygame.mask.from_surface(image)
+            self._masks[key] = mask
+        return mask
+
+    def clear(self):
+        """캐시를 비웁니다 (화면 모드 변경 등으로 Surface를 다시 만들어야 할 때)."""
+        self._sources.clear()
+        self._images.clear()
+        self._failures.clear()
+        self._masks.clear()
+        self._variants.clear()
+
+    def stats(self):
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            dict: hits, misses, disk_loads, entries
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_loads": self.disk_loads,
+            "entries": len(self._images),
+            "masks": len(self._masks),
+        }
+
+
+# 게임 전체에서 공유하는 캐시 인스턴스
+cache = AssetCache()
+
+
+def get_image(path, size=None, flip=False):
+    """공유 캐시에서 이미지 변형을 가져옵니다 (AssetCache.get_image 참고)."""
+    return cache.get_image(path, size, flip)
+
+
+def get_fallback(name, size, color, shape="rect"):
+    """공유 캐시에서 로드 실패 시의 대체 이미지를 가져옵니다 (AssetCache.get_fallback 참고)."""
+    return cache.get_fallback(name, size, color, shape)
+
+
+def get_mask(image):
+    """공유 캐시에서 이미지의 충돌 마스크를 가져옵니다 (AssetCache.get_mask 참고)."""
+    return cache.get_mask(image)
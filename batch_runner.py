@@ -0,0 +1,241 @@
+# batch_runner.py
+
+import argparse
+import ast
+import csv
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+from collections import Counter, namedtuple
+
+import pygame
+
+import config
+import gamelog
+from session import GameSession, PlayerInput
+
+# ============================================================================
+# 🤖 헤드리스 자동 플레이 일괄 실행기 (Batch Runner)
+# ============================================================================
+# config.py의 밸런스 값(ENEMY_CAT_SPEED, BASE_BOSS_HP, STONE_SPEED_MAX ...)을 바꿨을 때
+# 게임이 얼마나 어려워졌는지 보려면 수천 판을 돌려 봐야 합니다.
+# GameSession은 창 없이 tick()만 호출해도 진행되므로, 시드마다 한 판씩
+# multiprocessing 풀의 모든 코어에 나눠서 최대 속도로 실행하고 결과를 모읍니다.
+#
+# 사용 방법:
+#     python batch_runner.py --games 2000                                  # 시드 0 ~ 1999, 모든 코어
+#     python batch_runner.py --games 500 --bot scripted --set BASE_BOSS_HP=80
+#     python batch_runner.py --set "ENEMY_CAT_SPEED={'yellow': 3, 'black': 2, 'white': 2}" --csv hard.csv
+#
+# 결과:
+#   - 요약 표: 생존 시간, 도달 스테이지, 점수 (평균/중앙값/최소/최대), 게임 결과와 게임 오버 원인 분포
+#   - CSV: 시드마다 한 줄 (seed, bot, state, stage, score, survival_s, ticks, cause)
+#
+# 같은 시드와 같은 봇이면 결과가 항상 같으므로, --set 없이 한 번, --set으로 한 번 돌려서 비교하면 됩니다.
+# 궁금한 판은 replay.py처럼 시드로 다시 실행해 볼 수 있습니다.
+
+# 한 판의 결과
+# state: "game_over", "game_clear", "timeout"(max_ticks까지 끝나지 않음)
+# cause: 게임 오버 원인 ("cat", "boss", "mouse", "stone"), 게임 오버가 아니면 None
+RunResult = namedtuple("RunResult", ["seed", "bot", "state", "stage", "score", "survival_s", "ticks", "cause"])
+
+# 한 판의 최대 틱 수 (기본 10분, 봇이 한 자리에서 끝없이 버티는 경우 대비)
+MAX_TICKS = config.TICK_RATE * 600
+
+DODGE_DISTANCE = 140  # dodger 봇이 점프하기 시작하는 앞쪽 거리 (px)
+
+
+# ===== 봇 =====
+# 봇은 (session, tick) -> PlayerInput 함수입니다. 랜덤을 쓰지 않으므로 시드가 같으면 결과도 같습니다.
+
+def scripted_bot(session, tick):
+    """좌우로 왕복하면서 일정 간격으로 점프하고 표창을 던짐 (benchmarks/bench_simulation.py와 같은 입력)"""
+    return PlayerInput(right=(tick // 120) % 2 == 0, left=(tick // 120) % 2 == 1,
+                       jump=tick % 45 == 0, throw=1 if tick % 6 == 0 else 0)
+
+
+def dodger_bot(session, tick):
+    """제자리에서 표창을 던지다가 앞쪽에 적/마우스/돌이 가까이 오면 점프"""
+    player = session.player
+    ahead = player.rect.inflate(DODGE_DISTANCE, 0).move(DODGE_DISTANCE // 2, 0)
+    danger = any(ahead.colliderect(sprite.rect)
+                 for group in (session.enemies, session.mice, session.stones) for sprite in group)
+    entities = session.entities
+    if not danger and entities is not None:
+        danger = any(arrays.first_overlap(ahead) >= 0 for arrays in (entities.cats, entities.mice, entities.stones))
+    return PlayerInput(jump=danger, throw=1 if tick % 6 == 0 else 0)
+
+
+BOTS = {
+    "scripted": scripted_bot,
+    "dodger": dodger_bot,
+}
+
+
+# ===== 작업 프로세스 =====
+
+def init_headless_worker(overrides):
+    """
+    작업 프로세스 초기화: config 값 덮어쓰기, 게임 로그 줄이기, 이미지 로드용 디스플레이
+    (vec_env.VecEnv의 작업 프로세스도 같은 방식으로 초기화)
+
+    고양이 원형(archetypes)은 첫 세션을 만들 때 config에서 읽으므로,
+    세션을 만들기 전에 덮어쓰면 ENEMY_CAT_SPEED 같은 값도 반영됩니다.
+    """
+    for name, value in overrides.items():
+        setattr(config, name, value)
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # 창은 띄우지 않음
+    # SDL이 SIGTERM을 가로채면 풀을 닫을 때(terminate) 작업 프로세스가 끝나지 않고 멈춤
+    os.environ["SDL_NO_SIGNAL_HANDLERS"] = "1"
+    pygame.display.init()
+    pygame.display.set_mode((config.WIDTH, config.HEIGHT))
+    # 모든 카테고리를 WARNING으로 (INFO 로그는 레벨 검사 한 번으로 건너뜀)
+    gamelog.configure(levels={"default": "WARNING"}, console_level="WARNING", ring_size=0)
+
+
+def run_game(job):
+    """
+    한 판을 최대 속도로 끝까지 실행합니다.
+
+    Args:
+        job: (seed, bot 이름, backend, max_ticks)
+
+    Returns:
+        RunResult
+    """
+    seed, bot_name, backend, max_ticks = job
+    bot = BOTS[bot_name]
+    session = GameSession(backend, seed=seed)
+    tick = session.tick
+    for count in range(max_ticks):
+        state = tick(bot(session, count))
+        if state == "game_over" or state == "game_clear":
+            break
+    else:
+        state = "timeout"
+    return RunResult(seed, bot_name, state, session.current_stage, session.score,
+                     round(session.elapsed_ms / 1000.0, 2), session.tick_count, session.death_cause)
+
+
+def run_batch(seeds, bot="dodger", backend="sprites", overrides=None, workers=None, max_ticks=MAX_TICKS):
+    """
+    시드마다 한 판씩 프로세스 풀에서 실행합니다.
+
+    Args:
+        seeds: 실행할 시드 목록
+        bot: BOTS의 봇 이름
+        backend: 엔티티 저장 방식 ("sprites" / "numpy")
+        overrides: {config 이름: 값} - 모든 작업 프로세스에 적용
+        workers: 프로세스 수 (기본값: CPU 코어 수)
+        max_ticks: 한 판의 최대 틱 수
+
+    Returns:
+        list: 시드 순서의 RunResult
+    """
+    jobs = [(seed, bot, backend, max_ticks) for seed in seeds]
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(jobs) // (workers * 8))  # 프로세스 간 통신은 줄이고, 끝날 때 노는 코어는 적게
+    with multiprocessing.Pool(workers, initializer=init_headless_worker, initargs=(overrides or {},)) as pool:
+        results = list(pool.imap_unordered(run_game, jobs, chunksize))
+    results.sort(key=lambda result: result.seed)
+    return results
+
+
+# ===== 결과 정리 =====
+
+def _stats(values):
+    """(평균, 중앙값, 최소, 최대)"""
+    return statistics.fmean(values), statistics.median(values), min(values), max(values)
+
+
+def print_summary(results, elapsed_s):
+    """요약 표 출력"""
+    count = len(results)
+    print(f"\n{count}판, {elapsed_s:.1f}초 ({count / elapsed_s:.1f}판/초)")
+    print(f"{'항목':<12} | {'평균':>9} | {'중앙값':>9} | {'최소':>9} | {'최대':>9}")
+    print("-" * 62)
+    for label, values, fmt in (
+        ("생존 시간(초)", [r.survival_s for r in results], ".1f"),
+        ("스테이지", [r.stage for r in results], ".2f"),
+        ("점수", [r.score for r in results], ".0f"),
+    ):
+        mean, median, low, high = _stats(values)
+        print(f"{label:<12} | {mean:>9{fmt}} | {median:>9{fmt}} | {low:>9{fmt}} | {high:>9{fmt}}")
+
+    print("\n게임 결과")
+    for state, n in Counter(r.state for r in results).most_common():
+        print(f"  {state:<12} {n:>6} ({n / count:6.1%})")
+    deaths = Counter(r.cause for r in results if r.cause is not None)
+    if deaths:
+        total = sum(deaths.values())
+        print("\n게임 오버 원인")
+        for cause, n in deaths.most_common():
+            print(f"  {cause:<12} {n:>6} ({n / total:6.1%})")
+    print("\n도달 스테이지")
+    for stage, n in sorted(Counter(r.stage for r in results).items()):
+        print(f"  {stage:>2} {n:>6} ({n / count:6.1%})")
+
+
+def write_csv(results, path):
+    """시드마다 한 줄씩 CSV로 저장"""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(RunResult._fields)
+        writer.writerows(results)
+
+
+def _parse_override(text):
+    """
+    "이름=값" -> (이름, 값)
+
+    값은 파이썬 리터럴(숫자, 문자열, dict...)로 읽고, 읽을 수 없으면 문자열 그대로 씁니다.
+
+    Raises:
+        argparse.ArgumentTypeError: 형식이 틀렸거나 config에 없는 이름
+    """
+    name, sep, value = text.partition("=")
+    name = name.strip()
+    if not sep or not name.isupper() or not hasattr(config, name):
+        raise argparse.ArgumentTypeError(f"config에 없는 설정이거나 '이름=값' 형식이 아닙니다: {text}")
+    try:
+        value = ast.literal_eval(value.strip())
+    except (ValueError, SyntaxError):
+        value = value.strip()
+    return name, value
+
+
+def main(argv=None):
+    """
+    명령줄 실행: 시드를 프로세스 풀에 나눠 실행하고 요약 표와 CSV를 출력합니다.
+
+    Returns:
+        int: 종료 코드 (0)
+    """
+    parser = argparse.ArgumentParser(description="헤드리스 자동 플레이 일괄 실행 (밸런스 확인용)")
+    parser.add_argument("--games", type=int, default=1000, help="실행할 판 수")
+    parser.add_argument("--seed-start", type=int, default=0, help="첫 시드 (seed-start부터 games개)")
+    parser.add_argument("--bot", choices=sorted(BOTS), default="dodger", help="플레이할 봇")
+    parser.add_argument("--backend", choices=("sprites", "numpy"), default="sprites", help="엔티티 저장 방식")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--max-ticks", type=int, default=MAX_TICKS, help="한 판의 최대 틱 수")
+    parser.add_argument("--set", dest="overrides", type=_parse_override, action="append", default=[],
+                        metavar="이름=값", help="config 값 덮어쓰기 (여러 번 사용 가능)")
+    parser.add_argument("--csv", default="batch_results.csv", help="판별 결과를 저장할 CSV 파일")
+    args = parser.parse_args(argv)
+
+    overrides = dict(args.overrides)
+    seeds = range(args.seed_start, args.seed_start + args.games)
+    if overrides:
+        print("config 덮어쓰기: " + ", ".join(f"{name}={value!r}" for name, value in overrides.items()))
+    start = time.perf_counter()
+    results = run_batch(seeds, args.bot, args.backend, overrides, args.workers, args.max_ticks)
+    print_summary(results, time.perf_counter() - start)
+    write_csv(results, args.csv)
+    print(f"\n결과 저장: {args.csv}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+# benchmarks/bench_collision.py
+#
+# 충돌 판정 벤치마크: 기존 방식(spritecollide 전체 비교) vs 공간 해시(SpatialHash)
+#
+# 실행 방법:
+#     python benchmarks/bench_collision.py
+#
+# 살아 있는 엔티티 수(10, 100, 1000)마다 수리검/적/돌/마우스를 흩뿌리고
+# 매 틱 조금씩 이동시키면서 게임과 같은 충돌 패스를 돌려 틱당 평균 시간을 비교합니다.
+#
+# 배치 방식:
+# - screen: 모든 엔티티가 800x600 화면 안에 빽빽하게 겹쳐 있음 (공간 해시에 가장 불리)
+# - stream: 스트레스 스테이지처럼 화면 오른쪽 밖으로 줄지어 대기하며 들어옴
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pygame
+
+import config
+from spatial_hash import SpatialHash
+
+TICKS = 200
+ENTITY_COUNTS = (10, 100, 1000)
+LAYOUTS = ("screen", "stream")
+
+
+class Box(pygame.sprite.Sprite):
+    """이미지 없이 rect와 속도만 가진 벤치마크용 스프라이트"""
+
+    def __init__(self, rng, size, speed, world_width):
+        super().__init__()
+        self.rect = pygame.Rect(rng.randrange(world_width), rng.randrange(config.HEIGHT), *size)
+        self.speed = speed
+        self.world_width = world_width
+
+    def update(self):
+        self.rect.x -= self.speed
+        if self.rect.right < 0:
+            self.rect.left = self.world_width
+        elif self.rect.left > self.world_width:
+            self.rect.right = 0
+
+
+def build_world(count, layout, seed=1):
+    """엔티티 count개를 수리검 40%, 적 40%, 돌 10%, 마우스 10% 비율로 만듭니다."""
+    rng = random.Random(seed)
+    # stream 배치는 엔티티 100개당 화면 한 개 너비만큼 줄을 길게 늘어놓음
+    world_width = config.WIDTH if layout == "screen" else config.WIDTH * max(1, count // 100)
+    groups = {name: pygame.sprite.Group() for name in ("shurikens", "enemies", "stones", "mice")}
+    all_sprites = pygame.sprite.Group()
+    plan = (("shurikens", 0.4, (30, 30), -15), ("enemies", 0.4, (50, 60), 6),
+            ("stones", 0.1, (80, 80), 10), ("mice", 0.1, (40, 30), 5))
+    for name, ratio, size, speed in plan:
+        for _ in range(max(1, int(count * ratio))):
+            sprite = Box(rng, size, speed, world_width)
+            sprite.add(groups[name], all_sprites)
+    player = Box(rng, (config.PLAYER_WIDTH, config.PLAYER_HEIGHT), 0, config.WIDTH)
+    player.add(all_sprites)
+    return player, groups, all_sprites
+
+
+def naive_tick(player, groups, _grid):
+    """기존 방식: 수리검마다 spritecollide, 플레이어는 그룹마다 선형 검사"""
+    hits = 0
+    for shuriken in groups["shurikens"]:
+        hits += len(pygame.sprite.spritecollide(shuriken, groups["enemies"], False))
+    for name in ("enemies", "mice", "stones"):
+        for sprite in groups[name]:
+            if player.rect.colliderect(sprite.rect):
+                hits += 1
+                break
+    return hits
+
+
+def grid_tick(player, groups, grid):
+    """공간 해시 방식: 칸이 바뀐 스프라이트만 갱신 후 같은 칸의 후보만 검사"""
+    hits = 0
+    for shuriken in groups["shurikens"]:
+        hits += len(grid.query(shuriken.rect, groups["enemies"]))
+    for name in ("enemies", "mice", "stones"):
+        if grid.first(player.rect, groups[name]) is not None:
+            hits += 1
+    return hits
+
+
+def run(count, layout, tick_fn, use_grid):
+    player, groups, all_sprites = build_world(count, layout)
+    grid = SpatialHash(config.COLLISION_CELL_SIZE) if use_grid else None
+    total_hits = 0
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        all_sprites.update()
+        if grid is not None:
+            grid.sync(all_sprites)
+        total_hits += tick_fn(player, groups, grid)
+    elapsed = time.perf_counter() - start
+    return elapsed / TICKS * 1000.0, total_hits
+
+
+def main():
+    print(f"{'배치':>6} | {'엔티티':>6} | {'기존(ms/틱)':>12} | {'공간해시(ms/틱)':>15} | {'배속':>6} | 충돌 수 일치")
+    print("-" * 75)
+    for layout in LAYOUTS:
+        for count in ENTITY_COUNTS:
+            naive_ms, naive_hits = run(count, layout, naive_tick, use_grid=False)
+            grid_ms, grid_hits = run(count, layout, grid_tick, use_grid=True)
+            speedup = naive_ms / grid_ms if grid_ms > 0 else float("inf")
+            print(f"{layout:>6} | {count:>6} | {naive_ms:>12.3f} | {grid_ms:>15.3f} | {speedup:>5.1f}x | {naive_hits == grid_hits}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# benchmarks/bench_entities.py
+#
+# 엔티티 저장 방식 벤치마크 (스트레스 스테이지)
+# - sprites: 고양이마다 EnemyCat 스프라이트, 매 틱 update()를 한 마리씩 호출
+# - numpy:   고양이를 EntityStore 배열에 담고 이동/중력/충돌을 배열 연산으로 한 번에 계산
+#
+# 실행 방법:
+#     python benchmarks/bench_entities.py
+#
+# 고양이 떼(GameSession.spawn_swarm)를 스폰한 뒤 TICKS틱 동안 표창을 던지며 진행하고,
+# 틱당 평균 시간(ms)을 비교합니다. 60 FPS를 유지하려면 1틱이 16.7ms 안에 끝나야 합니다.
+# (화면 그리기는 포함하지 않은 시뮬레이션 시간입니다.)
+# 플레이어는 puppy 방어 횟수를 크게 줘서 고양이 떼에 부딪혀도 게임이 끝나지 않게 합니다.
+#
+# 두 방식은 같은 시드에서 같은 게임이어야 하므로, 남은 적 수가 다르면 표 아래에 어긋난 크기를
+# 출력하고 종료 코드 1로 끝납니다 (한 번에 여러 마리와 부딪혔을 때 고르는 고양이가 다른 경우 등).
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+import config
+import entity_store
+import gamelog
+from session import GameSession, PlayerInput
+
+TICKS = 300
+SWARM_SIZES = (100, 1000, 3000, 10000)
+
+
+def bench_swarm(backend, count, seed=1):
+    """
+    고양이 count마리 스트레스 스테이지를 진행합니다.
+
+    Returns:
+        tuple: (틱당 평균 시간(ms), 마지막에 남은 적 수)
+    """
+    session = GameSession(backend, seed=seed)
+    session.spawn_swarm(count)
+    start = time.perf_counter()
+    for tick in range(TICKS):
+        session.player.defense_count = 10 ** 9  # 부딪혀도 게임 오버되지 않음
+        session.tick(PlayerInput(jump=tick % 40 == 0, throw=1 if tick % 6 == 0 else 0))
+    tick_ms = (time.perf_counter() - start) / TICKS * 1000.0
+    return tick_ms, session.enemy_count
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((config.WIDTH, config.HEIGHT))
+    gamelog.configure(console_level="WARNING")  # 스폰 로그가 측정을 방해하지 않도록
+
+    backends = ["sprites"]
+    if entity_store.available():
+        backends.append("numpy")
+    else:
+        print("numpy가 설치되어 있지 않아 sprites 방식만 측정합니다.")
+
+    mismatches = []
+    budget_ms = 1000.0 / config.TICK_RATE
+    print(f"{'고양이 수':>10} | {'방식':>8} | {'ms/틱':>8} | {'남은 적':>8} | 60 FPS 유지({budget_ms:.1f}ms)")
+    print("-" * 66)
+    for count in SWARM_SIZES:
+        remaining_by_backend = {}
+        for backend in backends:
+            tick_ms, remaining = bench_swarm(backend, count)
+            remaining_by_backend[backend] = remaining
+            ok = "O" if tick_ms < budget_ms else "X"
+            print(f"{count:>10} | {backend:>8} | {tick_ms:>8.3f} | {remaining:>8} | {ok}")
+        if len(set(remaining_by_backend.values())) > 1:
+            mismatches.append((count, remaining_by_backend))
+
+    pygame.quit()
+    if mismatches:
+        for count, remaining_by_backend in mismatches:
+            detail = ", ".join(f"{backend} {remaining}" for backend, remaining in remaining_by_backend.items())
+            print(f"❌ 고양이 {count}마리: 방식별 남은 적 수가 다릅니다 ({detail})")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
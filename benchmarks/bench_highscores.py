@@ -0,0 +1,161 @@
+# benchmarks/bench_highscores.py
+#
+# 하이스코어 저장 벤치마크: 예전 방식("w"로 열어 통째로 쓰기) vs HighScoreStore(JSON) vs SQLite
+#
+# 실행 방법:
+#     python benchmarks/bench_highscores.py
+#
+# 1. 동시 저장: 임시 폴더의 같은 하이스코어 파일에 프로세스 여러 개가 동시에 기록을 남깁니다
+#    (키오스크 여러 대가 같은 폴더를 쓰는 상황). 모두 끝난 뒤 파일에 남은 기록 수를 세어
+#    잃은 기록과 깨진 파일(읽기 실패) 횟수를 비교합니다.
+#    TOP 10만 남기면 잃은 기록을 셀 수 없으므로 limit을 전체 기록 수보다 크게 잡습니다.
+# 2. TOP 10 판정: 기록 수를 늘려 가며 is_top10_score() 1회 시간을 잽니다.
+#    - 정렬: 모든 기록을 읽어 정렬한 뒤 10번째와 비교 (모든 기록을 JSON에 둘 때의 방식)
+#    - sqlite: (score DESC, time ASC) 인덱스로 10번째 기록 하나만 찾음
+
+import json
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import gamelog
+import highscores
+
+WORKERS = 4
+RECORDS_PER_WORKER = 50
+RECORD_COUNTS = (100, 1000, 10000, 100000)
+QUERY_REPEAT = 200
+SEED = 1
+
+
+# ===== 1. 동시 저장 =====
+
+def naive_add(path, name, score, elapsed_seconds):
+    """예전 방식: 파일을 읽고 기록을 더한 뒤 "w"로 열어 통째로 씀 (잠금, 합치기 없음)"""
+    records = []
+    try:
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, list):
+                records = data
+    except Exception:
+        pass
+    records.append({"name": name, "score": score, "time": elapsed_seconds})
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(records, f, ensure_ascii=False, indent=2)
+
+
+def writer(job):
+    """작업 프로세스 하나: RECORDS_PER_WORKER개의 기록을 남김 (게임이 끝날 때마다 한 번)"""
+    mode, path, worker = job
+    gamelog.configure(levels={"default": "ERROR"}, console_level="ERROR", ring_size=0)
+    limit = WORKERS * RECORDS_PER_WORKER
+    if mode == "json":
+        store = highscores.HighScoreStore(path, limit)
+    elif mode == "sqlite":
+        store = highscores.SQLiteHighScoreStore(path, limit)
+    for i in range(RECORDS_PER_WORKER):
+        name, score, elapsed = f"w{worker}_{i}", worker * 1000 + i, float(i)
+        if mode == "naive":
+            naive_add(path, name, score, elapsed)
+        else:
+            store.refresh()
+            store.add(name, score, elapsed)
+    if mode != "naive":
+        store.close()
+
+
+def run_concurrent(mode):
+    """
+    WORKERS개 프로세스가 같은 파일에 동시에 기록을 남깁니다.
+
+    Returns:
+        tuple: (남은 기록 수, 걸린 시간 (초))
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "highscores.db" if mode == "sqlite" else "highscores.json")
+        jobs = [(mode, path, worker) for worker in range(WORKERS)]
+        start = time.perf_counter()
+        with multiprocessing.Pool(WORKERS) as pool:
+            pool.map(writer, jobs, 1)
+        elapsed = time.perf_counter() - start
+        if mode == "sqlite":
+            store = highscores.SQLiteHighScoreStore(path)
+            kept = store.count()
+            store.close()
+        else:
+            try:
+                kept = len(highscores._read_records(path))
+            except ValueError:
+                kept = 0  # 마지막 쓰기가 덮어쓴 파일까지 깨짐
+    return kept, elapsed
+
+
+# ===== 2. TOP 10 판정 =====
+
+def make_records(count, rng):
+    return [{"name": f"p{i}", "score": rng.randint(0, 100000), "time": round(rng.uniform(10, 600), 2)}
+            for i in range(count)]
+
+
+def sorted_top10(records, score, elapsed_seconds):
+    """모든 기록을 정렬한 뒤 10번째와 비교"""
+    ranked = sorted(records, key=highscores._sort_key)
+    if len(ranked) < 10:
+        return True
+    return highscores.HighScoreStore._beats(ranked[9], score, elapsed_seconds)
+
+
+def measure_query(count, rng):
+    """(정렬 μs, sqlite μs) - is_top10_score() 1회"""
+    records = make_records(count, rng)
+    queries = [(rng.randint(0, 100000), rng.uniform(10, 600)) for _ in range(QUERY_REPEAT)]
+    repeat = max(1, QUERY_REPEAT * 1000 // count)  # 기록이 많으면 정렬 쪽 반복을 줄임
+
+    start = time.perf_counter()
+    for score, elapsed in queries[:repeat]:
+        sorted_top10(records, score, elapsed)
+    sort_us = (time.perf_counter() - start) / min(repeat, QUERY_REPEAT) * 1e6
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = highscores.SQLiteHighScoreStore(os.path.join(directory, "highscores.db"))
+        conn = store._connect()
+        with conn:
+            conn.executemany("INSERT INTO scores (name, score, time, created) VALUES (?, ?, ?, 0)",
+                             [(r["name"], r["score"], r["time"]) for r in records])
+        start = time.perf_counter()
+        for score, elapsed in queries:
+            store.is_top10_score(score, elapsed)
+        sqlite_us = (time.perf_counter() - start) / QUERY_REPEAT * 1e6
+        store.close()
+    return sort_us, sqlite_us
+
+
+def main():
+    gamelog.configure(levels={"default": "ERROR"}, console_level="ERROR", ring_size=0)
+    total = WORKERS * RECORDS_PER_WORKER
+    print(f"동시 저장 ({WORKERS}개 프로세스 x {RECORDS_PER_WORKER}개 기록 = {total}개)")
+    print(f"{'방식':<8} | {'남은 기록':>9} | {'잃은 기록':>9} | {'시간(초)':>8}")
+    print("-" * 46)
+    for mode in ("naive", "json", "sqlite"):
+        kept, elapsed = run_concurrent(mode)
+        print(f"{mode:<8} | {kept:>9} | {total - kept:>9} | {elapsed:>8.2f}")
+
+    rng = random.Random(SEED)
+    print("\nTOP 10 판정 1회 (μs)")
+    print(f"{'기록 수':>8} | {'정렬':>12} | {'sqlite':>10} | {'배수':>8}")
+    print("-" * 48)
+    for count in RECORD_COUNTS:
+        sort_us, sqlite_us = measure_query(count, rng)
+        print(f"{count:>8} | {sort_us:>12.1f} | {sqlite_us:>10.1f} | {sort_us / sqlite_us:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+# benchmarks/bench_mask_collision.py
+#
+# 플레이어 충돌 판정 벤치마크: 사각형(config.COLLISION_MODE = "rect") vs 픽셀 마스크("mask")
+#
+# 실행 방법:
+#     python benchmarks/bench_mask_collision.py
+#
+# 1. 정확도: 플레이어 사각형과 겹치는 위치에 고양이(색상별)/마우스/돌을 무작위로 놓고,
+#    실제 픽셀(마스크)이 겹치는지를 정답으로 삼아 사각형 판정이 얼마나 틀리는지 셉니다.
+#    - rect:  전체 사각형 (puppy가 있을 때) - 겹친 위치만 뽑았으므로 틀리면 모두 오탐(false positive)
+#    - touch: PUPPY_LESS_COLLISION_MARGIN만큼 줄인 사각형 (puppy가 없을 때) - 오탐과 미탐(false negative)
+# 2. 판정 1회 비용: colliderect만 vs colliderect + Mask.overlap (사각형이 겹친 경우)
+# 3. 게임 전체: 같은 입력으로 GameSession을 진행하면서 틱 처리량과
+#    플레이어 충돌 단계(collision.player.*)의 틱당 시간을 두 방식으로 비교합니다.
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+import asset_cache
+import config
+import entity_store
+import gamelog
+from archetypes import get_cat_archetype
+from profiler import FrameProfiler
+from session import GameSession, PlayerInput
+
+SAMPLES = 20000      # 종류마다 뽑을 위치 수
+COST_REPEAT = 20000  # 비용 측정 반복 횟수
+TICKS = 600
+SEED = 1
+SWARM_SIZE = 1000
+
+
+def scripted_input(tick):
+    """좌우로 왕복하면서 점프하고 표창을 던지는 입력 (bench_simulation.py와 같음)"""
+    return PlayerInput(right=(tick // 120) % 2 == 0, left=(tick // 120) % 2 == 1,
+                       jump=tick % 45 == 0, throw=1 if tick % 6 == 0 else 0)
+
+
+def load_targets():
+    """(이름, 이미지) 목록 - 게임과 같은 크기/방향의 캐시 이미지"""
+    targets = [(f"cat_{color}", get_cat_archetype(color).image) for color in entity_store.CAT_COLORS]
+    targets.append(("mouse", asset_cache.get_image("assets/mouse.png", (config.MOUSE_WIDTH, config.MOUSE_HEIGHT),
+                                                   flip=True)))
+    stone_size = (config.STONE_RADIUS * 2, config.STONE_RADIUS * 2)
+    targets.append(("stone", asset_cache.get_image("assets/stone.png", stone_size)))
+    return targets
+
+
+# ===== 1. 정확도 =====
+
+def measure_accuracy(player_rect, player_mask, image, rng):
+    """
+    사각형이 겹치는 위치 SAMPLES개에서 사각형 판정과 마스크 판정을 비교합니다.
+
+    Returns:
+        dict: 픽셀 충돌 비율, rect 오탐 비율, touch 오탐/미탐 비율 (%)
+    """
+    mask = asset_cache.get_mask(image)
+    margin = config.PUPPY_LESS_COLLISION_MARGIN
+    touch_rect = player_rect.inflate(-margin * 2, -margin * 2)  # sprites.get_touch_rect()와 같은 사각형
+    width, height = image.get_size()
+    rect = pygame.Rect(0, 0, width, height)
+    truth_hits = rect_fp = touch_fp = touch_fn = 0
+    for _ in range(SAMPLES):
+        # player_rect와 1픽셀 이상 겹치는 왼쪽 위 위치를 고르게 뽑음
+        rect.x = rng.randint(player_rect.left - width + 1, player_rect.right - 1)
+        rect.y = rng.randint(player_rect.top - height + 1, player_rect.bottom - 1)
+        truth = player_mask.overlap(mask, (rect.x - player_rect.x, rect.y - player_rect.y)) is not None
+        touch = touch_rect.colliderect(rect)
+        truth_hits += truth
+        rect_fp += not truth
+        touch_fp += touch and not truth
+        touch_fn += truth and not touch
+    scale = 100.0 / SAMPLES
+    return {"pixel": truth_hits * scale, "rect_fp": rect_fp * scale,
+            "touch_fp": touch_fp * scale, "touch_fn": touch_fn * scale}
+
+
+# ===== 2. 판정 1회 비용 =====
+
+def measure_cost(player_rect, player_mask, image, rng):
+    """사각형이 겹치는 위치에서 판정 1회에 걸리는 시간 (μs) - (rect만, rect + mask)"""
+    width, height = image.get_size()
+    rects = [pygame.Rect(rng.randint(player_rect.left - width + 1, player_rect.right - 1),
+                         rng.randint(player_rect.top - height + 1, player_rect.bottom - 1), width, height)
+             for _ in range(COST_REPEAT)]
+
+    start = time.perf_counter()
+    for rect in rects:
+        player_rect.colliderect(rect)
+    rect_us = (time.perf_counter() - start) / COST_REPEAT * 1e6
+
+    start = time.perf_counter()
+    for rect in rects:
+        if player_rect.colliderect(rect):
+            player_mask.overlap(asset_cache.get_mask(image), (rect.x - player_rect.x, rect.y - player_rect.y))
+    mask_us = (time.perf_counter() - start) / COST_REPEAT * 1e6
+    return rect_us, mask_us
+
+
+# ===== 3. 게임 전체 =====
+
+def run_game(mode, backend, swarm):
+    """
+    COLLISION_MODE를 mode로 바꿔 TICKS틱 진행합니다.
+
+    Returns:
+        tuple: (틱/초, 플레이어 충돌 단계 ms/틱)
+    """
+    config.COLLISION_MODE = mode
+    session = GameSession(backend, seed=SEED)
+    if swarm:
+        session.spawn_swarm(SWARM_SIZE)
+    profiler = FrameProfiler(history=1, trace_frames=1)
+    session.profiler = profiler
+    start = time.perf_counter()
+    for tick in range(TICKS):
+        session.player.defense_count = 10 ** 9  # 부딪혀도 게임 오버되지 않음 (같은 양의 일을 계속 하도록)
+        profiler.begin_frame()
+        session.tick(scripted_input(tick))
+        profiler.end_frame()
+    elapsed = time.perf_counter() - start
+    player_s = sum(seconds for name, seconds in profiler.totals.items() if name.startswith("collision.player"))
+    return TICKS / elapsed, player_s / TICKS * 1000.0
+
+
+def main():
+    pygame.display.init()
+    pygame.display.set_mode((config.WIDTH, config.HEIGHT))
+    gamelog.configure(levels={"default": "WARNING"}, console_level="WARNING", ring_size=0)
+    rng = random.Random(SEED)
+
+    player_image = GameSession("sprites", seed=SEED).player.image
+    player_rect = player_image.get_rect(topleft=(300, 400))
+    player_mask = asset_cache.get_mask(player_image)
+    targets = load_targets()
+
+    print(f"정확도 (플레이어 사각형과 겹치는 위치 {SAMPLES}개, 마스크 판정이 정답, touch 여백 "
+          f"{config.PUPPY_LESS_COLLISION_MARGIN}px)")
+    print(f"{'대상':<12} | {'픽셀 충돌':>9} | {'rect 오탐':>9} | {'touch 오탐':>10} | {'touch 미탐':>10}")
+    print("-" * 64)
+    for name, image in targets:
+        result = measure_accuracy(player_rect, player_mask, image, rng)
+        print(f"{name:<12} | {result['pixel']:>8.1f}% | {result['rect_fp']:>8.1f}% | "
+              f"{result['touch_fp']:>9.1f}% | {result['touch_fn']:>9.1f}%")
+
+    print("\n판정 1회 비용 (μs, 사각형이 겹치는 위치에서)")
+    print(f"{'대상':<12} | {'rect':>8} | {'rect+mask':>10} | {'배수':>6}")
+    print("-" * 46)
+    for name, image in targets:
+        rect_us, mask_us = measure_cost(player_rect, player_mask, image, rng)
+        print(f"{name:<12} | {rect_us:>8.3f} | {mask_us:>10.3f} | {mask_us / rect_us:>5.1f}x")
+
+    print(f"\n게임 전체 ({TICKS}틱, puppy 방어 유지)")
+    print(f"{'시나리오':<18} | {'rect 틱/초':>10} | {'mask 틱/초':>10} | "
+          f"{'rect 충돌 ms':>12} | {'mask 충돌 ms':>12}")
+    print("-" * 76)
+    scenarios = [("stage1", "sprites", False), ("swarm_1000", "sprites", True)]
+    if entity_store.available():
+        scenarios += [("stage1_numpy", "numpy", False), ("swarm_1000_numpy", "numpy", True)]
+    for name, backend, swarm in scenarios:
+        rect_tps, rect_ms = run_game("rect", backend, swarm)
+        mask_tps, mask_ms = run_game("mask", backend, swarm)
+        print(f"{name:<18} | {rect_tps:>10.0f} | {mask_tps:>10.0f} | {rect_ms:>12.4f} | {mask_ms:>12.4f}")
+    print("(충돌 ms: 틱당 플레이어 충돌 단계 collision.player.* 시간)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# benchmarks/bench_render.py
+#
+# 화면 그리기 벤치마크
+# - 배경: 매 프레임 직접 그리기 vs 미리 그린 배경(BackgroundCache) blit
+# - 게임 화면: 전체 갱신(full) vs 바뀐 영역만 갱신(dirty) FrameRenderer
+# - HUD 글자: 매 프레임 font.render() vs TextCache
+#
+# 실행 방법:
+#     python benchmarks/bench_render.py
+#
+# 창을 띄우지 않도록 SDL 더미 비디오 드라이버를 사용하고,
+# 800x600 화면에 FRAMES번 그려 프레임당 평균 시간과 갱신 픽셀 수를 비교합니다.
+# 더미 드라이버는 실제로 화면에 보내지 않으므로, 실제 창에서는 dirty 모드의 이득이 더 큽니다.
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+import config
+from render import BackgroundCache, FrameRenderer, TextCache, draw_scenery
+from session import GameSession, PlayerInput
+
+FRAMES = 500
+
+
+def bench_background(screen):
+    """배경 그리기 방식별 프레임당 평균 시간(ms)을 반환합니다."""
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        draw_scenery(screen)
+    direct_ms = (time.perf_counter() - start) / FRAMES * 1000.0
+
+    background = BackgroundCache()
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        background.draw(screen)
+    cached_ms = (time.perf_counter() - start) / FRAMES * 1000.0
+    return direct_ms, cached_ms, background.builds
+
+
+def hud_lines(frame):
+    """게임 HUD와 같은 문자열 (점수는 30프레임마다, 시간은 60프레임마다 바뀜)"""
+    score = frame // 30 * 100
+    seconds = frame // 60
+    return ("스테이지 3", f"점수: {score} | 시간: {seconds}초", "보스 고양이 출현!", "보스 체력: 180/200")
+
+
+def bench_text(font):
+    """HUD 글자 렌더링 방식별 프레임당 평균 시간(ms)과 캐시 통계를 반환합니다."""
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        for line in hud_lines(frame):
+            font.render(line, True, config.WHITE)
+    direct_ms = (time.perf_counter() - start) / FRAMES * 1000.0
+
+    cache = TextCache()
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        for line in hud_lines(frame):
+            cache.render(font, line, config.WHITE)
+    cached_ms = (time.perf_counter() - start) / FRAMES * 1000.0
+    return direct_ms, cached_ms, cache.stats()
+
+
+def bench_frames(screen, mode, seed=1):
+    """
+    헤드리스 세션을 진행하면서 스프라이트를 그리고, 렌더링 모드별 결과를 반환합니다.
+
+    Returns:
+        tuple: (프레임당 평균 시간(ms), 프레임당 평균 갱신 픽셀 수)
+    """
+    session = GameSession(seed=seed)
+    renderer = FrameRenderer(screen, BackgroundCache(), mode)
+    elapsed = 0.0
+    for frame in range(FRAMES):
+        # 좌우로 왕복하면서 점프하고 표창을 던지는 입력
+        inputs = PlayerInput(right=(frame // 60) % 2 == 0, left=(frame // 60) % 2 == 1,
+                             jump=frame % 50 == 0, throw=1 if frame % 10 == 0 else 0)
+        session.step(inputs, config.TICK_MS)
+        if session.state != "playing":
+            session.reset()
+        start = time.perf_counter()
+        renderer.begin()
+        for sprite in session.all_sprites:
+            renderer.blit(sprite.image, sprite.rect)
+        renderer.present()
+        elapsed += time.perf_counter() - start
+    return elapsed / FRAMES * 1000.0, renderer.stats()["average_pixels"]
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((config.WIDTH, config.HEIGHT))
+
+    direct_ms, cached_ms, builds = bench_background(screen)
+    speedup = direct_ms / cached_ms if cached_ms > 0 else float("inf")
+    print(f"{'항목':>10} | {'직접 그리기(ms)':>15} | {'캐시(ms)':>9} | {'배속':>6} | 캐시 생성 횟수")
+    print("-" * 70)
+    print(f"{'배경':>10} | {direct_ms:>15.3f} | {cached_ms:>9.3f} | {speedup:>5.1f}x | {builds}")
+    direct_ms, cached_ms, text_stats = bench_text(pygame.font.Font(None, 24))
+    speedup = direct_ms / cached_ms if cached_ms > 0 else float("inf")
+    print(f"{'HUD 글자':>10} | {direct_ms:>15.3f} | {cached_ms:>9.3f} | {speedup:>5.1f}x | {text_stats['misses']}")
+    print()
+
+    print(f"{'모드':>10} | {'ms/프레임':>10} | {'프레임당 갱신 픽셀':>18}")
+    print("-" * 48)
+    for mode in FrameRenderer.MODES:
+        frame_ms, pixels = bench_frames(screen, mode)
+        print(f"{mode:>10} | {frame_ms:>10.3f} | {pixels:>18}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+# benchmarks/bench_simulation.py
+#
+# 게임 루프 처리량 벤치마크 (시나리오별)
+# - idle_menu:       게임을 진행하지 않고 메뉴 화면만 그리는 대기 상태
+# - stage1:          스테이지 1 일반 진행 (좌우 이동, 점프, 표창 발사)
+# - stage10_boss:    스테이지 10 보스전, 보스가 매 틱 돌을 던짐 (돌은 투사체 풀 최대치까지)
+# - swarm_1000:      EnemyCat 스프라이트 1,000마리 고양이 떼
+# - swarm_1000_numpy: 같은 고양이 떼를 NumPy 배열 방식으로 (numpy가 있을 때만)
+# - bullet_hell:     스테이지 10 보스가 "bullet_hell" 공격 패턴(boss_patterns.py)으로 돌 500개 이상을 계속 날림
+# - bullet_hell_numpy: 같은 탄막을 NumPy 배열 방식으로 (numpy가 있을 때만)
+#
+# 실행 방법:
+#     python benchmarks/bench_simulation.py                       # 결과를 bench_simulation.json에 저장
+#     python benchmarks/bench_simulation.py --output after.json --compare before.json
+#
+# 창과 소리 없이(SDL dummy 드라이버) 틱마다 GameSession을 진행하고, main.py처럼 화면에 그립니다.
+# 측정 항목:
+#   - ticks_per_second: 1초에 처리한 틱(프레임) 수 (갱신 + 충돌 + 그리기)
+#   - phase_ms: 틱당 평균 단계별 시간 (update: 이동/스폰, collision: 충돌 처리, render: 그리기)
+#     phase_ms_detail: profiler.FrameProfiler가 잰 세부 단계별 시간 (collision.shuriken 등)
+#   - allocations: 순 메모리 블록 증가 수, GC 실행 횟수, 투사체 새로 만든 횟수/재사용 횟수
+#   - peak_memory_kb: tracemalloc으로 잰 최대 메모리 (시간 측정과 따로 한 번 더 실행)
+#   - stones: 측정하는 동안 동시에 날아다닌 돌 수 (평균/최대)
+# 커밋마다 JSON으로 저장해 두고 --compare로 이전 결과와 비교하면 성능 회귀를 찾을 수 있습니다.
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+import config
+import entity_store
+import gamelog
+from profiler import FrameProfiler
+from render import BackgroundCache, FrameRenderer, TextCache
+from session import GameSession, PlayerInput
+
+TICKS = 600
+SEED = 1
+SWARM_SIZE = 1000
+BULLET_HELL_WARMUP = 300  # 측정 전에 탄막이 화면을 채울 때까지 진행할 틱 수
+
+# 시나리오별로 측정하는 동안만 바꿀 config 값
+SCENARIO_CONFIG = {
+    # 보스가 매 틱 돌을 던짐 (돌은 투사체 풀 최대치까지)
+    "stage10_boss": {"BOSS_ATTACK_INTERVAL": config.TICK_MS},
+    # 보스는 제자리에서 탄막 패턴만 (돌을 모두 풀에서 재사용하도록 풀 크기도 늘림)
+    "bullet_hell": {"BOSS_PATTERN": "bullet_hell", "PROJECTILE_POOL_CAP": 1024,
+                    "BOSS_MOVE_INTERVAL_MIN": 10 ** 9, "BOSS_MOVE_INTERVAL_MAX": 10 ** 9},
+}
+SCENARIO_CONFIG["bullet_hell_numpy"] = SCENARIO_CONFIG["bullet_hell"]
+
+
+def scripted_input(tick):
+    """좌우로 왕복하면서 점프하고 표창을 던지는 입력 (모든 시나리오 공통)"""
+    return PlayerInput(right=(tick // 120) % 2 == 0, left=(tick // 120) % 2 == 1,
+                       jump=tick % 45 == 0, throw=1 if tick % 6 == 0 else 0)
+
+
+# ===== 시나리오 준비 =====
+# 각 함수는 진행할 GameSession을 반환합니다 (idle_menu는 None).
+
+def setup_idle_menu():
+    return None
+
+
+def setup_stage1():
+    return GameSession("sprites", seed=SEED)
+
+
+def setup_stage10_boss(backend="sprites"):
+    session = GameSession(backend, seed=SEED)
+    session.current_stage = 10
+    # 고양이를 모두 처치한 상태로 만들어 첫 틱에 보스가 나오게 함
+    session.cats_spawned = session.total_cats
+    session.scheduler.cancel_named("cat")
+    return session
+
+
+def setup_bullet_hell(backend):
+    session = setup_stage10_boss(backend)
+    session.player.defense_count = 10 ** 9
+    for _ in range(BULLET_HELL_WARMUP):
+        session.tick(PlayerInput())  # 제자리에서 탄막이 쌓이기를 기다림
+    return session
+
+
+def setup_swarm(backend):
+    session = GameSession(backend, seed=SEED)
+    session.spawn_swarm(SWARM_SIZE)
+    return session
+
+
+SCENARIOS = [
+    ("idle_menu", setup_idle_menu),
+    ("stage1", setup_stage1),
+    ("stage10_boss", setup_stage10_boss),
+    ("swarm_1000", lambda: setup_swarm("sprites")),
+    ("bullet_hell", lambda: setup_bullet_hell("sprites")),
+]
+if entity_store.available():
+    SCENARIOS.append(("swarm_1000_numpy", lambda: setup_swarm("numpy")))
+    SCENARIOS.append(("bullet_hell_numpy", lambda: setup_bullet_hell("numpy")))
+
+
+def stone_count(session):
+    """날아다니는 돌 수 (스프라이트 + 배열)"""
+    count = len(session.stones)
+    if session.entities is not None:
+        count += session.entities.stones.count
+    return count
+
+
+# ===== 그리기 (main.py의 게임 화면과 같은 순서) =====
+
+class Screen:
+    """벤치마크용 화면 (배경 캐시 + 전체 갱신 렌더러 + 글자 캐시)"""
+
+    def __init__(self, surface):
+        self.renderer = FrameRenderer(surface, BackgroundCache(), "full")
+        self.text_cache = TextCache()
+        self.font = pygame.font.Font(None, 24)
+        self.font_title = pygame.font.Font(None, 48)
+
+    def draw_text(self, text, x, y, font=None):
+        self.renderer.blit(self.text_cache.render(font or self.font, text, config.WHITE), (x, y))
+
+    def draw_menu(self):
+        self.renderer.begin()
+        self.draw_text("Cat Ninja", config.WIDTH // 2 - 100, 150, self.font_title)
+        self.draw_text("SPACE: start", config.WIDTH // 2 - 60, 300)
+        for rank in range(10):
+            self.draw_text(f"{rank + 1}. PLAYER  {1000 - rank * 50}", config.WIDTH // 2 - 80, 340 + rank * 22)
+        self.renderer.present()
+
+    def draw_game(self, session):
+        renderer = self.renderer
+        renderer.begin()
+        alpha = session.alpha
+        if session.entities is not None:
+            for image, pos in session.entities.draw_items(alpha):
+                renderer.blit(image, pos)
+        for sprite in session.all_sprites:
+            prev = getattr(sprite, "prev_pos", None)
+            if prev is None:
+                renderer.blit(sprite.image, sprite.rect)
+            else:
+                x = prev[0] + (sprite.rect.x - prev[0]) * alpha
+                y = prev[1] + (sprite.rect.y - prev[1]) * alpha
+                renderer.blit(sprite.image, (round(x), round(y)))
+        self.draw_text(f"Stage {session.current_stage}", 10, 10)
+        self.draw_text(f"Score {session.score}  Time {session.elapsed_ms // 1000}", config.WIDTH // 2 - 80, 10)
+        renderer.present()
+
+
+# ===== 측정 =====
+
+def run_scenario(setup, screen, ticks):
+    """
+    시나리오를 ticks틱 진행합니다.
+
+    Returns:
+        tuple: (세션 (idle_menu는 None), 단계별 누적 시간을 가진 FrameProfiler, 틱마다 센 돌 수 목록)
+    """
+    session = setup()
+    stones = []
+    profiler = FrameProfiler(history=1, trace_frames=1)
+    if session is not None:
+        session.player.defense_count = 10 ** 9  # 부딪혀도 게임 오버되지 않음 (같은 양의 일을 계속 하도록)
+        session.tick(scripted_input(0))  # 첫 틱 (보스전은 여기서 보스가 나옴)
+        start_state = session.save()
+        session.profiler = profiler
+    for tick in range(ticks):
+        profiler.begin_frame()
+        if session is not None:
+            session.tick(scripted_input(tick))
+            if session.state != "playing":
+                # puppy 방어로 보스와 부딪히면 보스가 처치되므로, 시나리오 시작 상태로 되돌려 계속 진행
+                session.restore(start_state)
+            profiler.skip()
+            stones.append(stone_count(session))
+            screen.draw_game(session)
+        else:
+            screen.draw_menu()
+        profiler.lap("render")
+        profiler.end_frame()
+    return session, profiler, stones
+
+
+def group_phases(totals):
+    """세부 단계 누적 시간 -> update(update, spawn) / collision(collision.*) / render"""
+    grouped = {"update": 0.0, "collision": 0.0, "render": 0.0}
+    for name, seconds in totals.items():
+        group = name.split(".")[0]
+        grouped["update" if group == "spawn" else group] += seconds
+    return grouped
+
+
+def measure(name, setup, screen, ticks):
+    """시나리오 하나를 측정해서 결과 dict를 반환합니다."""
+    overrides = SCENARIO_CONFIG.get(name, {})
+    original = {key: getattr(config, key) for key in overrides}
+    for key, value in overrides.items():
+        setattr(config, key, value)
+    try:
+        # 0) 준비 실행: 이미지 로드, 고양이 원형 표 만들기처럼 처음 한 번만 드는 비용을 미리 치름
+        run_scenario(setup, screen, ticks)
+
+        # 1) 시간과 할당 횟수 측정
+        gc.collect()
+        gc_before = [stat["collections"] for stat in gc.get_stats()]
+        blocks_before = sys.getallocatedblocks()
+        start = time.perf_counter()
+        session, profiler, stones = run_scenario(setup, screen, ticks)
+        elapsed = time.perf_counter() - start
+        blocks_after = sys.getallocatedblocks()
+        gc_after = [stat["collections"] for stat in gc.get_stats()]
+
+        # 2) 최대 메모리 측정 (tracemalloc은 느려지므로 따로 한 번 더 실행)
+        tracemalloc.start()
+        run_scenario(setup, screen, ticks)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        for key, value in original.items():
+            setattr(config, key, value)
+
+    projectile_allocations = projectile_reuses = 0
+    if session is not None:
+        for stats in session.pool_stats().values():
+            projectile_allocations += stats["allocations"]
+            projectile_reuses += stats["allocations_avoided"]
+
+    return {
+        "ticks": ticks,
+        "ticks_per_second": round(ticks / elapsed, 1),
+        "phase_ms": {phase: round(seconds / ticks * 1000.0, 4)
+                     for phase, seconds in group_phases(profiler.totals).items()},
+        "phase_ms_detail": {phase: round(seconds / ticks * 1000.0, 4) for phase, seconds in profiler.totals.items()},
+        "allocations": {
+            "net_blocks": blocks_after - blocks_before,
+            "gc_collections": [after - before for before, after in zip(gc_before, gc_after)],
+            "projectile_allocations": projectile_allocations,
+            "projectile_reuses": projectile_reuses,
+        },
+        "peak_memory_kb": round(peak / 1024.0, 1),
+        "stones": {"mean": round(sum(stones) / len(stones), 1) if stones else 0, "max": max(stones, default=0)},
+        "final": None if session is None else {
+            "state": session.state,
+            "stage": session.current_stage,
+            "score": session.score,
+            "enemies": session.enemy_count,
+            "stones": stone_count(session),
+        },
+    }
+
+
+def git_commit():
+    """현재 git 커밋 (git이 없으면 None)"""
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_table(results, baseline=None):
+    """결과 표 출력 (baseline이 있으면 ticks/s 변화율도 표시)"""
+    header = (f"{'시나리오':<18} | {'ticks/s':>9} | {'update':>8} | {'collision':>9} | {'render':>8} | "
+              f"{'peak KB':>9} | {'돌(평균)':>8}")
+    if baseline:
+        header += f" | {'이전 대비':>9}"
+    print(header)
+    print("-" * len(header.encode("utf-8")))
+    for name, result in results.items():
+        phase = result["phase_ms"]
+        line = (f"{name:<18} | {result['ticks_per_second']:>9.1f} | {phase['update']:>8.3f} | "
+                f"{phase['collision']:>9.3f} | {phase['render']:>8.3f} | {result['peak_memory_kb']:>9.1f} | "
+                f"{result['stones']['mean']:>8.0f}")
+        if baseline:
+            before = baseline.get(name)
+            if before:
+                change = (result["ticks_per_second"] / before["ticks_per_second"] - 1.0) * 100.0
+                line += f" | {change:>+8.1f}%"
+            else:
+                line += f" | {'-':>9}"
+        print(line)
+    print("(update/collision/render는 틱당 평균 ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게임 루프 처리량 벤치마크")
+    parser.add_argument("--ticks", type=int, default=TICKS, help="시나리오마다 진행할 틱 수")
+    parser.add_argument("--output", default="bench_simulation.json", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--only", nargs="*", help="실행할 시나리오 이름 (기본값: 전부)")
+    args = parser.parse_args()
+
+    pygame.init()
+    surface = pygame.display.set_mode((config.WIDTH, config.HEIGHT))
+    gamelog.configure(console_level="WARNING")  # 스폰 로그가 측정을 방해하지 않도록
+    screen = Screen(surface)
+
+    results = {}
+    for name, setup in SCENARIOS:
+        if args.only and name not in args.only:
+            continue
+        results[name] = measure(name, setup, screen, args.ticks)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["scenarios"]
+    print_table(results, baseline)
+
+    report = {
+        "commit": git_commit(),
+        "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "numpy": entity_store.np.__version__ if entity_store.available() else None,
+        "tick_rate": config.TICK_RATE,
+        "scenarios": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {args.output}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
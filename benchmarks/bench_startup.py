@@ -0,0 +1,167 @@
+# benchmarks/bench_startup.py
+#
+# 시작 시간 벤치마크: 프로세스 시작 → 첫 메뉴 화면까지 걸린 시간
+# - cold: 폰트 캐시(config.FONT_CACHE_FILE)가 없는 첫 실행 (시스템 폰트 목록을 훑음)
+# - warm: 폰트 캐시가 있는 실행 (보통 실행)
+#
+# 실행 방법:
+#     python benchmarks/bench_startup.py                        # 결과를 bench_startup.json에 저장
+#     python benchmarks/bench_startup.py --runs 20 --compare before.json
+#
+# main.py를 매번 새 파이썬 프로세스로 실행하고, 처음으로 화면을 보내는 순간
+# (pygame.display.flip/update 첫 호출 = 첫 메뉴 프레임) 시간을 알려 준 뒤 바로 종료시킵니다.
+# 측정 항목:
+#   - total_ms: 부모 프로세스가 잰 프로세스 시작 → 첫 메뉴 프레임 (파이썬 인터프리터 시작 포함)
+#   - main_ms:  자식 프로세스 안에서 잰 main.py 실행 시작 → 첫 메뉴 프레임
+# 배경음악은 첫 프레임 뒤에 백그라운드 스레드에서 로드하므로 이 시간에 들어가지 않습니다.
+# 실행마다 편차가 크므로 중앙값과 최솟값을 함께 봅니다.
+# 실제 폰트 캐시 파일은 건드리지 않도록 임시 폴더의 캐시 파일을 씁니다.
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+RUNS = 10
+
+# 자식 프로세스에서 실행할 코드 (argv: 저장소 경로, 폰트 캐시 파일)
+CHILD = r"""
+import os, sys, time
+start = time.perf_counter()
+root, font_cache = sys.argv[1], sys.argv[2]
+sys.path.insert(0, root)
+os.chdir(root)
+import runpy
+import pygame
+import config
+config.FONT_CACHE_FILE = font_cache
+config.REPLAY_RECORD = False
+
+def first_frame(*args):
+    sys.stdout.write("FIRST_FRAME %.3f\n" % ((time.perf_counter() - start) * 1000.0))
+    sys.stdout.flush()
+    os._exit(0)
+
+pygame.display.flip = first_frame
+pygame.display.update = first_frame
+runpy.run_path("main.py", run_name="__main__")
+sys.exit("main.py가 화면을 그리지 않고 끝났습니다")
+"""
+
+
+def run_once(font_cache):
+    """
+    main.py를 한 번 실행해서 첫 메뉴 프레임까지의 시간을 잽니다.
+
+    Returns:
+        tuple: (total_ms, main_ms)
+    """
+    env = dict(os.environ)
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, "-c", CHILD, ROOT, font_cache], env=env,
+                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    main_ms = None
+    for line in proc.stdout:
+        if line.startswith("FIRST_FRAME "):
+            total_ms = (time.perf_counter() - start) * 1000.0
+            main_ms = float(line.split()[1])
+            break
+    proc.wait()
+    if main_ms is None:
+        raise RuntimeError(f"main.py가 첫 프레임 전에 종료되었습니다 (종료 코드 {proc.returncode})")
+    return total_ms, main_ms
+
+
+def measure(mode, font_cache, runs):
+    """cold/warm 모드로 runs번 실행한 결과 (ms 중앙값/최솟값)"""
+    totals = []
+    mains = []
+    for _ in range(runs):
+        if mode == "cold" and os.path.exists(font_cache):
+            os.remove(font_cache)
+        total_ms, main_ms = run_once(font_cache)
+        totals.append(total_ms)
+        mains.append(main_ms)
+    return {
+        "runs": runs,
+        "total_ms_median": round(statistics.median(totals), 2),
+        "total_ms_min": round(min(totals), 2),
+        "main_ms_median": round(statistics.median(mains), 2),
+        "main_ms_min": round(min(mains), 2),
+    }
+
+
+def git_commit():
+    """현재 git 커밋 (git이 없으면 None)"""
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_table(results, baseline=None):
+    """결과 표 출력 (baseline이 있으면 total 중앙값 변화율도 표시)"""
+    header = f"{'모드':<6} | {'total 중앙값':>12} | {'total 최소':>10} | {'main 중앙값':>11} | {'main 최소':>9}"
+    if baseline:
+        header += f" | {'변화':>8}"
+    print(header)
+    print("-" * len(header.encode("utf-8")))
+    for mode, result in results.items():
+        line = (f"{mode:<6} | {result['total_ms_median']:>12.1f} | {result['total_ms_min']:>10.1f} | "
+                f"{result['main_ms_median']:>11.1f} | {result['main_ms_min']:>9.1f}")
+        if baseline:
+            before = baseline.get(mode)
+            if before:
+                change = (result["total_ms_median"] / before["total_ms_median"] - 1.0) * 100.0
+                line += f" | {change:>+7.1f}%"
+            else:
+                line += f" | {'-':>8}"
+        print(line)
+    print("(ms, total: 프로세스 시작부터, main: main.py 실행 시작부터 첫 메뉴 프레임까지)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시작 시간 벤치마크 (프로세스 시작 → 첫 메뉴 프레임)")
+    parser.add_argument("--runs", type=int, default=RUNS, help="모드마다 실행할 횟수")
+    parser.add_argument("--output", default="bench_startup.json", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        font_cache = os.path.join(directory, "font_cache.json")
+        run_once(font_cache)  # 파일 시스템 캐시와 __pycache__를 데워 둠
+        for mode in ("cold", "warm"):
+            results[mode] = measure(mode, font_cache, args.runs)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["modes"]
+    print_table(results, baseline)
+
+    report = {
+        "commit": git_commit(),
+        "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "modes": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
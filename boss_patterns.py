@@ -0,0 +1,190 @@
+# boss_patterns.py
+
+import math
+import zlib
+from collections import namedtuple
+
+import config
+
+# ============================================================================
+# 🌀 보스 공격 패턴 (탄막)
+# ============================================================================
+# 기본 보스는 BOSS_ATTACK_INTERVAL마다 돌 하나를 왼쪽으로 수평으로 던집니다.
+# config.BOSS_PATTERN에 패턴 이름을 넣으면 보스가 config.BOSS_PATTERNS의 그 패턴대로
+# 부채꼴, 나선, 조준 연사, 포물선 돌을 한 번에 여러 개씩 던집니다.
+#
+# 패턴은 코드가 아니라 데이터(발사 목록)입니다.
+#   [{"kind": "ring", "count": 10, "turn": 7, "speed": 4, "interval": 50, "repeat": 40}, ...]
+# 목록의 발사를 순서대로 repeat번씩 실행하고, 끝나면 처음부터 다시 반복합니다.
+# 각도는 도 단위이고 180 = 왼쪽, 90 = 위, 0 = 오른쪽, 270 = 아래입니다.
+#
+# 랜덤을 쓰지 않으므로 같은 시드와 입력이면 탄막도 항상 같습니다 (리플레이, 스냅샷 대응).
+# 패턴 진행 상태(PatternRunner.state)는 스냅샷에 함께 저장됩니다.
+
+# 발사 한 번 (config.BOSS_PATTERNS의 dict 하나, 생략한 항목은 VOLLEY_DEFAULTS)
+# kind: "fan" / "ring" / "aimed", count: 돌 수, angle: 중심 방향, spread: 퍼짐 각도,
+# turn: 발사할 때마다 방향에 더할 각도, speed: 틱당 픽셀, gravity: 틱당 아래쪽 가속도,
+# interval: 다음 발사까지 시간 (밀리초), repeat: 같은 발사를 반복할 횟수
+Volley = namedtuple("Volley", ["kind", "count", "angle", "spread", "turn", "speed", "gravity", "interval", "repeat"])
+
+KINDS = ("fan", "ring", "aimed")
+
+VOLLEY_DEFAULTS = {
+    "count": 1,
+    "angle": 180,
+    "spread": 0,
+    "turn": 0,
+    "speed": 8,
+    "gravity": 0,
+    "interval": None,  # None이면 config.BOSS_ATTACK_INTERVAL
+    "repeat": 1,
+}
+
+
+def compile_pattern(steps):
+    """
+    패턴 데이터(dict 목록)를 Volley 튜플로 바꿉니다.
+
+    Args:
+        steps: config.BOSS_PATTERNS의 값 (발사 dict 목록)
+
+    Returns:
+        tuple: Volley들
+
+    Raises:
+        ValueError: 발사가 없거나, 알 수 없는 kind/항목, 0 이하의 interval/repeat
+    """
+    volleys = []
+    for step in steps:
+        unknown = set(step) - set(Volley._fields)
+        if unknown:
+            raise ValueError(f"알 수 없는 발사 항목: {', '.join(sorted(unknown))}")
+        if step.get("kind") not in KINDS:
+            raise ValueError(f"알 수 없는 발사 종류: {step.get('kind')}")
+        values = dict(VOLLEY_DEFAULTS, **step)
+        if values["interval"] is None:
+            values["interval"] = config.BOSS_ATTACK_INTERVAL
+        if values["interval"] <= 0 or values["repeat"] <= 0:
+            raise ValueError(f"interval과 repeat는 1 이상이어야 합니다: {step}")
+        volleys.append(Volley(**values))
+    if not volleys:
+        raise ValueError("발사가 하나도 없는 패턴입니다")
+    return tuple(volleys)
+
+
+def get_pattern(name):
+    """
+    config.BOSS_PATTERNS에서 이름으로 패턴을 찾아 Volley 튜플로 반환합니다.
+
+    Raises:
+        ValueError: 없는 패턴 이름이거나 패턴 데이터가 잘못됨
+    """
+    try:
+        steps = config.BOSS_PATTERNS[name]
+    except KeyError:
+        raise ValueError(f"알 수 없는 보스 패턴: {name}") from None
+    return compile_pattern(steps)
+
+
+def pattern_digest(name):
+    """
+    패턴 내용의 CRC32 (리플레이에 저장해서 같은 이름의 패턴 데이터가 바뀌었는지 확인)
+
+    Args:
+        name: config.BOSS_PATTERNS의 패턴 이름, None이면 기본 공격 (0)
+
+    Raises:
+        ValueError: get_pattern()과 같음
+    """
+    if not name:
+        return 0
+    return zlib.crc32(repr(get_pattern(name)).encode("utf-8"))
+
+
+def aim_angle(origin, target):
+    """origin에서 target으로 향하는 각도 (도, 화면 Y축은 아래가 +이므로 뒤집음)"""
+    return math.degrees(math.atan2(origin[1] - target[1], target[0] - origin[0]))
+
+
+def volley_velocities(volley, angle):
+    """
+    발사 한 번의 돌 속도 목록
+
+    Args:
+        volley: Volley
+        angle: 이번 발사의 중심 방향 (turn과 조준을 반영한 값, 도)
+
+    Returns:
+        list: 돌마다 (vx, vy) - 틱당 픽셀
+    """
+    count = volley.count
+    if count <= 0:
+        return []
+    if volley.kind == "ring":
+        step = 360.0 / count
+        start = angle
+    elif count == 1:
+        step = 0.0
+        start = angle
+    else:
+        # 퍼짐 각도의 양 끝을 포함해서 고르게 (spread가 0이면 같은 방향으로 겹쳐서 던짐)
+        step = volley.spread / (count - 1)
+        start = angle - volley.spread / 2.0
+    speed = volley.speed
+    velocities = []
+    for i in range(count):
+        radians = math.radians(start + step * i)
+        velocities.append((speed * math.cos(radians), -speed * math.sin(radians)))
+    return velocities
+
+
+class PatternRunner:
+    """
+    보스 한 마리의 패턴 진행 상태
+
+    주요 기능:
+    - fire(origin, target): 이번 발사의 돌 (vx, vy, gravity) 목록과 다음 발사까지 시간
+    - state: 스냅샷용 진행 상태 (index, fired, shots) - 대입하면 그 상태로 되돌림
+    """
+
+    def __init__(self, volleys):
+        """
+        Args:
+            volleys: compile_pattern() / get_pattern()이 돌려준 Volley 튜플
+        """
+        self.volleys = volleys
+        self.index = 0  # 지금 실행 중인 발사 번호
+        self.fired = 0  # 지금 발사를 몇 번 반복했는지
+        self.shots = 0  # 패턴 시작부터 발사한 횟수 (turn 누적용)
+
+    @property
+    def state(self):
+        return (self.index, self.fired, self.shots)
+
+    @state.setter
+    def state(self, value):
+        self.index, self.fired, self.shots = value
+
+    def fire(self, origin, target=None):
+        """
+        다음 발사를 실행합니다.
+
+        Args:
+            origin: 돌이 나가는 위치 (x, y)
+            target: 조준할 위치 (x, y), 없으면 "aimed"도 angle 방향으로 던짐
+
+        Returns:
+            tuple: ([(vx, vy, gravity), ...], 다음 발사까지 시간 (밀리초))
+        """
+        volley = self.volleys[self.index]
+        angle = volley.angle + volley.turn * self.shots
+        if volley.kind == "aimed" and target is not None:
+            angle = aim_angle(origin, target) + volley.turn * self.shots
+        launches = [(vx, vy, volley.gravity) for vx, vy in volley_velocities(volley, angle)]
+
+        self.shots += 1
+        self.fired += 1
+        if self.fired >= volley.repeat:
+            self.fired = 0
+            self.index = (self.index + 1) % len(self.volleys)
+        return launches, volley.interval
@@ -11,7 +11,60 @@ RED = (255, 0, 0)
 GREEN = (0, 255, 0)
 BLUE = (0, 0, 255)
 
-FPS = 60
+FPS = 60  # 화면 그리기(렌더링) 최대 프레임 수
+
+# 고정 틱 시뮬레이션 설정
+# 게임 로직은 렌더링 FPS와 상관없이 항상 TICK_RATE 간격으로 진행됩니다.
+# ⚠️ TICK_RATE는 밸런스 값이 아니라 고정값입니다 (바꾸지 마세요).
+#    이동 속도(SPEED, VELOCITY, GRAVITY) 값은 "틱당 픽셀" 단위로 60틱에 맞춰져 있고,
+#    스폰/공격 간격(..._INTERVAL)은 밀리초 단위입니다. 예를 들어 120으로 바꾸면 고양이, 돌, 점프,
+#    수리검이 모두 2배 빨라지는데 스폰 간격은 그대로라서 전혀 다른 게임이 됩니다.
+#    렌더링을 더 부드럽게 하려면 FPS를 올리세요 (틱 사이는 보간해서 그림).
+TICK_RATE = 60                # 초당 시뮬레이션 틱 수 (고정)
+TICK_MS = 1000 / TICK_RATE    # 틱 1회의 길이 (밀리초)
+MAX_FRAME_TIME = 250          # 한 프레임에 따라잡을 최대 시간 (밀리초, 멈춤 후 폭주 방지)
+
+# 렌더링 모드: "full" = 매 프레임 화면 전체 갱신, "dirty" = 바뀐 영역만 갱신
+# 게임 중 F2 키로 전환할 수 있습니다.
+RENDER_MODE = "full"
+
+# 글자 렌더링 캐시에 보관할 최대 문자열 수 (가장 오래 쓰지 않은 것부터 지움)
+TEXT_CACHE_SIZE = 256
+
+# 프레임 프로파일러 (profiler.py, 게임 중 F3으로 켜고 끄기, F4로 trace 저장)
+# True면 시작할 때부터 단계별 시간을 재고 그래프를 표시합니다.
+PROFILER_ENABLED = False
+PROFILER_HISTORY = 240         # 그래프에 보여 줄 최근 프레임 수
+PROFILER_TRACE_FRAMES = 3600   # trace로 내보낼 최근 프레임 수 (60 FPS 기준 1분)
+PROFILER_TRACE_DIR = "traces"  # Chrome trace JSON 저장 폴더
+
+# 화면 녹화 (recorder.py, 게임 중 F5로 시작/끝, numpy 필요)
+# "png": 프레임마다 PNG, "raw": RGB 24비트 프레임을 이어 붙인 파일, "pipe": 인코더(ffmpeg)로 바로 동영상 인코딩
+RECORDER_FORMAT = "png"
+RECORDER_DIR = "recordings"
+RECORDER_QUEUE_SIZE = 8    # 쓰기를 기다릴 수 있는 최대 프레임 수 (넘으면 기다리지 않고 프레임을 버림)
+RECORDER_ENCODER = None    # "pipe" 인코더 명령 목록 ({width} {height} {fps} {path} 치환, None이면 ffmpeg)
+
+# 투사체(수리검, 골드 수리검, 돌) 재사용 풀 설정 (pool.py)
+PROJECTILE_POOL_CAP = 256          # 종류별로 풀이 관리할 최대 투사체 수
+PROJECTILE_POOL_OVERFLOW = "grow"  # 최대치 도달 시: "grow"(풀 밖에서 생성), "drop"(발사 취소), "recycle"(가장 오래된 것 재사용)
+
+# 고양이/마우스/돌/수리검 저장 방식 (entity_store.py)
+# "sprites": 스프라이트 객체 (기본값), "numpy": NumPy 배열로 한 번에 계산 (numpy 필요, 고양이가 수천 마리일 때)
+ENTITY_BACKEND = "sprites"
+
+# 스트레스 스테이지: 0보다 크면 스테이지 시작마다 고양이를 이 수만큼 한꺼번에 스폰
+STRESS_SWARM_SIZE = 0
+STRESS_SWARM_SPACING = 4  # 고양이 떼의 고양이 사이 간격 (픽셀)
+
+# 충돌 판정 공간 해시 격자 크기 (픽셀, 가장 큰 스프라이트와 비슷한 크기가 적당)
+COLLISION_CELL_SIZE = 96
+
+# 플레이어와 적/마우스/돌의 충돌 판정 방식
+# "rect": 사각형 판정 (puppy가 없으면 PUPPY_LESS_COLLISION_MARGIN만큼 줄인 사각형)
+# "mask": 사각형이 겹친 경우에만 이미지의 실제 픽셀(마스크)이 겹치는지 한 번 더 검사 (여백 없이 정확)
+# 게임 결과가 달라지므로 리플레이는 기록할 때와 같은 방식으로 재생해야 합니다.
+COLLISION_MODE = "rect"
 
 GRAVITY = 0.6
 
@@ -19,11 +72,19 @@ PLAYER_WIDTH = 70
 PLAYER_HEIGHT = 80
 PLAYER_SPEED = 5
 PLAYER_JUMP_VELOCITY = -12
+PLAYER_START_X = 100          # 플레이어 시작 X 좌표 (왼쪽 하단 기준)
+PLAYER_START_Y = HEIGHT - 50  # 플레이어 시작 Y 좌표 (지면 높이)
+PLAYER_TOUCH_MARGIN = 10      # 플레이어 충돌 판정 여유 범위 (픽셀)
 
 SHURIKEN_SPEED = 15
 SHURIKEN_WIDTH = 30
 SHURIKEN_HEIGHT = 30
 
+# Gold Shuriken 설정
+GOLD_SHURIKEN_MAX_COUNT = 10         # 간식을 먹으면 충전되는 최대 갯수
+GOLD_SHURIKEN_SIZE_MULTIPLIER = 2    # 일반 수리검 대비 크기 배수
+GOLD_SHURIKEN_DAMAGE_MULTIPLIER = 2  # 일반 수리검 대비 데미지 배수
+
 # 고양이 색상별 크기 설정
 ENEMY_CAT_SIZE = {
     "yellow": (40, 50),  # 노란 고양이: 작음 (빠름)
@@ -48,6 +109,16 @@ ENEMY_CAT_BASE_HP = {
 # 고양이 HP 스테이지 배율 설정
 ENEMY_CAT_STAGE_MULTIPLIER = 1  # 스테이지당 HP 증가량
 
+# 노란색 고양이 점프 설정 (낮은 점프, 빠른 점프 간격, 강한 중력)
+YELLOW_CAT_JUMP_INTERVAL = 600  # 점프 간격 (밀리초)
+YELLOW_CAT_JUMP_VELOCITY = -6   # 점프 속도 (음수 = 위로)
+YELLOW_CAT_GRAVITY = 0.6        # 중력 효과
+
+# 검은색 고양이 점프 설정 (높은 점프, 느린 점프 간격, 약한 중력)
+BLACK_CAT_JUMP_INTERVAL = 1500  # 점프 간격 (밀리초)
+BLACK_CAT_JUMP_VELOCITY = -11   # 점프 속도 (음수 = 위로)
+BLACK_CAT_GRAVITY = 0.3         # 중력 효과
+
 # 흰색 고양이 점프 설정
 WHITE_CAT_JUMP_INTERVAL = 1000  # 점프 간격 (밀리초)
 WHITE_CAT_JUMP_VELOCITY = -8    # 점프 속도 (음수 = 위로)
@@ -55,6 +126,13 @@ WHITE_CAT_GRAVITY = 0.4         # 중력 효과
 
 BOSS_CAT_WIDTH = 120
 BOSS_CAT_HEIGHT = 100
+BOSS_START_X = WIDTH - 100  # 보스 시작 X 좌표 (하단 중앙 기준)
+BOSS_START_Y = HEIGHT - 50  # 보스 시작 Y 좌표 (지면 높이)
+
+# 보스 이동 설정
+BOSS_MOVE_INTERVAL_MIN = 3000  # 최소 이동 간격 (밀리초)
+BOSS_MOVE_INTERVAL_MAX = 6000  # 최대 이동 간격 (밀리초)
+BOSS_MOVE_SPEED = 4            # 이동 속도 (프레임당 픽셀)
 
 # 보스 HP 표시 설정
 BOSS_HP_BAR_WIDTH = 200
@@ -62,6 +140,45 @@ BOSS_HP_BAR_HEIGHT = 20
 BOSS_HP_BAR_MARGIN = 10  # 오른쪽 여백
 BOSS_ATTACK_INTERVAL = 2000
 
+# 보스 공격 패턴 (boss_patterns.py)
+# None: 기존처럼 BOSS_ATTACK_INTERVAL마다 돌 하나를 왼쪽으로 던짐
+# 이름: BOSS_PATTERNS의 그 패턴을 처음부터 끝까지 실행하고 다시 반복 (예: "bullet_hell" - 돌 500개 이상 스트레스 테스트)
+# 탄막 패턴에서는 PROJECTILE_POOL_CAP을 동시에 날아다니는 돌 수 이상(예: 1024)으로 올려야 돌을 계속 재사용합니다.
+BOSS_PATTERN = None
+
+# 패턴 = 발사 목록. 발사 항목 (생략하면 괄호 안의 기본값):
+#   kind:     "fan" 부채꼴 / "ring" 360도 원형 / "aimed" 플레이어 방향을 중심으로 한 부채꼴
+#   count:    한 번에 던지는 돌 수 (1)
+#   angle:    중심 방향, 도 단위 (180 = 왼쪽, 90 = 위)
+#   spread:   fan/aimed의 양 끝 사이 각도 (0)
+#   turn:     발사할 때마다 방향에 더할 각도 - 나선 (0)
+#   speed:    돌 속도, 틱당 픽셀 (8)
+#   gravity:  틱당 아래쪽 가속도, 0보다 크면 포물선 (0)
+#   interval: 다음 발사까지 시간, 밀리초 (BOSS_ATTACK_INTERVAL)
+#   repeat:   같은 발사를 반복할 횟수 (1)
+BOSS_PATTERNS = {
+    "fan": [
+        {"kind": "fan", "count": 7, "spread": 70, "speed": 6, "interval": 800},
+    ],
+    "spiral": [
+        {"kind": "ring", "count": 3, "turn": 13, "speed": 5, "interval": 100},
+    ],
+    "aimed": [
+        {"kind": "aimed", "count": 3, "spread": 10, "speed": 9, "interval": 150, "repeat": 3},
+        {"kind": "aimed", "count": 5, "spread": 40, "speed": 7, "interval": 1200},
+    ],
+    "arc": [
+        {"kind": "fan", "count": 5, "angle": 125, "spread": 40, "speed": 11, "gravity": 0.35, "interval": 700},
+    ],
+    "bullet_hell": [
+        {"kind": "ring", "count": 20, "turn": 7, "speed": 3, "interval": 50, "repeat": 40},
+        {"kind": "fan", "count": 20, "angle": 150, "spread": 100, "speed": 3, "interval": 100, "repeat": 10},
+        {"kind": "aimed", "count": 9, "spread": 40, "speed": 4, "interval": 100, "repeat": 10},
+        {"kind": "fan", "count": 12, "angle": 115, "spread": 50, "speed": 12, "gravity": 0.2, "interval": 100,
+         "repeat": 10},
+    ],
+}
+
 SNACK_SIZE = 60
 SNACK_DURATION = 10000
 SNACK_SPEED = 5
@@ -78,6 +195,17 @@ PUPPY_SPAWN_MAX_INTERVAL = 20000   # 최대 스폰 간격 (20초)
 # Puppy 충돌 영역 설정
 PUPPY_LESS_COLLISION_MARGIN = 30  # puppy가 없을 때 충돌 영역 여백 (픽셀)
 
+# 마우스 적 설정
+MOUSE_WIDTH = 40
+MOUSE_HEIGHT = 30
+MOUSE_BASE_HP = 1                # 기본 체력
+MOUSE_HP_STAGE_MULTIPLIER = 1    # 스테이지당 체력 증가량
+MOUSE_SPEED_MIN = 3              # 최소 속도
+MOUSE_SPEED_MAX = 7              # 최대 속도
+MOUSE_SPAWN_INTERVAL = 5000      # 스폰 간격 (밀리초)
+MOUSE_START_X = WIDTH + 30       # 시작 X 좌표 (화면 오른쪽 밖)
+MOUSE_START_Y = HEIGHT - 50      # 시작 Y 좌표 (player와 동일한 높이)
+
 STONE_RADIUS = 40
 STONE_SPEED_MIN = 5   # 돌의 최소 속도
 STONE_SPEED_MAX = 15  # 돌의 최대 속도
@@ -108,9 +236,57 @@ SCORE_PER_CAT = {
     "white": 300,
 }
 SCORE_BOSS = 500  # 보스 처치 점수
+SCORE_PER_MOUSE = 50  # 마우스 처치 점수 (puppy 방어로 제거 시)
 
 # 하이스코어 저장 파일
 HIGHSCORES_FILE = "highscores.json"
+# 하이스코어 저장 방식 (highscores.py)
+# "json": HIGHSCORES_FILE에 TOP 10만 저장 (잠금 + 임시 파일 바꿔치기, 쓰기 직전에 다른 게임의 기록과 합침)
+# "sqlite": HIGHSCORES_DB에 모든 기록을 저장 (처음 만들 때 HIGHSCORES_FILE의 기록을 가져옴)
+HIGHSCORES_BACKEND = "json"
+HIGHSCORES_DB = "highscores.db"
+# 다른 게임이 하이스코어를 쓰는 중일 때 기다릴 최대 시간 (초, 넘으면 경고하고 이번 실행 동안만 메모리에 보관)
+HIGHSCORES_LOCK_TIMEOUT = 5.0
 
 # 플레이어 이름 입력 최대 길이
 PLAYER_NAME_MAX_LENGTH = 12
+
+# 리플레이 기록 (replay.py)
+# True면 게임 한 판마다 랜덤 시드와 틱별 입력을 REPLAY_DIR에 작은 바이너리 파일로 저장합니다.
+# 저장된 파일은 "python replay.py 파일"로 창 없이 최대 속도로 다시 실행할 수 있습니다.
+REPLAY_RECORD = True
+REPLAY_DIR = "replays"
+# REPLAY_DIR에 남길 최근 리플레이 수 (넘으면 저장할 때 가장 오래된 것부터 지움, 0이면 모두 남김)
+REPLAY_KEEP = 50
+
+# 배경음악 (메뉴를 먼저 띄운 뒤 백그라운드 스레드에서 로드)
+MUSIC_FILE = "assets/catninja.mp3"
+MUSIC_VOLUME = 0.5  # 0.0 ~ 1.0
+
+# 한글 폰트 (fonts.py)
+# 앞에서부터 찾아서 처음 설치되어 있는 폰트를 씁니다 (macOS, Windows, 폴백 순서).
+# 찾은 폰트 파일 경로는 FONT_CACHE_FILE에 저장해서 다음 실행부터는 시스템 폰트 목록을 훑지 않습니다.
+FONT_NAMES = ("AppleGothic", "malgun gothic", "arial")
+FONT_CACHE_FILE = "font_cache.json"
+
+# --- 로그 설정 (gamelog.py) ---
+# 카테고리별 최소 레벨: "DEBUG", "INFO", "WARNING", "ERROR", "OFF"
+# "OFF"인 카테고리는 로그 호출이 레벨 검사 한 번으로 끝나므로 게임 루프에 부담이 없습니다.
+LOG_LEVELS = {
+    "default": "INFO",     # 아래에 없는 카테고리
+    "game": "INFO",        # 상태 전환, 게임 오버, 스테이지 진행
+    "spawn": "INFO",       # 고양이/마우스/puppy 스폰
+    "boss": "INFO",        # 보스 스폰/공격/이동
+    "item": "INFO",        # 간식, gold shuriken
+    "defense": "INFO",     # puppy 방어 효과
+    "collision": "OFF",    # 충돌 영역 디버깅 (매 틱 출력되므로 기본은 끔)
+    "asset": "INFO",       # 이미지/사운드 로드, 캐시 통계
+    "highscore": "WARNING",  # 하이스코어 파일 읽기/쓰기
+    "render": "INFO",      # 렌더링 모드 전환, 프레임당 갱신 픽셀 수(DEBUG)
+}
+LOG_CONSOLE_LEVEL = "INFO"  # 콘솔에 출력할 최소 레벨
+LOG_RATE_LIMIT_MS = 1000    # 반복 로그(every)를 같은 위치에서 다시 출력하기까지 최소 간격
+# 링 버퍼 크기 (0이면 사용 안 함)
+# 카테고리 레벨을 DEBUG로 낮추고 콘솔 레벨은 INFO로 두면,
+# 상세 로그는 메모리에만 쌓였다가 게임 오버/크래시 때만 출력됩니다.
+LOG_RING_BUFFER_SIZE = 0
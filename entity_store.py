@@ -0,0 +1,520 @@
+# entity_store.py
+
+import os
+import random
+
+import pygame
+
+import asset_cache
+import config
+from archetypes import get_cat_archetype
+
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 스프라이트 방식(ENTITY_BACKEND = "sprites")만 사용
+    np = None
+
+# ============================================================================
+# 🧮 배열 기반 엔티티 저장소 (EntityStore)
+# ============================================================================
+# 스프라이트 방식에서는 고양이, 마우스, 돌, 수리검이 각각 pygame.sprite.Sprite 객체이고,
+# 매 틱 all_sprites.update()가 객체마다 파이썬 update()를 한 번씩 호출합니다.
+# 고양이가 수천 마리가 되면 이 호출 비용만으로 1틱(16.7ms)을 넘깁니다.
+#
+# 이 저장소는 같은 종류의 엔티티를 "구조체 배열(Structure of Arrays)"로 들고 있습니다.
+#   x[i], y[i], vx[i], vy[i], hp[i], jump_timer[i], gravity[i] ...
+# 이동, 중력, 바닥 고정, 화면 밖 제거, 사각형 충돌(AABB)을 NumPy 배열 연산으로
+# 한 번에 계산하므로, 파이썬 반복은 엔티티 수가 아니라 "종류 수"만큼만 돕니다.
+#
+# 위치 계산은 스프라이트 클래스(EnemyCat, MouseEnemy, Stone, Shuriken)와 같게 맞췄습니다.
+# pygame.Rect에 실수를 더하면 0.5에서 0에서 먼 쪽으로 반올림되므로 _round_px()로 똑같이 처리합니다.
+
+CAT_COLORS = ("yellow", "black", "white")  # variant 번호 = 이 튜플의 인덱스
+
+
+def available():
+    """numpy를 사용할 수 있는지 여부 (False면 ENTITY_BACKEND = "numpy"를 쓸 수 없음)"""
+    return np is not None
+
+
+def _round_px(values):
+    """pygame.Rect와 같은 방식(0.5는 0에서 먼 쪽)으로 실수 좌표를 정수 픽셀로 바꿉니다."""
+    return np.trunc(values + np.copysign(0.5, values)).astype(np.int64)
+
+
+def _load_image(path, size, flip, fallback_color):
+    """스프라이트 클래스와 같은 캐시 이미지를 가져옵니다 (실패 시 단색 사각형)."""
+    try:
+        return asset_cache.get_image(path, size, flip=flip)
+    except:
+        # 스프라이트 클래스와 같은 대체 이미지를 공유 (마스크도 한 번만 만듦)
+        return asset_cache.get_fallback(os.path.splitext(os.path.basename(path))[0], size, fallback_color)
+
+
+class EntityArrays:
+    """
+    한 종류 엔티티의 구조체 배열
+
+    - 열(column)마다 NumPy 배열 하나, 앞쪽 count개만 살아 있는 엔티티
+    - append()는 용량이 모자라면 2배로 늘림 (매번 새 배열을 만들지 않음)
+    - compact(keep)은 살아남은 엔티티를 순서를 유지한 채 앞으로 모음
+    - columns()는 살아 있는 구간의 view dict (값을 바꾸면 원본이 바뀜)
+    """
+
+    COLUMNS = (
+        ("x", "i8"),              # 왼쪽 위 X (rect.x)
+        ("y", "i8"),              # 왼쪽 위 Y (rect.y)
+        ("w", "i8"),              # 너비
+        ("h", "i8"),              # 높이
+        ("prev_x", "i8"),         # 틱 시작 전 위치 (화면 보간용)
+        ("prev_y", "i8"),
+        ("fx", "f8"),             # 실수 위치 (돌만 사용, 소수 속도를 누적한 뒤 x/y로 반올림)
+        ("fy", "f8"),
+        ("vx", "f8"),             # X축 속도 (틱당 픽셀)
+        ("vy", "f8"),             # Y축 속도 (틱당 픽셀)
+        ("gravity", "f8"),        # 틱당 vy 증가량
+        ("hp", "i8"),             # 체력 (수리검은 데미지)
+        ("variant", "i8"),        # 이미지 번호 (고양이 색상, 골드 수리검 여부)
+        ("jump_timer", "f8"),
+        ("jump_interval", "f8"),
+        ("jump_velocity", "f8"),
+    )
+
+    def __init__(self, capacity=64):
+        self.count = 0
+        self._data = {name: np.zeros(capacity, dtype) for name, dtype in self.COLUMNS}
+
+    def __len__(self):
+        return self.count
+
+    def columns(self):
+        """살아 있는 엔티티 구간의 열 view dict"""
+        n = self.count
+        return {name: column[:n] for name, column in self._data.items()}
+
+    def append(self, n=1, **values):
+        """
+        엔티티 n개를 뒤에 추가합니다.
+
+        Args:
+            n: 추가할 개수
+            **values: 열 이름 = 값 (스칼라 또는 길이 n 배열, 주지 않은 열은 0)
+
+        Returns:
+            int: 추가된 첫 엔티티의 인덱스
+        """
+        start = self.count
+        end = start + n
+        capacity = len(self._data["x"])
+        if end > capacity:
+            while capacity < end:
+                capacity *= 2
+            for name, column in self._data.items():
+                grown = np.zeros(capacity, column.dtype)
+                grown[:start] = column[:start]
+                self._data[name] = grown
+        for name, column in self._data.items():
+            column[start:end] = values.get(name, 0)
+        self.count = end
+        return start
+
+    def compact(self, keep):
+        """keep[i]가 True인 엔티티만 순서대로 남깁니다."""
+        kept = int(np.count_nonzero(keep))
+        if kept == self.count:
+            return
+        n = self.count
+        for column in self._data.values():
+            column[:kept] = column[:n][keep]
+        self.count = kept
+
+    def remove(self, index):
+        """index번 엔티티 하나를 제거합니다 (뒤쪽 엔티티의 순서는 유지)."""
+        keep = np.ones(self.count, dtype=bool)
+        keep[index] = False
+        self.compact(keep)
+
+    def clear(self):
+        self.count = 0
+
+    def snapshot(self):
+        """
+        살아 있는 엔티티를 저장합니다.
+
+        Returns:
+            tuple: (count, 열마다 살아 있는 구간의 bytes 튜플) - COLUMNS 순서
+        """
+        n = self.count
+        return (n, tuple(self._data[name][:n].tobytes() for name, _ in self.COLUMNS))
+
+    def restore(self, state):
+        """snapshot()으로 저장한 엔티티로 되돌립니다."""
+        n, columns = state
+        self.clear()
+        self.append(n, **{name: np.frombuffer(data, dtype)
+                          for (name, dtype), data in zip(self.COLUMNS, columns)})
+
+    def overlaps(self, rect):
+        """
+        rect와 겹치는 엔티티 마스크를 반환합니다 (pygame.Rect.colliderect와 같은 판정).
+
+        Returns:
+            numpy.ndarray: 길이 count의 bool 배열
+        """
+        c = self.columns()
+        return ((c["x"] < rect.right) & (c["x"] + c["w"] > rect.left) &
+                (c["y"] < rect.bottom) & (c["y"] + c["h"] > rect.top))
+
+    def first_overlap(self, rect):
+        """rect와 겹치는 가장 먼저 추가된 엔티티의 인덱스 (없으면 -1)"""
+        if self.count == 0:
+            return -1
+        hits = np.flatnonzero(self.overlaps(rect))
+        return int(hits[0]) if len(hits) else -1
+
+    def rect(self, index):
+        """index번 엔티티의 pygame.Rect (로그, 디버그용)"""
+        d = self._data
+        return pygame.Rect(int(d["x"][index]), int(d["y"][index]), int(d["w"][index]), int(d["h"][index]))
+
+
+class StoneLauncher:
+    """
+    BossCat의 stone_pool 자리에 넣는 어댑터
+
+    BossCat은 stone_pool.acquire(x, y)만 호출하므로, 돌 스프라이트 대신
+    EntityStore의 돌 배열에 한 줄을 추가하도록 연결합니다.
+    """
+
+    def __init__(self, store):
+        self.store = store
+
+    def acquire(self, x, y, velocity=None):
+        """(x, y)에 돌을 추가하고 배열 인덱스를 반환합니다 (velocity는 Stone과 같음)."""
+        return self.store.spawn_stone(x, y, velocity)
+
+
+class EntityStore:
+    """
+    고양이, 마우스, 돌, 수리검을 종류별 구조체 배열로 관리하는 저장소
+
+    주요 기능:
+    - spawn_*(): 엔티티 추가 (스프라이트 클래스와 같은 위치, 속도, 체력, 랜덤 호출 순서)
+    - step(): 한 틱 동안의 이동, 중력, 바닥 고정, 화면 밖 제거를 배열 연산으로 처리
+    - shuriken_hits(): 수리검 x 고양이 겹침을 한 번에 계산하고 데미지/점수 반영
+    - draw_items(alpha): 화면에 그릴 (이미지, 위치) 목록 (틱 사이 보간 포함)
+    - snapshot() / restore(): 배열 내용 저장과 복원 (bytes로 복사)
+
+    보스, 플레이어, 간식, puppy는 개수가 적으므로 계속 스프라이트로 남습니다.
+    """
+
+    KINDS = ("cats", "mice", "stones", "shurikens")
+
+    def __init__(self, rng=None):
+        """
+        Args:
+            rng: 랜덤 생성기 (random.Random, 없으면 random 모듈 사용)
+        """
+        if np is None:
+            raise RuntimeError("numpy가 설치되어 있지 않아 EntityStore를 사용할 수 없습니다")
+        self.rng = rng or random
+        self.cats = EntityArrays()
+        self.mice = EntityArrays()
+        self.stones = EntityArrays()
+        self.shurikens = EntityArrays()
+        self.stone_launcher = StoneLauncher(self)
+        self.ground_y = config.HEIGHT - 50  # 고양이가 서 있는 바닥 높이
+
+        # ===== 색상별 고양이 특성 표 (archetypes.py의 원형, variant 번호로 인덱싱) =====
+        self.cat_archetypes = [get_cat_archetype(color) for color in CAT_COLORS]
+        self.cat_sizes = [archetype.size for archetype in self.cat_archetypes]
+        self.cat_speeds = [archetype.speed for archetype in self.cat_archetypes]
+        self.cat_jump_intervals = [archetype.jump_interval for archetype in self.cat_archetypes]
+        self.cat_jump_velocities = [archetype.jump_velocity for archetype in self.cat_archetypes]
+        self.cat_gravities = [archetype.gravity for archetype in self.cat_archetypes]
+        self.cat_scores = np.array([archetype.score for archetype in self.cat_archetypes], dtype=np.int64)
+        self._images = None  # (cats, mouse, stone, shurikens) - 처음 그릴 때 만듦
+
+    # ------------------------------------------------------------------
+    # 스폰
+    # ------------------------------------------------------------------
+
+    def spawn_cat(self, x, y, color_name, stage=1):
+        """EnemyCat(x, y, color_name, stage)과 같은 고양이를 추가하고 인덱스를 반환합니다."""
+        variant = CAT_COLORS.index(color_name)
+        width, height = self.cat_sizes[variant]
+        left, top = x - width // 2, y - height  # midbottom=(x, y)
+        return self.cats.append(
+            x=left, y=top, w=width, h=height, prev_x=left, prev_y=top,
+            vx=-self.cat_speeds[variant], gravity=self.cat_gravities[variant],
+            hp=self.cat_archetypes[variant].hp(stage), variant=variant,
+            jump_interval=self.cat_jump_intervals[variant],
+            jump_velocity=self.cat_jump_velocities[variant],
+        )
+
+    def spawn_cats(self, xs, y, color_names, stage=1):
+        """
+        고양이 여러 마리를 한 번에 추가합니다 (스트레스 스테이지용).
+
+        Args:
+            xs: 고양이별 하단 중앙 X 좌표 목록
+            y: 하단 Y 좌표 (모두 같은 바닥)
+            color_names: 고양이별 색상 이름 목록
+            stage: 현재 스테이지
+        """
+        variants = np.array([CAT_COLORS.index(color) for color in color_names], dtype=np.int64)
+        sizes = np.array(self.cat_sizes, dtype=np.int64)[variants]
+        hps = np.array([archetype.hp(stage) for archetype in self.cat_archetypes], dtype=np.int64)[variants]
+        left = np.asarray(xs, dtype=np.int64) - sizes[:, 0] // 2
+        top = y - sizes[:, 1]
+        return self.cats.append(
+            len(variants), x=left, y=top, w=sizes[:, 0], h=sizes[:, 1], prev_x=left, prev_y=top,
+            vx=-np.array(self.cat_speeds, dtype=np.float64)[variants],
+            gravity=np.array(self.cat_gravities)[variants], hp=hps, variant=variants,
+            jump_interval=np.array(self.cat_jump_intervals, dtype=np.float64)[variants],
+            jump_velocity=np.array(self.cat_jump_velocities, dtype=np.float64)[variants],
+        )
+
+    def spawn_mouse(self, x, y, stage=1):
+        """MouseEnemy(x, y, stage)와 같은 마우스를 추가합니다 (속도를 랜덤으로 한 번 뽑음)."""
+        width, height = config.MOUSE_WIDTH, config.MOUSE_HEIGHT
+        left, top = x - width // 2, y - height
+        speed = self.rng.randint(config.MOUSE_SPEED_MIN, config.MOUSE_SPEED_MAX)
+        return self.mice.append(
+            x=left, y=top, w=width, h=height, prev_x=left, prev_y=top, vx=-speed,
+            hp=config.MOUSE_BASE_HP + (stage - 1) * config.MOUSE_HP_STAGE_MULTIPLIER,
+        )
+
+    def spawn_stone(self, x, y, velocity=None):
+        """
+        Stone(x, y, velocity=velocity)와 같은 돌을 추가합니다.
+
+        velocity (vx, vy, gravity)가 없으면 속도를 랜덤으로 한 번 뽑아 왼쪽으로 던집니다.
+        """
+        size = config.STONE_RADIUS * 2
+        left, top = x - size // 2, y - size // 2  # center=(x, y)
+        if velocity is None:
+            speed = self.rng.randint(config.STONE_SPEED_MIN, config.STONE_SPEED_MAX)
+            vx, vy, gravity = -speed, 0, config.STONE_GRAVITY
+        else:
+            vx, vy, gravity = velocity
+        return self.stones.append(
+            x=left, y=top, w=size, h=size, prev_x=left, prev_y=top, fx=left, fy=top,
+            vx=vx, vy=vy, gravity=gravity,
+        )
+
+    def spawn_shuriken(self, x, y, gold=False):
+        """Shuriken/GoldShuriken(x, y)과 같은 수리검을 추가합니다 (hp 열에 데미지를 저장)."""
+        scale = config.GOLD_SHURIKEN_SIZE_MULTIPLIER if gold else 1
+        width, height = config.SHURIKEN_WIDTH * scale, config.SHURIKEN_HEIGHT * scale
+        left, top = x - width // 2, y - height // 2
+        return self.shurikens.append(
+            x=left, y=top, w=width, h=height, prev_x=left, prev_y=top, vx=config.SHURIKEN_SPEED,
+            hp=config.GOLD_SHURIKEN_DAMAGE_MULTIPLIER if gold else 1, variant=1 if gold else 0,
+        )
+
+    def clear(self, *kinds):
+        """
+        엔티티를 모두 지웁니다.
+
+        Args:
+            *kinds: "cats", "mice", "stones", "shurikens" 중 일부 (주지 않으면 전부)
+        """
+        for kind in kinds or self.KINDS:
+            getattr(self, kind).clear()
+
+    def kill_cat(self, index):
+        """index번 고양이를 제거하고 처치 점수를 반환합니다 (puppy 방어로 부딪혀 없앤 경우)."""
+        score = int(self.cat_scores[self.cats.columns()["variant"][index]])
+        self.cats.remove(index)
+        return score
+
+    def snapshot(self):
+        """네 종류 배열의 snapshot() 튜플 (cats, mice, stones, shurikens 순서)"""
+        return tuple(getattr(self, kind).snapshot() for kind in self.KINDS)
+
+    def restore(self, state):
+        """snapshot()으로 저장한 엔티티로 되돌립니다."""
+        for kind, kind_state in zip(self.KINDS, state):
+            getattr(self, kind).restore(kind_state)
+
+    def counts(self):
+        """종류별 살아 있는 엔티티 수"""
+        return {"cats": self.cats.count, "mice": self.mice.count,
+                "stones": self.stones.count, "shurikens": self.shurikens.count}
+
+    # ------------------------------------------------------------------
+    # 한 틱 진행
+    # ------------------------------------------------------------------
+
+    def step(self):
+        """
+        모든 엔티티를 한 틱만큼 움직이고 화면 밖으로 나간 것을 제거합니다.
+
+        각 스프라이트 클래스의 update()와 같은 순서로 계산합니다.
+        """
+        for arrays in (self.cats, self.mice, self.stones, self.shurikens):
+            c = arrays.columns()
+            c["prev_x"][:] = c["x"]
+            c["prev_y"][:] = c["y"]
+
+        # ===== 고양이: 점프 타이머 -> 중력 -> Y 이동 -> 바닥 고정 -> 왼쪽 이동 =====
+        if self.cats.count:
+            c = self.cats.columns()
+            c["jump_timer"] += config.TICK_MS
+            jumping = c["jump_timer"] >= c["jump_interval"]
+            c["vy"][jumping] = c["jump_velocity"][jumping]
+            c["jump_timer"][jumping] = 0
+            c["vy"] += c["gravity"]
+            c["y"][:] = _round_px(c["y"] + c["vy"])
+            landed = c["y"] + c["h"] >= self.ground_y
+            c["y"][landed] = self.ground_y - c["h"][landed]
+            c["vy"][landed] = 0
+            c["x"] += c["vx"].astype(np.int64)
+            self.cats.compact(c["x"] + c["w"] >= 0)
+
+        # ===== 마우스: 왼쪽 이동 =====
+        if self.mice.count:
+            c = self.mice.columns()
+            c["x"] += c["vx"].astype(np.int64)
+            self.mice.compact(c["x"] + c["w"] >= 0)
+
+        # ===== 돌: 중력 -> 실수 위치 이동 -> 반올림 -> 화면 위/아래/좌우 밖이면 제거 =====
+        if self.stones.count:
+            c = self.stones.columns()
+            c["vy"] += c["gravity"]
+            c["fx"] += c["vx"]
+            c["fy"] += c["vy"]
+            c["x"][:] = _round_px(c["fx"])
+            c["y"][:] = _round_px(c["fy"])
+            self.stones.compact((c["y"] <= config.HEIGHT) & (c["y"] + c["h"] >= -config.HEIGHT) &
+                                (c["x"] >= 0) & (c["x"] + c["w"] <= config.WIDTH))
+
+        # ===== 수리검: 오른쪽 이동 =====
+        if self.shurikens.count:
+            c = self.shurikens.columns()
+            c["x"] += c["vx"].astype(np.int64)
+            self.shurikens.compact(c["x"] <= config.WIDTH)
+
+    def shuriken_hits(self, boss_rect=None):
+        """
+        수리검과 고양이(및 보스)의 충돌을 처리합니다.
+
+        모든 수리검 x 고양이 쌍의 겹침을 한 번에 계산한 뒤, 무언가에 맞은 수리검만
+        순서대로 데미지를 적용합니다 (앞 수리검에 죽은 고양이는 뒤 수리검에 맞지 않음).
+        맞은 수리검은 제거됩니다.
+
+        Args:
+            boss_rect: 보스의 rect (보스가 없으면 None)
+
+        Returns:
+            tuple: (고양이 처치 점수 합계, 보스가 받은 데미지 합계)
+        """
+        shurikens, cats = self.shurikens, self.cats
+        if shurikens.count == 0:
+            return 0, 0
+        s = shurikens.columns()
+
+        if cats.count:
+            c = cats.columns()
+            hit_matrix = ((s["x"][:, None] < (c["x"] + c["w"])[None, :]) &
+                          ((s["x"] + s["w"])[:, None] > c["x"][None, :]) &
+                          (s["y"][:, None] < (c["y"] + c["h"])[None, :]) &
+                          ((s["y"] + s["h"])[:, None] > c["y"][None, :]))
+            hit_cat = hit_matrix.any(axis=1)
+        else:
+            hit_cat = np.zeros(shurikens.count, dtype=bool)
+
+        if boss_rect is not None:
+            hit_boss = ((s["x"] < boss_rect.right) & (s["x"] + s["w"] > boss_rect.left) &
+                        (s["y"] < boss_rect.bottom) & (s["y"] + s["h"] > boss_rect.top))
+        else:
+            hit_boss = np.zeros(shurikens.count, dtype=bool)
+
+        score = 0
+        used = np.zeros(shurikens.count, dtype=bool)
+        if hit_cat.any():
+            cat_alive = np.ones(cats.count, dtype=bool)
+            for i in np.flatnonzero(hit_cat):
+                targets = hit_matrix[i] & cat_alive
+                if not targets.any():
+                    continue
+                c["hp"][targets] -= s["hp"][i]
+                dead = targets & (c["hp"] <= 0)
+                if dead.any():
+                    score += int(self.cat_scores[c["variant"][dead]].sum())
+                    cat_alive &= ~dead
+                used[i] = True
+            cats.compact(cat_alive)
+
+        boss_damage = int(s["hp"][hit_boss].sum())
+        used |= hit_boss
+        if used.any():
+            shurikens.compact(~used)
+        return score, boss_damage
+
+    # ------------------------------------------------------------------
+    # 그리기
+    # ------------------------------------------------------------------
+
+    def _load_images(self):
+        """종류/variant별 이미지 목록 (스프라이트 클래스와 같은 캐시 이미지를 공유)"""
+        cats = [archetype.image for archetype in self.cat_archetypes]
+        mouse = [_load_image("assets/mouse.png", (config.MOUSE_WIDTH, config.MOUSE_HEIGHT), True, config.GRAY)]
+        stone_size = (config.STONE_RADIUS * 2, config.STONE_RADIUS * 2)
+        stone = [_load_image("assets/stone.png", stone_size, False, config.GRAY)]
+        gold_scale = config.GOLD_SHURIKEN_SIZE_MULTIPLIER
+        shurikens = [
+            _load_image("assets/shuriken.png", (config.SHURIKEN_WIDTH, config.SHURIKEN_HEIGHT), False, config.BLACK),
+            _load_image("assets/gold_shuriken.png",
+                        (config.SHURIKEN_WIDTH * gold_scale, config.SHURIKEN_HEIGHT * gold_scale), False, config.YELLOW),
+        ]
+        return ((self.cats, cats), (self.mice, mouse), (self.stones, stone), (self.shurikens, shurikens))
+
+    def first_pixel_overlap(self, arrays, rect, mask):
+        """
+        rect와 사각형이 겹치고 픽셀(마스크)까지 겹치는 가장 먼저 추가된 엔티티의 인덱스 (없으면 -1)
+
+        사각형 판정은 배열 연산으로 한 번에 하고, 겹친 몇 개만 variant 이미지의 마스크로 검사합니다.
+
+        Args:
+            arrays: 검사할 종류 (self.cats / self.mice / self.stones)
+            rect: 상대(플레이어)의 사각형
+            mask: 상대의 충돌 마스크 (rect 왼쪽 위 기준)
+        """
+        if arrays.count == 0:
+            return -1
+        if self._images is None:
+            self._images = self._load_images()
+        images = next(images for owner, images in self._images if owner is arrays)
+        c = arrays.columns()
+        for index in np.flatnonzero(arrays.overlaps(rect)).tolist():
+            image = images[c["variant"][index]]
+            offset = (int(c["x"][index]) - rect.x, int(c["y"][index]) - rect.y)
+            if mask.overlap(asset_cache.get_mask(image), offset):
+                return index
+        return -1
+
+    def draw_items(self, alpha=1.0):
+        """
+        화면에 그릴 (이미지, (x, y)) 목록을 반환합니다.
+
+        Args:
+            alpha: 다음 틱까지 진행된 비율 (session.alpha). 1.0이면 현재 위치 그대로
+
+        위치 보간도 배열 연산으로 계산하고, 화면 반대편으로 순간이동한 경우는 보간하지 않습니다.
+        """
+        if self._images is None:
+            self._images = self._load_images()
+        items = []
+        for arrays, images in self._images:
+            if arrays.count == 0:
+                continue
+            c = arrays.columns()
+            dx = c["x"] - c["prev_x"]
+            smooth = np.abs(dx) < config.WIDTH // 2
+            xs = np.where(smooth, c["prev_x"] + dx * alpha, c["x"]).tolist()
+            ys = np.where(smooth, c["prev_y"] + (c["y"] - c["prev_y"]) * alpha, c["y"]).tolist()
+            variants = c["variant"].tolist()
+            items.extend((images[v], (x, y)) for v, x, y in zip(variants, xs, ys))
+        return items
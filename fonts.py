@@ -0,0 +1,102 @@
+# fonts.py
+
+import json
+import os
+
+import pygame
+
+import config
+import gamelog
+
+# ============================================================================
+# 🔤 폰트 경로 찾기 (+ 디스크 캐시)
+# ============================================================================
+# 예전에는 시작할 때 크기마다 pygame.font.SysFont("AppleGothic", ...)를 호출했습니다.
+# SysFont는 처음 호출될 때 시스템 폰트 목록을 전부 훑고(Windows 레지스트리, macOS 폰트 폴더,
+# Linux fc-list), 폰트가 없어도 예외 없이 기본 폰트를 돌려주기 때문에
+# "malgun gothic", "arial" 폴백은 실제로는 한 번도 쓰이지 않았습니다.
+#
+# find_font_path()는 config.FONT_NAMES를 순서대로 찾아 처음 있는 폰트 파일 경로를 돌려주고,
+# 그 결과를 config.FONT_CACHE_FILE에 저장합니다.
+# 다음 실행부터는 캐시된 경로로 pygame.font.Font(경로, 크기)를 바로 만들므로 폰트 목록을 훑지 않습니다.
+# 폰트 파일이 지워졌거나 FONT_NAMES가 바뀌었으면 다시 찾습니다.
+# (어느 폰트도 없었다는 결과도 캐시합니다 - 새 폰트를 설치했으면 캐시 파일을 지우세요.)
+
+_log = gamelog.get_logger("asset")
+
+
+def _read_cache(path, names):
+    """캐시 파일 -> (찾았는지, 폰트 경로 또는 None)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return False, None
+    if not isinstance(data, dict) or data.get("names") != list(names):
+        return False, None
+    font_path = data.get("path")
+    if font_path is not None and not os.path.isfile(font_path):
+        return False, None  # 폰트 파일이 옮겨졌거나 지워짐
+    return True, font_path
+
+
+def _write_cache(path, names, font_path):
+    """찾은 결과를 캐시 파일에 저장 (실패해도 다음 실행에서 다시 찾을 뿐이므로 경고만)"""
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"names": list(names), "path": font_path}, f, ensure_ascii=False, indent=2)
+    except OSError as e:
+        _log.warning("⚠️ 폰트 캐시 저장 실패: %s", e)
+
+
+def find_font_path(names=None, cache_file=None):
+    """
+    names 중 처음으로 설치되어 있는 폰트의 파일 경로를 반환합니다.
+
+    Args:
+        names: 찾을 폰트 이름 순서 (기본값: config.FONT_NAMES)
+        cache_file: 결과를 저장할 파일 (기본값: config.FONT_CACHE_FILE, None이나 ""이면 캐시 안 함)
+
+    Returns:
+        str 또는 None: 폰트 파일 경로 (None이면 pygame 기본 폰트를 써야 함)
+    """
+    names = tuple(names or config.FONT_NAMES)
+    if cache_file is None:
+        cache_file = config.FONT_CACHE_FILE
+    if cache_file:
+        found, font_path = _read_cache(cache_file, names)
+        if found:
+            return font_path
+
+    # SysFont와 같은 방식으로 찾되, 없는 이름은 건너뛰고 다음 이름을 찾음 (여기서만 시스템 폰트 목록을 훑음)
+    font_path = None
+    for name in names:
+        font_path = pygame.font.match_font(name)
+        if font_path:
+            break
+    if font_path:
+        _log.info("🔤 폰트 찾음: %s", font_path)
+    else:
+        _log.warning("⚠️ %s 폰트를 찾지 못해 기본 폰트를 사용합니다", ", ".join(names))
+    if cache_file:
+        _write_cache(cache_file, names, font_path)
+    return font_path
+
+
+def load_fonts(sizes, names=None, cache_file=None):
+    """
+    같은 폰트 파일로 크기별 Font를 만듭니다.
+
+    Args:
+        sizes: 글자 크기 목록 (예: (24, 36, 48, 18))
+
+    Returns:
+        list: sizes 순서의 pygame.font.Font
+    """
+    font_path = find_font_path(names, cache_file)
+    try:
+        return [pygame.font.Font(font_path, size) for size in sizes]
+    except (OSError, pygame.error) as e:
+        # 폰트 파일이 깨졌으면 기본 폰트로
+        _log.warning("⚠️ 폰트 로드 실패 (%s): %s", font_path, e)
+        return [pygame.font.Font(None, size) for size in sizes]
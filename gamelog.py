@@ -0,0 +1,190 @@
+# gamelog.py
+
+import collections
+import logging
+import sys
+import time
+
+import config
+
+# ============================================================================
+# 📝 게임 로그 (카테고리별 레벨 + 속도 제한 + 링 버퍼)
+# ============================================================================
+# 게임 루프 안에서 print()를 매 프레임 호출하면 출력 자체가 프레임 시간을 잡아먹습니다.
+# 이 모듈은 파이썬 표준 logging 위에 다음 기능을 얹습니다.
+#
+# - 카테고리별 로거: get_logger("spawn") -> "catninja.spawn"
+# - 카테고리별 레벨: config.LOG_LEVELS (꺼진 카테고리는 isEnabledFor 검사만 하고 끝남)
+# - 속도 제한: log.debug(..., extra=every(1000)) 처럼 호출 위치별로 1초에 한 번만 출력
+# - 링 버퍼: 최근 로그를 메모리에만 쌓아 두었다가 게임 오버/크래시 때만 출력
+#
+# 사용 예:
+#     _log = gamelog.get_logger("collision")
+#     if _log.isEnabledFor(gamelog.DEBUG):   # 인자 계산이 비싼 경우에만 검사
+#         _log.debug("충돌 영역: %s", rect)
+
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+OFF = logging.CRITICAL + 1  # 카테고리를 완전히 끌 때 사용하는 레벨
+
+ROOT_NAME = "catninja"
+
+_LEVEL_NAMES = {
+    "DEBUG": DEBUG,
+    "INFO": INFO,
+    "WARNING": WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+    "OFF": OFF,
+}
+
+_every_cache = {}
+_ring_handler = None
+
+
+def get_logger(category):
+    """카테고리 로거를 반환합니다 (예: "spawn" -> "catninja.spawn")."""
+    return logging.getLogger(f"{ROOT_NAME}.{category}")
+
+
+def every(interval_ms):
+    """
+    속도 제한용 extra 인자를 반환합니다.
+
+    Args:
+        interval_ms: 같은 호출 위치의 로그를 최소 몇 ms 간격으로 출력할지
+
+    사용 예: log.debug("타이머: %d", t, extra=every(1000))
+    """
+    extra = _every_cache.get(interval_ms)
+    if extra is None:
+        extra = _every_cache[interval_ms] = {"every_ms": interval_ms}
+    return extra
+
+
+def _parse_level(level):
+    if isinstance(level, int):
+        return level
+    return _LEVEL_NAMES[str(level).upper()]
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    속도 제한 필터
+
+    extra=every(ms)가 붙은 로그만 대상으로, 호출 위치(파일, 줄 번호)마다
+    지정한 간격 안에서는 한 번만 통과시키고 나머지는 생략한 횟수만 셉니다.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._last = {}  # (경로, 줄 번호) -> [마지막 출력 시각, 생략한 횟수]
+
+    def filter(self, record):
+        interval_ms = getattr(record, "every_ms", None)
+        if interval_ms is None:
+            return True
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        state = self._last.get(key)
+        if state is not None and (now - state[0]) * 1000 < interval_ms:
+            state[1] += 1
+            return False
+        if state is not None and state[1]:
+            record.msg = f"{record.msg} (이전 {state[1]}회 생략)"
+        self._last[key] = [now, 0]
+        return True
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    최근 로그 N개만 메모리에 보관하는 핸들러
+
+    평소에는 아무것도 출력하지 않고, dump()를 호출했을 때만 (게임 오버, 크래시)
+    쌓아 둔 로그를 한꺼번에 출력합니다.
+    """
+
+    def __init__(self, capacity):
+        super().__init__()
+        self.records = collections.deque(maxlen=capacity)
+
+    def emit(self, record):
+        # Rect 같은 인자는 나중에 값이 바뀌므로 기록 시점에 문자열로 만들어 둠
+        self.records.append(self.format(record))
+
+    def dump(self, stream, reason=""):
+        """쌓아 둔 로그를 stream에 출력하고 버퍼를 비웁니다."""
+        stream.write(f"===== 최근 로그 {len(self.records)}개 ({reason}) =====\n")
+        for line in self.records:
+            stream.write(line + "\n")
+        stream.write("===== 끝 =====\n")
+        stream.flush()
+        self.records.clear()
+
+
+def configure(levels=None, console_level=None, ring_size=None, dump_on_crash=True):
+    """
+    게임 로그를 설정합니다 (main.py 시작 시 한 번 호출).
+
+    Args:
+        levels: {카테고리: 레벨} 딕셔너리 (기본값: config.LOG_LEVELS)
+        console_level: 콘솔에 출력할 최소 레벨 (기본값: config.LOG_CONSOLE_LEVEL)
+        ring_size: 링 버퍼 크기, 0이면 링 버퍼 사용 안 함 (기본값: config.LOG_RING_BUFFER_SIZE)
+        dump_on_crash: True면 처리되지 않은 예외 발생 시 링 버퍼를 출력
+
+    설정하지 않으면 (헤드리스 실행 등) 표준 logging 기본값대로 WARNING 이상만 출력됩니다.
+    """
+    global _ring_handler
+
+    levels = config.LOG_LEVELS if levels is None else levels
+    console_level = config.LOG_CONSOLE_LEVEL if console_level is None else console_level
+    ring_size = config.LOG_RING_BUFFER_SIZE if ring_size is None else ring_size
+
+    root = logging.getLogger(ROOT_NAME)
+    root.setLevel(_parse_level(levels.get("default", "INFO")))
+    root.propagate = False
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+
+    rate_limit = RateLimitFilter()
+    for category, level in levels.items():
+        if category == "default":
+            continue
+        logger = get_logger(category)
+        logger.setLevel(_parse_level(level))
+        logger.filters = [rate_limit]
+
+    formatter = logging.Formatter("[%(name)s] %(message)s")
+    console = logging.StreamHandler(sys.stdout)
+    console.setLevel(_parse_level(console_level))
+    console.setFormatter(formatter)
+    root.addHandler(console)
+
+    _ring_handler = None
+    if ring_size:
+        _ring_handler = RingBufferHandler(ring_size)
+        _ring_handler.setFormatter(logging.Formatter("%(relativeCreated)8.0fms [%(name)s] %(message)s"))
+        root.addHandler(_ring_handler)
+
+    if dump_on_crash:
+        _install_crash_hook()
+
+
+def dump_ring(reason, stream=None):
+    """링 버퍼에 쌓인 로그를 출력합니다 (링 버퍼를 쓰지 않으면 아무 일도 하지 않음)."""
+    if _ring_handler is not None:
+        _ring_handler.dump(stream or sys.stderr, reason)
+
+
+def _install_crash_hook():
+    previous_hook = sys.excepthook
+    if getattr(previous_hook, "_gamelog_hook", False):
+        return
+
+    def hook(exc_type, exc, tb):
+        dump_ring("크래시")
+        previous_hook(exc_type, exc, tb)
+
+    hook._gamelog_hook = True
+    sys.excepthook = hook
@@ -0,0 +1,426 @@
+# highscores.py
+
+import contextlib
+import json
+import os
+import sqlite3
+import tempfile
+import time
+import uuid
+
+import config
+import gamelog
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:  # Windows가 아님
+    msvcrt = None
+
+# ============================================================================
+# 🏆 하이스코어 저장소 (HighScoreStore)
+# ============================================================================
+# 예전에는 메뉴와 게임 오버 화면이 매 프레임 load_highscores()를 호출해서
+# 1초에 60번씩 JSON 파일을 열고, 파싱하고, 정렬했습니다.
+# 이 클래스는 파일을 한 번만 읽어 정렬된 TOP 10을 메모리에 들고 있고,
+# save()로 파일에 쓸 때만 내용이 바뀝니다 (version이 1 증가).
+#
+# 화면 쪽에서는 version이 바뀌었을 때만 표를 다시 그리면 됩니다.
+#
+# 여러 게임(키오스크 여러 대)이 같은 폴더의 하이스코어 파일을 함께 쓸 때:
+#   - 쓰기: 같은 폴더의 임시 파일에 다 쓴 뒤 os.replace()로 바꿔치기 (쓰는 도중 꺼져도 예전 파일이 남음)
+#   - 잠금: "파일이름.lock"에 배타 잠금을 건 동안만 읽고-합치고-씀 (fcntl / msvcrt)
+#   - 합치기: 쓰기 직전에 파일을 다시 읽어 다른 게임이 그 사이 남긴 기록과 합침 (기록마다 id로 중복 제거)
+#   - 파일이 깨져 있으면 "파일이름.corrupt"로 옮겨 두고 경고 (빈 목록으로 덮어써서 조용히 잃지 않음)
+#
+# config.HIGHSCORES_BACKEND = "sqlite"이면 SQLiteHighScoreStore가 모든 기록을 DB에 쌓고,
+# (score DESC, time ASC) 인덱스로 "TOP 10에 드는지"를 정렬 없이 인덱스 탐색으로 답합니다.
+
+_log = gamelog.get_logger("highscore")
+
+BACKENDS = ("json", "sqlite")
+
+
+def _sort_key(record):
+    """점수 내림차순, 시간 오름차순 정렬 키"""
+    return (-int(record.get("score", 0)), float(record.get("time", 0.0)))
+
+
+def _record_id(record):
+    """합칠 때 같은 기록인지 판단하는 키 (id가 없는 예전 기록은 이름, 점수, 시간)"""
+    return record.get("id") or (record.get("name"), record.get("score"), record.get("time"))
+
+
+def _file_stamp(path):
+    """파일이 바뀌었는지 비교할 값 (수정 시각, 크기), 파일이 없으면 None"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+@contextlib.contextmanager
+def _file_lock(path, timeout):
+    """
+    path + ".lock" 파일에 배타 잠금을 겁니다 (다른 프로세스가 잡고 있으면 timeout초까지 기다림).
+
+    잠금 파일은 지우지 않습니다 (지우면 기다리던 프로세스가 다른 파일을 잠글 수 있음).
+
+    Raises:
+        TimeoutError: timeout초 안에 잠금을 얻지 못함
+    """
+    deadline = time.monotonic() + timeout
+    with open(path + ".lock", "a+b") as f:
+        while True:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                elif msvcrt is not None:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"하이스코어 파일 잠금 대기 시간 초과: {path}.lock") from None
+                time.sleep(0.01)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _read_records(path):
+    """
+    하이스코어 파일 -> 기록 목록 (파일이 없으면 빈 목록)
+
+    Raises:
+        ValueError: JSON이 깨졌거나 목록이 아님
+        OSError: 파일을 읽을 수 없음
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return []
+    if not isinstance(data, list):
+        raise ValueError("하이스코어 파일이 목록이 아닙니다")
+    return [record for record in data if isinstance(record, dict)]
+
+
+def _atomic_write(path, records):
+    """같은 폴더의 임시 파일에 다 쓴 뒤 os.replace()로 바꿔치기 (중간에 꺼져도 예전 파일이 그대로)"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(records, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
+
+
+class HighScoreStore:
+    """
+    하이스코어 JSON 파일의 메모리 캐시
+
+    주요 기능:
+    - 처음 사용할 때 한 번만 파일을 읽음 (이후 파일 I/O 없음)
+    - 항상 정렬된 상위 limit개 기록을 유지
+    - save()가 파일에 쓸 때만 version이 바뀜 (화면 캐시 무효화용)
+    - 표에 표시할 문자열도 version마다 한 번만 만듦
+    - save()는 잠금 → 파일 다시 읽기 → 합치기 → 임시 파일 + 바꿔치기 (여러 게임이 같은 파일을 써도 기록을 잃지 않음)
+    - refresh(): 다른 게임이 파일을 바꿨을 때만 다시 읽음 (os.stat 한 번)
+    """
+
+    def __init__(self, path=None, limit=10, lock_timeout=None):
+        """
+        Args:
+            path: 하이스코어 JSON 파일 경로 (기본값: config.HIGHSCORES_FILE)
+            limit: 보관할 기록 수 (TOP 10)
+            lock_timeout: 파일 잠금을 기다릴 최대 시간 (초, 기본값: config.HIGHSCORES_LOCK_TIMEOUT)
+        """
+        self.path = path or config.HIGHSCORES_FILE
+        self.limit = limit
+        self.lock_timeout = config.HIGHSCORES_LOCK_TIMEOUT if lock_timeout is None else lock_timeout
+        self.version = 0          # 기록이 바뀔 때마다 1 증가
+        self._records = None      # 정렬된 기록 (None = 아직 읽지 않음)
+        self._lines = None        # (version, 표 문자열 목록)
+        self._stamp = None        # 마지막으로 읽거나 쓴 파일의 _file_stamp()
+
+    @property
+    def records(self):
+        """정렬된 상위 기록 목록 (처음 접근할 때만 파일을 읽음)."""
+        if self._records is None:
+            self.load()
+        return self._records
+
+    def load(self):
+        """파일에서 기록을 다시 읽습니다 (없거나 읽기 실패 시 빈 목록)."""
+        records = []
+        self._stamp = _file_stamp(self.path)
+        try:
+            records = _read_records(self.path)
+        except (OSError, ValueError) as e:
+            # 파일은 그대로 둠 - 다음 save()가 옆으로 옮겨 두고 새로 씀
+            _log.warning("⚠️ 하이스코어 로드 실패: %s", e)
+        records.sort(key=_sort_key)
+        self._records = records[:self.limit]
+        self.version += 1
+        return self._records
+
+    def refresh(self):
+        """
+        다른 게임이 파일을 바꿨으면 다시 읽습니다.
+
+        Returns:
+            bool: 다시 읽었으면 True
+        """
+        if self._records is not None and _file_stamp(self.path) == self._stamp:
+            return False
+        self.load()
+        return True
+
+    def _read_for_merge(self):
+        """잠금을 잡은 상태에서 파일 기록을 읽음 (깨진 파일은 .corrupt로 옮기고 빈 목록)"""
+        try:
+            return _read_records(self.path)
+        except (OSError, ValueError) as e:
+            backup = self.path + ".corrupt"
+            _log.warning("⚠️ 하이스코어 파일이 깨져 있어 %s로 옮기고 새로 씁니다: %s", backup, e)
+            with contextlib.suppress(OSError):
+                os.replace(self.path, backup)
+            return []
+
+    def save(self):
+        """
+        현재 기록을 파일에 저장합니다 (상위 limit개만).
+
+        잠금을 잡고 파일을 다시 읽어, 다른 게임이 그 사이 남긴 기록과 합친 뒤 씁니다.
+        합친 결과가 메모리 기록이 됩니다.
+        """
+        try:
+            with _file_lock(self.path, self.lock_timeout):
+                merged = {}
+                for record in self._read_for_merge() + list(self.records):
+                    merged.setdefault(_record_id(record), record)
+                records = sorted(merged.values(), key=_sort_key)[:self.limit]
+                _atomic_write(self.path, records)
+                self._stamp = _file_stamp(self.path)
+            self._records = records
+        except Exception as e:
+            # 저장하지 못해도 이번 실행 동안은 메모리의 기록을 보여 줌
+            _log.warning("⚠️ 하이스코어 저장 실패: %s", e)
+        self.version += 1
+
+    def add(self, name, score, elapsed_seconds):
+        """
+        기록을 추가하고 파일에 저장합니다.
+
+        Args:
+            name: 플레이어 이름 (PLAYER_NAME_MAX_LENGTH로 잘림)
+            score: 최종 점수
+            elapsed_seconds: 플레이 시간 (초)
+        """
+        records = self.records
+        records.append({
+            "id": uuid.uuid4().hex,  # 여러 게임의 기록을 합칠 때 같은 기록인지 구분
+            "name": name[:config.PLAYER_NAME_MAX_LENGTH],
+            "score": score,
+            "time": round(elapsed_seconds, 2),
+        })
+        records.sort(key=_sort_key)
+        del records[self.limit:]
+        self.save()
+
+    def is_top10_score(self, score, elapsed_seconds):
+        """현재 점수가 TOP 10(상위 limit개)에 실제로 들어가는지 여부"""
+        records = self.records
+        if len(records) < self.limit:
+            return True
+        return self._beats(records[-1], score, elapsed_seconds)
+
+    @staticmethod
+    def _beats(last, score, elapsed_seconds):
+        """마지막 기록보다 점수가 높거나, 점수가 같고 시간이 더 빠르면 진입"""
+        last_score, last_time = _sort_key(last)
+        if score > -last_score:
+            return True
+        if score == -last_score and elapsed_seconds < last_time:
+            return True
+        return False
+
+    def table_lines(self):
+        """
+        화면에 표시할 "순위. 이름 - 점수점 (시간초)" 문자열 목록을 반환합니다.
+
+        version이 바뀌지 않으면 이전에 만든 목록을 그대로 돌려줍니다.
+        """
+        records = self.records
+        if self._lines is None or self._lines[0] != self.version:
+            lines = []
+            for idx, rec in enumerate(records, start=1):
+                name = str(rec.get("name", "???"))[:config.PLAYER_NAME_MAX_LENGTH]
+                score_val = int(rec.get("score", 0))
+                t = int(float(rec.get("time", 0)))
+                lines.append(f"{idx}. {name} - {score_val}점 ({t}초)")
+            self._lines = (self.version, lines)
+        return self._lines[1]
+
+    def close(self):
+        """열어 둔 자원을 정리합니다 (JSON 방식은 할 일 없음)."""
+
+
+class SQLiteHighScoreStore(HighScoreStore):
+    """
+    하이스코어 SQLite 저장소 (HighScoreStore와 같은 사용법)
+
+    - 모든 기록을 scores 테이블에 쌓고 (잘라내지 않음), 화면에는 상위 limit개만 읽어 둠
+    - (score DESC, time ASC) 인덱스로 상위 limit개 읽기와 TOP 10 진입 여부가 정렬 없이 인덱스 탐색
+    - 여러 게임이 함께 써도 SQLite의 잠금과 트랜잭션이 순서를 맞춤 (busy면 lock_timeout초까지 기다림)
+    - refresh(): PRAGMA data_version으로 다른 게임이 기록을 남겼을 때만 다시 읽음
+    - DB가 비어 있으면 import_from(기존 JSON 하이스코어 파일)의 기록을 가져옴
+    """
+
+    def __init__(self, path=None, limit=10, lock_timeout=None, import_from=None):
+        """
+        Args:
+            path: SQLite DB 파일 경로 (기본값: config.HIGHSCORES_DB)
+            limit: 화면에 보여 줄 기록 수 (TOP 10)
+            lock_timeout: 다른 게임이 쓰는 중일 때 기다릴 최대 시간 (초, 기본값: config.HIGHSCORES_LOCK_TIMEOUT)
+            import_from: DB가 비어 있을 때 기록을 가져올 JSON 하이스코어 파일 (None이면 가져오지 않음)
+        """
+        super().__init__(path or config.HIGHSCORES_DB, limit, lock_timeout)
+        self.import_from = import_from
+        self._conn = None
+        self._data_version = None
+
+    def _connect(self):
+        """DB 연결 (처음 한 번만 테이블/인덱스를 만들고, import_from이 있으면 기존 JSON 기록을 가져옴)"""
+        if self._conn is None:
+            # 네트워크 폴더에서도 동작하도록 WAL 대신 기본 저널 모드를 씀
+            conn = sqlite3.connect(self.path, timeout=self.lock_timeout)
+            with conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS scores ("
+                             "id INTEGER PRIMARY KEY, name TEXT NOT NULL, score INTEGER NOT NULL, "
+                             "time REAL NOT NULL, created REAL NOT NULL)")
+                conn.execute("CREATE INDEX IF NOT EXISTS scores_rank ON scores (score DESC, time ASC)")
+            self._conn = conn
+            if self.import_from:
+                self._import_json()
+        return self._conn
+
+    def _import_json(self):
+        """DB가 비어 있으면 JSON 하이스코어 파일의 기록을 가져옴"""
+        conn = self._conn
+        if conn.execute("SELECT 1 FROM scores LIMIT 1").fetchone() is not None:
+            return
+        try:
+            records = _read_records(self.import_from)
+        except (OSError, ValueError) as e:
+            _log.warning("⚠️ 기존 하이스코어(JSON)를 가져오지 못했습니다: %s", e)
+            return
+        if records:
+            with conn:
+                conn.executemany("INSERT INTO scores (name, score, time, created) VALUES (?, ?, ?, ?)",
+                                 [(str(r.get("name", "???")), int(r.get("score", 0)), float(r.get("time", 0.0)),
+                                   time.time()) for r in records])
+            _log.info("🏆 기존 하이스코어 %d개를 %s로 가져왔습니다", len(records), self.path)
+
+    def load(self):
+        """DB에서 상위 limit개 기록을 다시 읽습니다 (실패 시 빈 목록)."""
+        records = []
+        try:
+            conn = self._connect()
+            rows = conn.execute("SELECT name, score, time FROM scores ORDER BY score DESC, time ASC LIMIT ?",
+                                (self.limit,)).fetchall()
+            records = [{"name": name, "score": score, "time": t} for name, score, t in rows]
+            self._data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        except sqlite3.Error as e:
+            _log.warning("⚠️ 하이스코어 로드 실패: %s", e)
+        self._records = records
+        self.version += 1
+        return self._records
+
+    def refresh(self):
+        """다른 게임이 기록을 남겼으면 다시 읽습니다 (PRAGMA data_version 비교)."""
+        if self._records is not None:
+            try:
+                if self._connect().execute("PRAGMA data_version").fetchone()[0] == self._data_version:
+                    return False
+            except sqlite3.Error as e:
+                _log.warning("⚠️ 하이스코어 확인 실패: %s", e)
+                return False
+        self.load()
+        return True
+
+    def save(self):
+        """기록은 add()할 때마다 DB에 바로 들어가므로 다시 읽기만 합니다."""
+        self.load()
+
+    def add(self, name, score, elapsed_seconds):
+        """기록을 DB에 추가하고 상위 limit개를 다시 읽습니다 (HighScoreStore.add와 같은 인자)."""
+        try:
+            with self._connect() as conn:
+                conn.execute("INSERT INTO scores (name, score, time, created) VALUES (?, ?, ?, ?)",
+                             (name[:config.PLAYER_NAME_MAX_LENGTH], score, round(elapsed_seconds, 2), time.time()))
+        except sqlite3.Error as e:
+            _log.warning("⚠️ 하이스코어 저장 실패: %s", e)
+        self.load()
+
+    def is_top10_score(self, score, elapsed_seconds):
+        """
+        현재 점수가 TOP 10(상위 limit개)에 들어가는지 여부
+
+        인덱스 순서로 limit번째 기록 하나만 찾아 비교합니다 (다른 게임이 남긴 기록까지 반영).
+        """
+        try:
+            last = self._connect().execute(
+                "SELECT score, time FROM scores ORDER BY score DESC, time ASC LIMIT 1 OFFSET ?",
+                (self.limit - 1,)).fetchone()
+        except sqlite3.Error as e:
+            _log.warning("⚠️ 하이스코어 확인 실패: %s", e)
+            return super().is_top10_score(score, elapsed_seconds)
+        if last is None:
+            return True
+        return self._beats({"score": last[0], "time": last[1]}, score, elapsed_seconds)
+
+    def count(self):
+        """DB에 쌓인 전체 기록 수"""
+        return self._connect().execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    def close(self):
+        """DB 연결을 닫습니다."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def open_store(backend=None, limit=10):
+    """
+    설정에 맞는 하이스코어 저장소를 만듭니다.
+
+    Args:
+        backend: "json" / "sqlite" (기본값: config.HIGHSCORES_BACKEND)
+
+    Raises:
+        ValueError: 알 수 없는 저장 방식
+    """
+    backend = backend or config.HIGHSCORES_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"알 수 없는 하이스코어 저장 방식: {backend}")
+    if backend == "sqlite":
+        # JSON에서 SQLite로 바꿔도 기존 TOP 10이 사라지지 않도록 처음 한 번 가져옴
+        return SQLiteHighScoreStore(config.HIGHSCORES_DB, limit, import_from=config.HIGHSCORES_FILE)
+    return HighScoreStore(config.HIGHSCORES_FILE, limit)
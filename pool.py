@@ -0,0 +1,151 @@
+# pool.py
+
+from collections import deque
+
+import config
+
+# ============================================================================
+# ♻️ 투사체 풀 (ProjectilePool)
+# ============================================================================
+# 스페이스바를 누를 때마다 Shuriken/GoldShuriken을, 보스가 공격할 때마다 Stone을
+# 새로 만들고, 화면 밖으로 나가거나 부딪히면 kill()로 버렸습니다.
+# 보스전처럼 투사체가 많을 때는 객체 생성과 GC 부담이 커집니다.
+#
+# 이 풀은 kill()된 투사체를 모아 두었다가, 다음 발사 때 reset()으로
+# 위치와 속도만 다시 설정해서 재사용합니다.
+#
+# kill()을 가로채지 않고, 새 투사체가 필요할 때 그룹에서 빠진(alive() == False)
+# 투사체를 모으는 방식이라 group.empty()로 한꺼번에 지운 경우도 회수됩니다.
+#
+# 회수(collect)는 살아 있는 투사체를 전부 훑으므로(O(live)) 틱마다 한 번만 합니다.
+# 세션이 틱을 시작할 때 begin_tick()을 부르면, 그 틱의 첫 acquire()에서만 회수하고
+# 같은 틱 안의 나머지 acquire()(탄막 한 번에 돌 수십 개)는 쉬는 목록만 봅니다.
+# 이번 틱에 kill()된 투사체는 다음 틱부터 재사용됩니다.
+
+
+class ProjectilePool:
+    """
+    투사체 스프라이트 재사용 풀
+
+    주요 기능:
+    - acquire(x, y): 쉬고 있는 투사체를 reset()해서 꺼내거나, 없으면 새로 만듦
+    - 풀이 관리하는 투사체 수는 최대 cap개
+    - cap에 도달했을 때의 처리(overflow):
+        "grow"    - 풀 밖에서 새로 만들어 줌 (재사용되지 않음)
+        "drop"    - 만들지 않고 None 반환 (발사 취소)
+        "recycle" - 가장 오래된 투사체를 회수해서 재사용
+    - begin_tick(): 새 틱 시작 (다음 acquire()에서 한 번 회수)
+    - stats(): 살아 있는 수, 쉬고 있는 수, 재사용으로 아낀 생성 횟수 등
+
+    풀에 넣을 클래스는 __init__(x, y)와 reset(x, y)를 가져야 합니다.
+    """
+
+    OVERFLOW_POLICIES = ("grow", "drop", "recycle")
+
+    def __init__(self, sprite_class, groups, cap=None, overflow=None):
+        """
+        Args:
+            sprite_class: 투사체 클래스 (Shuriken, GoldShuriken, Stone)
+            groups: 꺼낸 투사체를 넣을 스프라이트 그룹들
+            cap: 풀이 관리할 최대 투사체 수 (기본값: config.PROJECTILE_POOL_CAP)
+            overflow: cap 초과 시 처리 방식 (기본값: config.PROJECTILE_POOL_OVERFLOW)
+        """
+        overflow = overflow or config.PROJECTILE_POOL_OVERFLOW
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"알 수 없는 overflow 처리 방식: {overflow}")
+        self.sprite_class = sprite_class
+        self.groups = tuple(groups)
+        self.cap = cap or config.PROJECTILE_POOL_CAP
+        self.overflow = overflow
+        self._live = deque()  # 꺼내 준 투사체 (오래된 순서, "recycle"은 왼쪽부터 꺼냄)
+        self._free = []       # 회수되어 쉬고 있는 투사체
+        self._collected = False  # 이번 틱에 이미 회수했는지 (begin_tick()에서 False로)
+
+        # ===== 통계 =====
+        self.allocations = 0  # 새로 만든 횟수 (풀 밖에서 만든 것 포함)
+        self.reuses = 0       # 재사용한 횟수 (= 아낀 생성 횟수)
+        self.overflows = 0    # cap에 걸린 횟수
+        self.dropped = 0      # "drop" 처리로 만들지 않은 횟수
+
+    def collect(self):
+        """
+        그룹에서 빠진(kill()/empty()된) 투사체를 쉬는 목록으로 회수합니다.
+
+        Returns:
+            int: 회수한 투사체 수
+        """
+        self._collected = True
+        live = self._live
+        if not live:
+            return 0
+        still_alive = deque(sprite for sprite in live if sprite.alive())
+        collected = len(live) - len(still_alive)
+        if collected:
+            self._free.extend(sprite for sprite in live if not sprite.alive())
+            self._live = still_alive
+        return collected
+
+    def begin_tick(self):
+        """새 틱을 시작합니다. 이번 틱의 첫 acquire()에서 쉬는 목록이 비어 있으면 한 번 회수합니다."""
+        self._collected = False
+
+    def acquire(self, x, y, **kwargs):
+        """
+        (x, y)에 투사체를 하나 준비해서 그룹에 넣고 반환합니다.
+
+        kwargs는 투사체 생성자와 reset()에 그대로 넘깁니다 (예: Stone의 velocity).
+
+        Returns:
+            투사체 스프라이트 ("drop" 처리로 만들지 않았으면 None)
+        """
+        if not self._free and not self._collected:
+            self.collect()
+
+        if self._free:
+            sprite = self._free.pop()
+        elif len(self._live) < self.cap:
+            sprite = None  # 아래에서 새로 만듦
+        else:
+            self.overflows += 1
+            if self.overflow == "drop":
+                self.dropped += 1
+                return None
+            if self.overflow == "grow":
+                # 풀이 관리하지 않는 투사체 (kill()되면 그대로 버려짐)
+                self.allocations += 1
+                sprite = self.sprite_class(x, y, **kwargs)
+                sprite.add(*self.groups)
+                return sprite
+            # "recycle": 가장 오래된 투사체를 회수해서 재사용
+            sprite = self._live.popleft()
+            sprite.kill()
+
+        if sprite is None:
+            self.allocations += 1
+            sprite = self.sprite_class(x, y, **kwargs)
+        else:
+            self.reuses += 1
+            sprite.reset(x, y, **kwargs)
+            # 직전 생애의 보간 위치가 남아 있으면 엉뚱한 곳에서 날아오는 것처럼 그려짐
+            sprite.prev_pos = None
+        sprite.add(*self.groups)
+        self._live.append(sprite)
+        return sprite
+
+    def stats(self):
+        """
+        풀 통계를 반환합니다.
+
+        Returns:
+            dict: live, pooled, allocations, allocations_avoided, overflows, dropped
+                  (live/pooled는 풀이 관리하는 투사체만 셈, "grow"로 만든 것은 제외)
+        """
+        self.collect()
+        return {
+            "live": len(self._live),
+            "pooled": len(self._free),
+            "allocations": self.allocations,
+            "allocations_avoided": self.reuses,
+            "overflows": self.overflows,
+            "dropped": self.dropped,
+        }
@@ -0,0 +1,235 @@
+# profiler.py
+
+import json
+import os
+import time
+from collections import deque
+
+import pygame
+
+import config
+
+# ============================================================================
+# ⏱️ 프레임 프로파일러 (FrameProfiler)
+# ============================================================================
+# 프레임이 떨어질 때 범인이 스프라이트 update()인지, 수리검 충돌 검사인지,
+# 플레이어 충돌 검사 세 번(적, 마우스, 돌)인지, 배경 그리기나 display.flip()인지
+# 알 수 있도록 메인 루프의 단계(phase)마다 시간을 잽니다.
+#
+# 사용 방법 (한 프레임):
+#     profiler.begin_frame()
+#     ... 입력 처리 ...
+#     profiler.lap("events")       # 직전 lap() 이후 걸린 시간을 "events"에 기록
+#     ... 그리기 ...
+#     profiler.lap("draw")
+#     profiler.end_frame()
+#
+# GameSession.profiler에 넣어 두면 틱 안의 단계(update, spawn, collision.*)도 같은 방식으로 기록됩니다.
+# 프로파일러가 없으면(None) 각 단계는 "if profiler is not None" 검사 한 번만 하므로 부담이 없습니다.
+#
+# - draw_overlay(): 최근 프레임 시간 그래프 (단계별 색으로 쌓은 막대 + 프레임 예산 선)
+# - export_chrome_trace(): 프레임별 단계 시간을 Chrome trace-event JSON으로 저장
+#   (chrome://tracing 또는 https://ui.perfetto.dev 에서 열어 볼 수 있음)
+
+# 단계 이름 순서대로 돌려 쓰는 그래프 색상
+_PALETTE = (
+    (80, 160, 255),   # 파랑
+    (255, 170, 60),   # 주황
+    (110, 220, 110),  # 초록
+    (240, 90, 90),    # 빨강
+    (190, 120, 255),  # 보라
+    (250, 230, 90),   # 노랑
+    (90, 220, 220),   # 청록
+    (255, 130, 200),  # 분홍
+    (180, 180, 180),  # 회색
+)
+
+
+class FrameProfiler:
+    """
+    메인 루프 단계별 시간 측정기
+
+    주요 기능:
+    - begin_frame() / lap(name) / end_frame(): 프레임 안의 단계별 시간 기록
+    - skip(): 재고 싶지 않은 구간(대기 등)을 다음 lap()에서 빼기
+    - totals: 단계별 누적 시간(초), frames: 기록한 프레임 수
+    - history: 최근 프레임들의 (프레임 ms, {단계: ms}) (그래프용)
+    - draw_overlay(): 화면 오른쪽 위에 프레임 시간 그래프
+    - export_chrome_trace(): 최근 프레임들의 Chrome trace-event JSON 저장
+
+    같은 이름으로 한 프레임에 여러 번 lap()하면 (예: 프레임 하나에 틱 두 번) 시간이 더해집니다.
+    """
+
+    def __init__(self, history=None, trace_frames=None):
+        """
+        Args:
+            history: 그래프에 보여 줄 최근 프레임 수 (기본값: config.PROFILER_HISTORY)
+            trace_frames: trace로 내보낼 수 있게 보관할 최근 프레임 수 (기본값: config.PROFILER_TRACE_FRAMES)
+        """
+        self.history = deque(maxlen=history or config.PROFILER_HISTORY)
+        self.totals = {}     # 단계 이름 -> 누적 시간 (초)
+        self.frames = 0      # end_frame() 횟수
+        self.budget_ms = 1000.0 / config.FPS  # 프레임 예산 (그래프의 기준선)
+        self._trace = deque(maxlen=trace_frames or config.PROFILER_TRACE_FRAMES)
+        self._colors = {}    # 단계 이름 -> 그래프 색상 (처음 나온 순서대로)
+        self._origin = time.perf_counter()  # trace 시간 기준점
+        self._frame_start = None
+        self._last = 0.0
+        self._phases = {}    # 이번 프레임의 단계 -> 초
+        self._spans = []     # 이번 프레임의 (단계, 시작, 끝)
+
+    def begin_frame(self):
+        """새 프레임 측정을 시작합니다."""
+        now = time.perf_counter()
+        self._frame_start = now
+        self._last = now
+        self._phases = {}
+        self._spans = []
+
+    def lap(self, name):
+        """직전 lap()(또는 begin_frame()) 이후 걸린 시간을 name 단계로 기록합니다."""
+        if self._frame_start is None:
+            return  # begin_frame() 전 (헤드리스에서 틱만 돌리는 경우 등)
+        now = time.perf_counter()
+        self._phases[name] = self._phases.get(name, 0.0) + now - self._last
+        self._spans.append((name, self._last, now))
+        self._last = now
+
+    def skip(self):
+        """직전 lap() 이후의 시간을 어느 단계에도 넣지 않고 버립니다."""
+        self._last = time.perf_counter()
+
+    def end_frame(self):
+        """
+        프레임 측정을 끝내고 기록합니다.
+
+        Returns:
+            float: 프레임 시간 (ms, begin_frame()부터 지금까지)
+        """
+        if self._frame_start is None:
+            return 0.0
+        end = time.perf_counter()
+        frame_ms = (end - self._frame_start) * 1000.0
+        totals = self.totals
+        for name, seconds in self._phases.items():
+            totals[name] = totals.get(name, 0.0) + seconds
+            if name not in self._colors:
+                self._colors[name] = _PALETTE[len(self._colors) % len(_PALETTE)]
+        self.history.append((frame_ms, {name: seconds * 1000.0 for name, seconds in self._phases.items()}))
+        self._trace.append((self.frames, self._frame_start, end, self._spans))
+        self.frames += 1
+        self._frame_start = None
+        return frame_ms
+
+    def averages(self):
+        """
+        최근 프레임들의 평균 시간 (ms)
+
+        Returns:
+            tuple: (평균 프레임 ms, {단계: 평균 ms} - 오래 걸린 순서)
+        """
+        if not self.history:
+            return 0.0, {}
+        count = len(self.history)
+        frame_total = 0.0
+        phase_total = {}
+        for frame_ms, phases in self.history:
+            frame_total += frame_ms
+            for name, ms in phases.items():
+                phase_total[name] = phase_total.get(name, 0.0) + ms
+        ordered = sorted(phase_total.items(), key=lambda item: -item[1])
+        return frame_total / count, {name: ms / count for name, ms in ordered}
+
+    # ------------------------------------------------------------------
+    # 화면 오버레이
+    # ------------------------------------------------------------------
+
+    def draw_overlay(self, surface, font, pos=None, size=(240, 100)):
+        """
+        최근 프레임 시간 그래프를 그립니다.
+
+        - 프레임마다 세로 막대 하나, 단계별 색으로 쌓음 (아래부터 begin_frame() 이후 순서)
+        - 가로 선: 프레임 예산 (1000 / config.FPS ms)
+        - 아래: 평균 프레임 시간과 오래 걸린 단계 목록
+
+        Args:
+            surface: 그릴 화면
+            font: 글자 폰트
+            pos: 왼쪽 위 좌표 (기본값: 화면 오른쪽 위)
+            size: 그래프 영역 크기 (너비, 높이)
+
+        Returns:
+            pygame.Rect: 그린 영역
+        """
+        width, height = size
+        average_ms, phases = self.averages()
+        line_height = font.get_linesize()
+        names = list(phases)[:5]
+        panel = pygame.Surface((width, height + line_height * (len(names) + 1) + 6), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+
+        # 세로 눈금: 예산의 2배까지 (넘는 막대는 잘림)
+        scale = height / (self.budget_ms * 2.0)
+        budget_y = height - int(self.budget_ms * scale)
+        bar_width = max(1, width // max(1, self.history.maxlen))
+        x = width - bar_width * len(self.history)
+        for frame_ms, frame_phases in self.history:
+            y = height
+            for name, ms in frame_phases.items():
+                bar = max(1, int(ms * scale)) if ms > 0 else 0
+                if bar:
+                    top = max(0, y - bar)
+                    panel.fill(self._colors.get(name, _PALETTE[-1]), (x, top, bar_width, y - top))
+                    y = top
+            x += bar_width
+        pygame.draw.line(panel, (255, 255, 255), (0, budget_y), (width, budget_y))
+
+        text_y = height + 3
+        fps = 1000.0 / average_ms if average_ms else 0.0
+        panel.blit(font.render(f"frame {average_ms:.2f} ms ({fps:.0f} fps)", True, (255, 255, 255)), (4, text_y))
+        for name in names:
+            text_y += line_height
+            panel.fill(self._colors.get(name, _PALETTE[-1]), (4, text_y + line_height // 4, 8, line_height // 2))
+            panel.blit(font.render(f"{name} {phases[name]:.2f}", True, (230, 230, 230)), (16, text_y))
+
+        if pos is None:
+            pos = (surface.get_width() - panel.get_width() - 10, 10)
+        return surface.blit(panel, pos)
+
+    # ------------------------------------------------------------------
+    # Chrome trace 내보내기
+    # ------------------------------------------------------------------
+
+    def trace_events(self):
+        """
+        보관 중인 프레임을 Chrome trace-event 목록으로 만듭니다.
+
+        프레임마다 "frame" 이벤트 하나와 그 안에 단계별 이벤트가 들어갑니다 (ph "X", 시간 단위 µs).
+        """
+        origin = self._origin
+        events = []
+        for index, start, end, spans in self._trace:
+            events.append({"name": "frame", "cat": "frame", "ph": "X", "pid": 1, "tid": 1,
+                           "ts": (start - origin) * 1e6, "dur": (end - start) * 1e6,
+                           "args": {"frame": index}})
+            for name, span_start, span_end in spans:
+                events.append({"name": name, "cat": name.split(".")[0], "ph": "X", "pid": 1, "tid": 1,
+                               "ts": (span_start - origin) * 1e6, "dur": (span_end - span_start) * 1e6})
+        return events
+
+    def export_chrome_trace(self, path=None):
+        """
+        보관 중인 프레임을 Chrome trace-event JSON 파일로 저장합니다.
+
+        Args:
+            path: 저장할 파일 (기본값: config.PROFILER_TRACE_DIR/trace_날짜_시간.json)
+
+        Returns:
+            str: 저장한 파일 경로
+        """
+        if path is None:
+            os.makedirs(config.PROFILER_TRACE_DIR, exist_ok=True)
+            path = os.path.join(config.PROFILER_TRACE_DIR, f"trace_{time.strftime('%Y%m%d_%H%M%S')}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}, f)
+        return path
@@ -0,0 +1,213 @@
+# recorder.py
+
+import os
+import queue
+import subprocess
+import threading
+import time
+
+import pygame
+
+import config
+import gamelog
+
+try:
+    import numpy as np
+except ImportError:  # pygame.surfarray가 numpy를 쓰므로 numpy가 없으면 녹화할 수 없음
+    np = None
+
+# ============================================================================
+# 🎥 게임 화면 녹화기 (FrameRecorder)
+# ============================================================================
+# QA가 게임 화면을 녹화하려면 외부 화면 녹화 프로그램을 써야 했습니다.
+# 이 녹화기는 매 프레임 present() 뒤의 screen Surface를 받아 파일로 저장합니다.
+#
+# 게임 루프를 멈추지 않도록:
+#   1. capture()는 pygame.surfarray.pixels3d()로 screen의 픽셀 메모리를 복사 없이 view로 잡고,
+#      미리 만들어 둔 프레임 버퍼(slot) 하나에 한 번에 복사만 합니다 (프레임마다 새 배열을 만들지 않음).
+#      screen은 다음 프레임에 바로 다시 그려지므로 이 한 번의 복사는 비동기 저장에 꼭 필요합니다.
+#   2. 채운 slot 번호를 크기가 정해진 큐로 백그라운드 쓰기 스레드에 넘깁니다.
+#   3. 쓰기 스레드가 느려서 빈 slot이 없으면 기다리지 않고 그 프레임을 버리고 dropped를 1 늘립니다.
+# 쓰기 스레드는 slot을 그대로(bytes로 바꾸지 않고) 파일/PNG/인코더 파이프에 넘긴 뒤 slot을 돌려줍니다.
+#
+# 저장 형식 (config.RECORDER_FORMAT):
+#   - "png":  폴더에 frame_000000.png, frame_000001.png ...
+#   - "raw":  폴더에 frames.rgb (RGB 24비트, 프레임을 이어 붙임) + info.txt (크기, FPS, ffmpeg 변환 명령)
+#   - "pipe": 인코더 프로세스(기본값 ffmpeg)의 표준 입력으로 raw RGB를 보내 동영상 파일로 바로 인코딩
+
+_log = gamelog.get_logger("render")
+
+FORMATS = ("png", "raw", "pipe")
+
+
+def available():
+    """녹화할 수 있는지 여부 (pygame.surfarray에 numpy가 필요)"""
+    return np is not None
+
+
+def _default_encoder(width, height, fps, path):
+    """raw RGB를 표준 입력으로 받아 H.264 동영상으로 저장하는 ffmpeg 명령"""
+    return ["ffmpeg", "-loglevel", "error", "-y",
+            "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{width}x{height}", "-r", str(fps), "-i", "-",
+            "-c:v", "libx264", "-pix_fmt", "yuv420p", path]
+
+
+def _unique_path(directory, suffix):
+    """
+    directory 안에 녹화 시각 이름의 새 폴더(suffix가 없을 때) 또는 빈 파일을 만들고 경로를 반환합니다.
+
+    같은 초에 녹화를 끝내고 다시 시작하면(F5 두 번) 이름 뒤에 _1, _2 ...를 붙입니다.
+    exist_ok=False / "x" 모드로 만들어서 이전 녹화를 덮어쓰지 않습니다.
+    """
+    stamp = time.strftime("%Y%m%d_%H%M%S")
+    count = 0
+    while True:
+        name = stamp if count == 0 else f"{stamp}_{count}"
+        path = os.path.join(directory, name + suffix)
+        try:
+            if suffix:
+                open(path, "x").close()  # 인코더가 덮어쓸 자리를 먼저 차지해 둠
+            else:
+                os.makedirs(path, exist_ok=False)
+            return path
+        except FileExistsError:
+            count += 1
+
+
+class FrameRecorder:
+    """
+    screen Surface 녹화기 (백그라운드 스레드에서 저장, 느리면 프레임을 버림)
+
+    주요 기능:
+    - capture(surface): 이번 프레임을 빈 slot에 복사해서 쓰기 스레드에 넘김 (빈 slot이 없으면 버림)
+    - stop(): 남은 프레임을 모두 쓰고 스레드/파일/인코더를 정리
+    - captured / written / dropped: 넘긴 프레임 수 / 저장한 프레임 수 / 버린 프레임 수
+    - path: 저장 위치 (폴더 또는 동영상 파일)
+    """
+
+    def __init__(self, size, fmt=None, directory=None, queue_size=None, fps=None, encoder=None):
+        """
+        Args:
+            size: 녹화할 화면 크기 (너비, 높이)
+            fmt: 저장 형식 "png" / "raw" / "pipe" (기본값: config.RECORDER_FORMAT)
+            directory: 녹화 파일을 만들 폴더 (기본값: config.RECORDER_DIR)
+            queue_size: 프레임 버퍼(slot) 수 = 쓰기 대기 최대 프레임 수 (기본값: config.RECORDER_QUEUE_SIZE)
+            fps: 동영상 FPS (기본값: config.FPS)
+            encoder: "pipe" 형식의 인코더 명령 목록, "{width}" "{height}" "{fps}" "{path}" 치환
+                     (기본값: config.RECORDER_ENCODER, None이면 ffmpeg)
+
+        Raises:
+            RuntimeError: numpy가 없음
+            ValueError: 알 수 없는 저장 형식
+            OSError: 폴더를 만들 수 없거나 인코더를 실행할 수 없음
+        """
+        if np is None:
+            raise RuntimeError("화면 녹화에는 numpy가 필요합니다")
+        fmt = fmt or config.RECORDER_FORMAT
+        if fmt not in FORMATS:
+            raise ValueError(f"알 수 없는 녹화 형식: {fmt}")
+        self.format = fmt
+        self.size = tuple(size)
+        self.fps = fps or config.FPS
+        self.captured = 0
+        self.written = 0
+        self.dropped = 0
+        self.errors = 0
+
+        width, height = self.size
+        # 화면 메모리와 같은 (높이, 너비, RGB) 순서의 slot들 - 파일에 그대로 쓸 수 있음
+        slot_count = queue_size or config.RECORDER_QUEUE_SIZE
+        self._slots = [np.empty((height, width, 3), np.uint8) for _ in range(slot_count)]
+        self._free = queue.SimpleQueue()  # 비어 있는 slot 번호
+        for index in range(len(self._slots)):
+            self._free.put(index)
+        self._pending = queue.Queue(slot_count + 1)  # (프레임 번호, slot 번호), None = 끝 (slot 수 + 끝 표시)
+
+        directory = directory or config.RECORDER_DIR
+        os.makedirs(directory, exist_ok=True)
+        self._file = None
+        self._process = None
+        self.path = _unique_path(directory, ".mp4" if fmt == "pipe" else "")
+        if fmt == "pipe":
+            command = config.RECORDER_ENCODER if encoder is None else encoder
+            if command:
+                command = [part.format(width=width, height=height, fps=self.fps, path=self.path) for part in command]
+            else:
+                command = _default_encoder(width, height, self.fps, self.path)
+            self._process = subprocess.Popen(command, stdin=subprocess.PIPE)
+            self._file = self._process.stdin
+        elif fmt == "raw":
+            with open(os.path.join(self.path, "info.txt"), "w", encoding="utf-8") as f:
+                f.write(f"size {width}x{height}\nfps {self.fps}\npix_fmt rgb24\n")
+                f.write(f"ffmpeg -f rawvideo -pix_fmt rgb24 -s {width}x{height} -r {self.fps} "
+                        f"-i frames.rgb -pix_fmt yuv420p video.mp4\n")
+            self._file = open(os.path.join(self.path, "frames.rgb"), "wb")
+
+        self._thread = threading.Thread(target=self._write_loop, name="frame-writer", daemon=True)
+        self._thread.start()
+
+    def capture(self, surface):
+        """
+        이번 프레임을 녹화 대기열에 넣습니다 (게임 루프를 기다리게 하지 않음).
+
+        Returns:
+            bool: 넣었으면 True, 쓰기가 밀려서 버렸으면 False
+        """
+        try:
+            index = self._free.get_nowait()
+        except queue.Empty:
+            self.dropped += 1
+            return False
+        # pixels3d: 화면 픽셀 메모리의 (너비, 높이, RGB) view (복사 없음, view가 있는 동안 Surface가 잠김)
+        pixels = pygame.surfarray.pixels3d(surface)
+        np.copyto(self._slots[index], pixels.transpose(1, 0, 2))
+        del pixels  # Surface 잠금 해제
+        self._pending.put((self.captured, index))
+        self.captured += 1
+        return True
+
+    def _write_loop(self):
+        """쓰기 스레드: 대기열의 slot을 파일에 쓰고 다시 빈 slot으로 돌려줌"""
+        width, height = self.size
+        while True:
+            item = self._pending.get()
+            if item is None:
+                break
+            frame, index = item
+            slot = self._slots[index]
+            try:
+                if self.format == "png":
+                    # frombuffer는 slot 메모리를 그대로 쓰는 Surface (복사 없음)
+                    image = pygame.image.frombuffer(slot, (width, height), "RGB")
+                    pygame.image.save(image, os.path.join(self.path, f"frame_{frame:06d}.png"))
+                    del image
+                else:
+                    self._file.write(slot)  # 버퍼 프로토콜로 그대로 씀 (bytes 변환 없음)
+                self.written += 1
+            except (OSError, ValueError, pygame.error) as e:
+                # 인코더가 끝났거나 디스크가 가득 참: 이후 프레임도 버려지지만 게임은 계속
+                self.errors += 1
+                if self.errors == 1:
+                    _log.warning("⚠️ 녹화 프레임 저장 실패: %s", e)
+            self._free.put(index)
+
+    def stop(self):
+        """
+        남은 프레임을 모두 저장하고 녹화를 끝냅니다.
+
+        Returns:
+            dict: {"path", "captured", "written", "dropped", "errors"}
+        """
+        if self._thread is not None:
+            self._pending.put(None)
+            self._thread.join()
+            self._thread = None
+            if self._file is not None:
+                try:
+                    self._file.close()
+                except OSError:
+                    pass
+            if self._process is not None:
+                self._process.wait()
+        return {"path": self.path, "captured": self.captured, "written": self.written,
+                "dropped": self.dropped, "errors": self.errors}
@@ -0,0 +1,326 @@
+# render.py
+
+from collections import OrderedDict, namedtuple
+
+import pygame
+
+import config
+import gamelog
+
+# ============================================================================
+# 🎨 화면 그리기 도우미 (배경 캐시, 부분 갱신 렌더러)
+# ============================================================================
+# 산, 나무, 구름, 땅은 게임 내내 한 번도 바뀌지 않는데도
+# 예전에는 매 프레임 20번 가까이 pygame.draw를 호출해서 다시 그렸습니다.
+# BackgroundCache는 이 배경을 Surface 하나에 한 번만 그려 두고,
+# 매 프레임 blit 한 번으로 화면에 복사합니다.
+# 화면 크기나 테마(색상 묶음)가 바뀔 때만 다시 만듭니다.
+#
+# FrameRenderer는 그 배경 위에서 스프라이트가 움직인 부분만 지우고 다시 그려
+# 800x600 전체 대신 바뀐 영역만 화면에 보내는 모드(dirty)를 제공합니다.
+#
+# TextCache는 font.render() 결과를 (폰트, 문자열, 색상)별로 보관해서
+# 점수나 시간이 바뀌지 않은 HUD 글자를 매 프레임 다시 렌더링하지 않게 합니다.
+
+_log = gamelog.get_logger("render")
+_ONCE_PER_SEC = gamelog.every(config.LOG_RATE_LIMIT_MS)
+
+# 배경 색상 묶음 (namedtuple이라 캐시 키로 바로 쓸 수 있음)
+Theme = namedtuple("Theme", ["sky", "ground", "cloud", "mountain", "mountain_near", "trunk", "leaves"])
+
+DEFAULT_THEME = Theme(
+    sky=config.BACKGROUND_COLOR,   # 하늘 (화면 전체 배경색)
+    ground=config.GROUND_COLOR,    # 땅
+    cloud=(255, 255, 255),         # 흰색 구름
+    mountain=(120, 180, 120),      # 먼 산
+    mountain_near=(100, 150, 100), # 가까운 산
+    trunk=(100, 60, 20),           # 나무 기둥
+    leaves=(30, 120, 30),          # 나뭇잎
+)
+
+
+def draw_clouds(surface, theme=DEFAULT_THEME):
+    """배경에 구름을 그리는 함수"""
+    cloud_color = theme.cloud
+
+    # 구름 1 (왼쪽 위)
+    pygame.draw.ellipse(surface, cloud_color, (50, 80, 120, 60))
+    pygame.draw.ellipse(surface, cloud_color, (80, 70, 80, 50))
+    pygame.draw.ellipse(surface, cloud_color, (110, 90, 60, 40))
+
+    # 구름 2 (오른쪽 위)
+    pygame.draw.ellipse(surface, cloud_color, (600, 60, 100, 50))
+    pygame.draw.ellipse(surface, cloud_color, (630, 50, 70, 40))
+    pygame.draw.ellipse(surface, cloud_color, (660, 70, 50, 30))
+
+    # 구름 3 (중앙 위)
+    pygame.draw.ellipse(surface, cloud_color, (350, 100, 90, 45))
+    pygame.draw.ellipse(surface, cloud_color, (380, 90, 60, 35))
+    pygame.draw.ellipse(surface, cloud_color, (410, 105, 40, 25))
+
+
+def draw_background_elements(surface, theme=DEFAULT_THEME):
+    """산과 나무를 그리는 함수"""
+    # 산 그리기 (멀리, 큰 삼각형)
+    pygame.draw.polygon(surface, theme.mountain, [(100, config.HEIGHT-50), (300, 200), (500, config.HEIGHT-50)])
+    pygame.draw.polygon(surface, theme.mountain, [(400, config.HEIGHT-50), (600, 250), (800, config.HEIGHT-50)])
+    pygame.draw.polygon(surface, theme.mountain_near, [(0, config.HEIGHT-50), (120, 300), (250, config.HEIGHT-50)])
+
+    # 나무 그리기 (여러 개)
+    for x in [150, 250, 600, 700]:
+        # 나무 기둥
+        pygame.draw.rect(surface, theme.trunk, (x, config.HEIGHT-120, 20, 70))
+        # 나뭇잎 (원)
+        pygame.draw.ellipse(surface, theme.leaves, (x-20, config.HEIGHT-150, 60, 50))
+
+
+def draw_ground(surface, theme=DEFAULT_THEME):
+    """화면 아래쪽 땅을 그리는 함수"""
+    pygame.draw.rect(surface, theme.ground, (0, config.HEIGHT-50, config.WIDTH, 50))
+
+
+def draw_scenery(surface, theme=DEFAULT_THEME):
+    """하늘, 산, 나무, 구름, 땅을 순서대로 직접 그립니다 (캐시 없이)."""
+    surface.fill(theme.sky)
+    draw_background_elements(surface, theme)
+    draw_clouds(surface, theme)
+    draw_ground(surface, theme)
+
+
+class BackgroundCache:
+    """
+    미리 그려 둔 배경 Surface
+
+    주요 기능:
+    - 배경을 config.WIDTH x config.HEIGHT 기준으로 한 번만 그림
+    - 화면 크기가 다르면 한 번만 크기 조정 (좌표가 800x600 기준이므로)
+    - (화면 크기, 테마)가 바뀔 때만 다시 만듦
+    - 화면과 같은 픽셀 형식으로 convert()하여 blit을 최대한 빠르게
+    """
+
+    def __init__(self):
+        self.surface = None  # 완성된 배경 Surface
+        self.builds = 0      # 배경을 새로 만든 횟수 (통계용)
+        self._key = None     # (화면 크기, 테마)
+
+    def get(self, size, theme=DEFAULT_THEME):
+        """
+        (size, theme)에 맞는 배경 Surface를 반환합니다 (필요할 때만 다시 만듦).
+
+        Args:
+            size: 화면 크기 (너비, 높이)
+            theme: 배경 색상 묶음 (Theme)
+        """
+        key = (tuple(size), theme)
+        if self.surface is None or key != self._key:
+            self.surface = self._build(key[0], theme)
+            self._key = key
+            self.builds += 1
+        return self.surface
+
+    def _build(self, size, theme):
+        surface = pygame.Surface((config.WIDTH, config.HEIGHT))
+        draw_scenery(surface, theme)
+        if size != surface.get_size():
+            surface = pygame.transform.smoothscale(surface, size)
+        # 화면이 있으면 화면과 같은 픽셀 형식으로 변환 (blit 시 변환 비용 제거)
+        if pygame.display.get_init() and pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
+
+    def draw(self, screen, theme=DEFAULT_THEME):
+        """배경을 screen에 blit 한 번으로 그립니다."""
+        screen.blit(self.get(screen.get_size(), theme), (0, 0))
+
+    def invalidate(self):
+        """다음 draw()에서 배경을 다시 만들도록 캐시를 비웁니다."""
+        self.surface = None
+        self._key = None
+
+
+class FrameRenderer:
+    """
+    전체 갱신 / 부분 갱신(dirty rect)을 고를 수 있는 프레임 렌더러
+
+    - "full" 모드: 매 프레임 배경 전체를 blit하고 display.flip()으로 화면 전체를 보냄
+    - "dirty" 모드: 지난 프레임에 그린 영역만 배경으로 지우고, 이번에 그린 영역과 합쳐
+      display.update(rects)로 바뀐 부분만 보냄 (pygame.sprite.RenderUpdates와 같은 방식)
+
+    사용 방법 (매 프레임):
+        renderer.begin()              # 배경 준비
+        renderer.blit(image, pos)     # 그린 영역이 기록됨
+        renderer.mark(rect)           # pygame.draw 등으로 직접 그린 영역 기록
+        renderer.present()            # 화면에 반영
+
+    화면 구성이 통째로 바뀔 때(상태 전환, 모드 변경)는 invalidate()를 호출하면
+    다음 present()가 화면 전체를 갱신합니다.
+    """
+
+    MODES = ("full", "dirty")
+
+    def __init__(self, screen, background, mode="full"):
+        """
+        Args:
+            screen: 그릴 화면 Surface (pygame.display.set_mode()의 반환값)
+            background: 배경 캐시 (BackgroundCache)
+            mode: "full" 또는 "dirty"
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"알 수 없는 렌더링 모드: {mode}")
+        self.screen = screen
+        self.background = background
+        self.mode = mode
+        self.theme = DEFAULT_THEME
+        self.pixels_updated = 0  # 마지막 present()에서 화면에 보낸 픽셀 수
+        self.frames = 0          # present() 호출 횟수
+        self.total_pixels = 0    # 지금까지 보낸 픽셀 수 합계
+        self._drawn = []         # 이번 프레임에 그린 영역
+        self._previous = []      # 지난 프레임에 그린 영역 (dirty 모드에서 지울 영역)
+        self._full = True        # 다음 present()에서 화면 전체를 갱신해야 하는지
+
+    def set_mode(self, mode):
+        """렌더링 모드를 바꿉니다 ("full" 또는 "dirty")."""
+        if mode not in self.MODES:
+            raise ValueError(f"알 수 없는 렌더링 모드: {mode}")
+        self.mode = mode
+        self.invalidate()
+
+    def toggle_mode(self):
+        """full <-> dirty 모드를 전환하고 새 모드를 반환합니다."""
+        self.set_mode("dirty" if self.mode == "full" else "full")
+        return self.mode
+
+    def invalidate(self):
+        """다음 프레임은 배경부터 전부 다시 그리고 화면 전체를 갱신합니다."""
+        self._full = True
+
+    def begin(self):
+        """배경을 준비합니다 (full: 전체 배경, dirty: 지난 프레임에 그린 곳만 배경으로 지움)."""
+        if self.mode == "full" or self._full:
+            self.background.draw(self.screen, self.theme)
+            self._full = True
+        else:
+            background = self.background.get(self.screen.get_size(), self.theme)
+            for rect in self._previous:
+                self.screen.blit(background, rect, rect)
+
+    def blit(self, image, pos):
+        """image를 pos에 그리고 그린 영역을 기록합니다."""
+        rect = self.screen.blit(image, pos)
+        self._drawn.append(rect)
+        return rect
+
+    def mark(self, rect):
+        """직접 그린 영역(pygame.draw 반환값 등)을 기록합니다."""
+        if rect:
+            self._drawn.append(rect)
+
+    def present(self):
+        """
+        이번 프레임을 화면에 반영합니다.
+
+        Returns:
+            int: 화면에 보낸 픽셀 수 (dirty 모드에서는 겹친 영역이 중복 계산될 수 있음)
+        """
+        width, height = self.screen.get_size()
+        if self.mode == "full" or self._full:
+            pygame.display.flip()
+            pixels = width * height
+        else:
+            bounds = self.screen.get_rect()
+            # 지난 프레임 위치(지운 곳) + 이번 프레임 위치(그린 곳)를 모두 보내야 잔상이 남지 않음
+            rects = [rect.clip(bounds) for rect in self._previous + self._drawn]
+            rects = [rect for rect in rects if rect.width and rect.height]
+            if rects:
+                pygame.display.update(rects)
+            pixels = sum(rect.width * rect.height for rect in rects)
+
+        self._previous = self._drawn
+        self._drawn = []
+        self._full = False
+        self.pixels_updated = pixels
+        self.frames += 1
+        self.total_pixels += pixels
+        _log.debug("🖥️ %s 모드: 이번 프레임 %d픽셀 갱신", self.mode, pixels, extra=_ONCE_PER_SEC)
+        return pixels
+
+    def stats(self):
+        """
+        렌더러 통계를 반환합니다.
+
+        Returns:
+            dict: mode, pixels_updated(마지막 프레임), average_pixels(프레임 평균), frames
+        """
+        return {
+            "mode": self.mode,
+            "pixels_updated": self.pixels_updated,
+            "average_pixels": self.total_pixels // self.frames if self.frames else 0,
+            "frames": self.frames,
+        }
+
+
+class TextCache:
+    """
+    글자 렌더링 결과 캐시 (LRU)
+
+    주요 기능:
+    - (폰트, 문자열, 색상)이 같으면 이전에 만든 Surface를 그대로 반환
+    - 가장 오래 쓰지 않은 항목부터 지워 최대 capacity개만 보관
+      (시간 표시처럼 계속 바뀌는 문자열이 메모리를 무한히 차지하지 않음)
+    - hit/miss 통계 제공
+
+    반환되는 Surface는 공유되므로 직접 수정하면 안 됩니다.
+    """
+
+    def __init__(self, capacity=None):
+        """
+        Args:
+            capacity: 보관할 최대 항목 수 (기본값: config.TEXT_CACHE_SIZE)
+        """
+        self.capacity = capacity or config.TEXT_CACHE_SIZE
+        self._surfaces = OrderedDict()  # (폰트, 문자열, 색상) -> Surface
+        self.hits = 0       # 캐시에서 바로 돌려준 횟수
+        self.misses = 0     # font.render()를 호출한 횟수
+        self.evictions = 0  # 용량 초과로 지운 횟수
+
+    def render(self, font, text, color):
+        """
+        font.render(text, True, color)의 캐시된 결과를 반환합니다.
+
+        Args:
+            font: pygame.font.Font 객체
+            text: 표시할 문자열
+            color: 글자 색상 (RGB 튜플)
+        """
+        key = (font, text, tuple(color))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)  # 최근에 사용한 항목으로 표시
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.capacity:
+            self._surfaces.popitem(last=False)  # 가장 오래 쓰지 않은 항목 제거
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        """캐시를 비웁니다 (폰트를 바꿨을 때 등)."""
+        self._surfaces.clear()
+
+    def stats(self):
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            dict: hits, misses, evictions, entries
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._surfaces),
+        }
@@ -0,0 +1,354 @@
+# replay.py
+
+import argparse
+import os
+import struct
+import sys
+import time
+from collections import namedtuple
+
+import boss_patterns
+import config
+import gamelog
+from session import GameSession, PlayerInput
+
+# ============================================================================
+# 📼 리플레이 기록과 재생 (Replay)
+# ============================================================================
+# GameSession은 랜덤 시드와 틱마다의 입력(PlayerInput)만 같으면 항상 같은 게임을 만듭니다.
+# 그래서 화면이나 상태를 저장할 필요 없이 "시드 + 틱별 입력"만 기록하면
+# 버그 제보가 들어온 게임을 그대로 다시 돌려볼 수 있습니다.
+#
+# 파일 형식 (리틀 엔디언):
+#   헤더  : 매직 b"CNRP", 버전(1바이트), 시드(4바이트), 저장 방식(1바이트), 틱 속도(2바이트),
+#           충돌 판정 방식(1바이트, 버전 2부터 - 버전 1 파일은 "rect")
+#   패턴  : 보스 공격 패턴 이름 길이(1바이트) + 이름(UTF-8) + 패턴 내용 CRC32(4바이트)
+#           (버전 3부터 - 이전 파일은 기본 공격, 이름이 없으면 길이 0과 CRC 0)
+#   결과  : 틱 수(4바이트), 점수(4바이트), 스테이지(1바이트), 상태(1바이트)
+#   입력  : (입력 코드 1바이트, 반복 횟수 2바이트)의 반복 (같은 입력이 이어지면 한 번만 저장)
+#
+# 입력 코드 1바이트:
+#   비트 0: 왼쪽, 비트 1: 오른쪽, 비트 2: 점프, 비트 3~7: 이번 틱의 발사 횟수 (0 ~ 31)
+#
+# 결과를 함께 저장해 두므로, 게임 코드를 바꾼 뒤 리플레이 모음을 다시 돌려서
+# 결과가 달라진 게임을 찾는 회귀 테스트로도 쓸 수 있습니다 (python replay.py replays/).
+
+_log = gamelog.get_logger("game")
+
+MAGIC = b"CNRP"
+VERSION = 3
+FILE_SUFFIX = ".cnr"
+
+_HEADER_V1 = struct.Struct("<4sBIBH")
+_HEADER = struct.Struct("<4sBIBHB")
+_PATTERN_NAME = struct.Struct("<B")
+_PATTERN_DIGEST = struct.Struct("<I")
+_RESULT = struct.Struct("<IIBB")
+_RUN = struct.Struct("<BH")
+_MAX_RUN = 0xFFFF
+_MAX_THROWS = 31
+
+# 파일에 저장하는 번호 <-> 이름
+_BACKENDS = GameSession.BACKENDS
+_COLLISION_MODES = GameSession.COLLISION_MODES
+_STATES = ("playing", "stage_clear", "game_over", "game_clear")
+
+# 리플레이 한 개 (inputs는 틱마다 입력 코드 1바이트인 bytes)
+# collision_mode: 기록할 때의 config.COLLISION_MODE (판정 방식이 다르면 같은 입력이어도 결과가 달라짐)
+# boss_pattern / pattern_digest: 기록할 때의 config.BOSS_PATTERN과 그 패턴 내용의 CRC32 (boss_patterns.pattern_digest)
+Replay = namedtuple("Replay", ["seed", "backend", "tick_rate", "inputs", "result", "collision_mode",
+                               "boss_pattern", "pattern_digest"])
+
+# 기록을 끝냈을 때의 게임 결과 (재생 결과와 비교하는 기준)
+ReplayResult = namedtuple("ReplayResult", ["ticks", "score", "stage", "state"])
+
+
+def encode_input(inputs):
+    """PlayerInput -> 입력 코드 1바이트 (발사 횟수는 최대 31회로 자름)"""
+    return (bool(inputs.left)
+            | bool(inputs.right) << 1
+            | bool(inputs.jump) << 2
+            | min(int(inputs.throw), _MAX_THROWS) << 3)
+
+
+def decode_input(code):
+    """입력 코드 1바이트 -> PlayerInput"""
+    return PlayerInput(
+        left=bool(code & 1),
+        right=bool(code & 2),
+        jump=bool(code & 4),
+        throw=code >> 3,
+    )
+
+
+# 입력 코드는 256가지뿐이므로 재생할 때는 미리 만든 PlayerInput을 꺼내 씀
+_DECODED = tuple(decode_input(code) for code in range(256))
+
+
+def session_result(session):
+    """세션의 현재 결과 (틱 수, 점수, 스테이지, 상태)"""
+    return ReplayResult(session.tick_count, session.score, session.current_stage, session.state)
+
+
+class ReplayRecorder:
+    """
+    GameSession의 입력 기록기
+
+    session.recorder에 넣어 두면:
+    - session.reset()할 때 start()로 새 게임의 시드와 저장 방식을 기록하고
+    - session.tick()할 때마다 record()로 그 틱의 입력을 1바이트씩 쌓습니다.
+    finish()를 호출하면 지금까지의 기록을 Replay로 돌려줍니다.
+    """
+
+    def __init__(self):
+        self.seed = None
+        self.backend = None
+        self.collision_mode = None
+        self.boss_pattern = None
+        self.pattern_digest = 0
+        self._codes = bytearray()
+
+    def __len__(self):
+        return len(self._codes)
+
+    def start(self, session):
+        """새 게임 기록을 시작합니다 (이전 기록은 버림)."""
+        self.seed = session.seed
+        self.backend = session.backend
+        self.collision_mode = "mask" if session.pixel_collision else "rect"
+        self.boss_pattern = config.BOSS_PATTERN or None
+        self.pattern_digest = boss_patterns.pattern_digest(self.boss_pattern)
+        self._codes = bytearray()
+
+    def record(self, inputs):
+        """틱 하나의 입력을 기록합니다."""
+        if inputs.throw > _MAX_THROWS:
+            _log.warning("⚠️ 한 틱의 발사 횟수 %d회를 %d회로 잘라서 기록합니다", inputs.throw, _MAX_THROWS)
+        self._codes.append(encode_input(inputs))
+
+    def finish(self, session):
+        """
+        지금까지의 기록과 세션의 현재 결과로 Replay를 만듭니다.
+
+        Returns:
+            Replay
+        """
+        return Replay(self.seed, self.backend, config.TICK_RATE, bytes(self._codes), session_result(session),
+                      self.collision_mode, self.boss_pattern, self.pattern_digest)
+
+
+def to_bytes(replay):
+    """Replay -> 파일에 쓸 bytes"""
+    pattern_name = (replay.boss_pattern or "").encode("utf-8")
+    parts = [
+        _HEADER.pack(MAGIC, VERSION, replay.seed, _BACKENDS.index(replay.backend), replay.tick_rate,
+                     _COLLISION_MODES.index(replay.collision_mode)),
+        _PATTERN_NAME.pack(len(pattern_name)), pattern_name, _PATTERN_DIGEST.pack(replay.pattern_digest),
+        _RESULT.pack(replay.result.ticks, replay.result.score, replay.result.stage,
+                     _STATES.index(replay.result.state)),
+    ]
+    # 같은 입력이 이어지는 구간을 (코드, 반복 횟수) 하나로 저장 (run-length encoding)
+    inputs = replay.inputs
+    i = 0
+    while i < len(inputs):
+        code = inputs[i]
+        run = 1
+        while i + run < len(inputs) and inputs[i + run] == code and run < _MAX_RUN:
+            run += 1
+        parts.append(_RUN.pack(code, run))
+        i += run
+    return b"".join(parts)
+
+
+def from_bytes(data):
+    """
+    파일에서 읽은 bytes -> Replay
+
+    Raises:
+        ValueError: 리플레이 파일이 아니거나 지원하지 않는 버전
+    """
+    if len(data) < _HEADER_V1.size + _RESULT.size:
+        raise ValueError("리플레이 파일이 너무 짧습니다")
+    magic, version, seed, backend, tick_rate = _HEADER_V1.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("리플레이 파일이 아닙니다")
+    # 버전 1에는 충돌 판정 방식이, 버전 2까지는 보스 패턴이 없음 (그 기능이 생기기 전의 기본값)
+    boss_pattern, pattern_digest = None, 0
+    if version == 1:
+        header_size, collision_mode = _HEADER_V1.size, "rect"
+    elif version in (2, VERSION):
+        if len(data) < _HEADER.size + _RESULT.size:
+            raise ValueError("리플레이 파일이 너무 짧습니다")
+        header_size = _HEADER.size
+        collision_mode = _COLLISION_MODES[_HEADER.unpack_from(data, 0)[5]]
+        if version == VERSION:
+            (length,) = _PATTERN_NAME.unpack_from(data, header_size)
+            name_end = header_size + _PATTERN_NAME.size + length
+            if len(data) < name_end + _PATTERN_DIGEST.size + _RESULT.size:
+                raise ValueError("리플레이 파일이 너무 짧습니다")
+            boss_pattern = data[header_size + _PATTERN_NAME.size:name_end].decode("utf-8") or None
+            (pattern_digest,) = _PATTERN_DIGEST.unpack_from(data, name_end)
+            header_size = name_end + _PATTERN_DIGEST.size
+    else:
+        raise ValueError(f"지원하지 않는 리플레이 버전: {version}")
+    ticks, score, stage, state = _RESULT.unpack_from(data, header_size)
+    body = data[header_size + _RESULT.size:]
+    if len(body) % _RUN.size:
+        raise ValueError("리플레이 입력 데이터가 잘렸습니다")
+    inputs = b"".join(bytes((code,)) * run for code, run in _RUN.iter_unpack(body))
+    return Replay(seed, _BACKENDS[backend], tick_rate, inputs,
+                  ReplayResult(ticks, score, stage, _STATES[state]), collision_mode, boss_pattern, pattern_digest)
+
+
+def save(replay, directory=None, keep=None):
+    """
+    리플레이를 directory(기본값: config.REPLAY_DIR)에 새 파일로 저장합니다.
+
+    저장한 뒤 폴더의 리플레이가 keep개(기본값: config.REPLAY_KEEP)보다 많으면
+    가장 오래된 것부터 지웁니다 (플레이어 컴퓨터에서 폴더가 끝없이 커지지 않도록).
+
+    Returns:
+        str: 저장한 파일 경로
+    """
+    directory = directory or config.REPLAY_DIR
+    os.makedirs(directory, exist_ok=True)
+    name = f"{time.strftime('%Y%m%d_%H%M%S')}_{replay.seed}{FILE_SUFFIX}"
+    path = os.path.join(directory, name)
+    with open(path, "wb") as f:
+        f.write(to_bytes(replay))
+    prune(directory, config.REPLAY_KEEP if keep is None else keep)
+    return path
+
+
+def prune(directory, keep):
+    """
+    directory의 리플레이 중 최근 keep개만 남기고 지웁니다 (keep이 0이면 모두 남김).
+
+    파일 이름이 저장 시각으로 시작하므로 이름 순서가 오래된 순서입니다.
+
+    Returns:
+        int: 지운 파일 수
+    """
+    if keep <= 0:
+        return 0
+    names = sorted(name for name in os.listdir(directory) if name.endswith(FILE_SUFFIX))
+    removed = 0
+    for name in names[:-keep]:
+        try:
+            os.remove(os.path.join(directory, name))
+            removed += 1
+        except OSError as e:
+            _log.warning("⚠️ 오래된 리플레이를 지우지 못했습니다: %s", e)
+    return removed
+
+
+def load(path):
+    """리플레이 파일을 읽어 Replay로 반환합니다."""
+    with open(path, "rb") as f:
+        return from_bytes(f.read())
+
+
+def play(replay, backend=None):
+    """
+    리플레이를 창 없이 최대 속도로 다시 실행합니다.
+
+    Args:
+        replay: Replay
+        backend: 엔티티 저장 방식 (기본값: 기록할 때의 방식)
+
+    Returns:
+        GameSession: 기록된 입력을 모두 실행한 세션
+
+    Raises:
+        ValueError: 기록할 때와 틱 속도(config.TICK_RATE), 충돌 판정 방식(config.COLLISION_MODE),
+                    보스 패턴(config.BOSS_PATTERN과 그 내용)이 다름 (같은 입력이어도 결과가 달라짐)
+    """
+    if replay.tick_rate != config.TICK_RATE:
+        raise ValueError(f"틱 속도가 다릅니다 (리플레이: {replay.tick_rate}, 현재: {config.TICK_RATE})")
+    if replay.collision_mode != config.COLLISION_MODE:
+        raise ValueError(f"충돌 판정 방식이 다릅니다 (리플레이: {replay.collision_mode}, "
+                         f"현재: {config.COLLISION_MODE})")
+    boss_pattern = config.BOSS_PATTERN or None
+    if replay.boss_pattern != boss_pattern:
+        raise ValueError(f"보스 패턴이 다릅니다 (리플레이: {replay.boss_pattern}, 현재: {boss_pattern})")
+    if replay.pattern_digest != boss_patterns.pattern_digest(boss_pattern):
+        raise ValueError(f"보스 패턴 {boss_pattern}의 내용(config.BOSS_PATTERNS)이 기록할 때와 다릅니다")
+    session = GameSession(backend or replay.backend, seed=replay.seed)
+    tick = session.tick
+    for code in replay.inputs:
+        tick(_DECODED[code])
+    return session
+
+
+def verify(replay, backend=None):
+    """
+    리플레이를 다시 실행해서 기록된 결과와 같은지 확인합니다.
+
+    Returns:
+        tuple: (같으면 True, 재생 결과 ReplayResult)
+    """
+    result = session_result(play(replay, backend))
+    return result == replay.result, result
+
+
+def _replay_paths(paths):
+    """명령줄 인자(파일 또는 폴더) -> 리플레이 파일 목록"""
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith(FILE_SUFFIX):
+                    yield os.path.join(path, name)
+        else:
+            yield path
+
+
+def main(argv=None):
+    """
+    리플레이 파일(또는 폴더 안의 모든 리플레이)을 재생하고 결과를 표로 출력합니다.
+
+    사용법:
+        python replay.py replays/                 # 폴더 안의 리플레이 전부
+        python replay.py a.cnr b.cnr --backend numpy
+
+    Returns:
+        int: 결과가 다른 리플레이가 있거나 읽지 못하면 1, 모두 같으면 0
+    """
+    parser = argparse.ArgumentParser(description="리플레이 재생 + 결과 검증")
+    parser.add_argument("paths", nargs="*", help="리플레이 파일 또는 폴더 (기본: config.REPLAY_DIR)")
+    parser.add_argument("--backend", choices=GameSession.BACKENDS, default=None,
+                        help="엔티티 저장 방식 (기본: 기록된 방식)")
+    args = parser.parse_args(argv)
+    paths = list(_replay_paths(args.paths or [config.REPLAY_DIR]))
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # 이미지 로드에 필요한 디스플레이 (창은 띄우지 않음)
+    import pygame
+    pygame.init()
+    pygame.display.set_mode((config.WIDTH, config.HEIGHT))
+    gamelog.configure(console_level="WARNING")  # 재생 중 게임 로그는 숨김
+
+    failed = 0
+    print(f"{'파일':<36} | {'틱':>7} | {'점수':>6} | {'스테이지':>4} | {'상태':<10} | {'ms':>7} | 결과")
+    print("-" * 92)
+    for path in paths:
+        name = os.path.basename(path)
+        try:
+            replay = load(path)
+            start = time.perf_counter()
+            ok, result = verify(replay, args.backend)
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+        except (OSError, ValueError) as e:
+            failed += 1
+            print(f"{name:<36} | 읽기 실패: {e}")
+            continue
+        if not ok:
+            failed += 1
+        status = "OK" if ok else f"DIFF (기록: {tuple(replay.result)})"
+        print(f"{name:<36} | {result.ticks:>7} | {result.score:>6} | {result.stage:>4} | "
+              f"{result.state:<10} | {elapsed_ms:>7.1f} | {status}")
+    print(f"\n{len(paths)}개 중 {len(paths) - failed}개 일치")
+    pygame.quit()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+# scheduler.py
+
+import heapq
+from collections import namedtuple
+
+# ============================================================================
+# ⏰ 이벤트 스케줄러 (Scheduler)
+# ============================================================================
+# 예전에는 스폰 타이머(고양이, 마우스, 간식, puppy)와 보스의 공격/이동 타이머가
+# 각자 매 틱 "타이머 += TICK_MS; 간격을 넘었나?"를 검사했습니다.
+# 타이머가 늘어날수록 매 틱 하는 일도 늘어납니다.
+#
+# 이 스케줄러는 "몇 번째 틱에 무엇을 할지"를 힙(heapq)에 넣어 두고,
+# 매 틱 시간이 된 이벤트만 꺼내서 실행합니다.
+# 기다리는 이벤트가 몇 개든 매 틱 하는 일은 힙의 맨 앞을 한 번 보는 것뿐입니다.
+#
+# 시간 단위는 밀리초가 아니라 틱 번호(정수)입니다.
+# ticks_until()로 "기존 타이머가 몇 틱 만에 간격을 넘는지"를 미리 계산해 두므로
+# 예전 타이머와 정확히 같은 틱에 이벤트가 실행됩니다.
+
+# ===== 게임 이벤트 순서 =====
+# 같은 틱에 실행될 이벤트의 순서 (작을수록 먼저).
+# 예전 코드에서 보스 update() -> 스폰(고양이, 마우스, 간식, puppy) 순서로 검사하던 것과 같습니다.
+PRIORITY_BOSS_ATTACK = 0
+PRIORITY_BOSS_MOVE = 1
+PRIORITY_CAT = 10
+PRIORITY_MOUSE = 11
+PRIORITY_SNACK = 12
+PRIORITY_PUPPY = 13
+PRIORITY_STAGE_START = 20
+
+# 힙에 들어가는 이벤트 (due, priority, seq 순으로 정렬)
+# due: 실행할 틱 번호, seq: 같은 틱/같은 순서일 때 먼저 등록한 것부터
+Event = namedtuple("Event", ["due", "priority", "seq", "name", "action"])
+
+_ticks_cache = {}
+
+
+def ticks_until(interval_ms, tick_ms, inclusive=False, start=0):
+    """
+    "timer += tick_ms" 타이머가 interval_ms를 넘기까지 걸리는 틱 수를 반환합니다.
+
+    Args:
+        interval_ms: 간격 (밀리초)
+        tick_ms: 틱 1회의 길이 (밀리초)
+        inclusive: True면 "timer >= interval", False면 "timer > interval" 기준
+        start: 타이머 시작 값. 누적 시간(session.ticks)에서 시작 시각을 빼서 경과 시간을 재는
+               경우에는 누적 시간이 클수록 실수 오차가 달라지므로 시작 시각을 넘겨 줍니다.
+
+    실수 덧셈 오차까지 예전 타이머와 같도록 실제로 더해 보며 셉니다 (start가 0이면 결과를 캐시).
+    """
+    key = (interval_ms, tick_ms, inclusive)
+    ticks = _ticks_cache.get(key) if start == 0 else None
+    if ticks is None:
+        timer = start
+        ticks = 0
+        while True:
+            ticks += 1
+            timer += tick_ms
+            elapsed = timer - start
+            if elapsed > interval_ms or (inclusive and elapsed == interval_ms):
+                break
+        if start == 0:
+            _ticks_cache[key] = ticks
+    return ticks
+
+
+class Scheduler:
+    """
+    틱 번호 기반 이벤트 큐 (heapq)
+
+    주요 기능:
+    - at(due, ...) / after(ticks, ...): 이벤트 등록 (반환값으로 취소 가능)
+    - run_due(now, max_priority): now까지 시간이 된 이벤트만 순서대로 실행
+    - cancel(), cancel_named(): 이벤트 취소
+    - pending(): 기다리는 이벤트 목록 (디버그, 스폰 일정 확인용)
+    - snapshot() / restore(): 기다리는 이벤트 저장과 복원 (action은 이름으로 다시 연결)
+
+    이벤트의 action은 인자 없는 함수입니다. 실행 중에 새 이벤트를 등록해도 되고,
+    등록한 이벤트의 due가 now 이하면 같은 run_due() 안에서 이어서 실행됩니다.
+    """
+
+    def __init__(self):
+        self.now = 0          # 마지막으로 run_due()한 틱 번호
+        self._queue = []      # Event 힙
+        self._seq = 0         # 등록 순서 번호
+        self._cancelled = set()  # 취소된 이벤트의 seq (꺼낼 때 건너뜀)
+        self.executed = 0     # 실행한 이벤트 수 (통계)
+
+    def __len__(self):
+        return len(self._queue) - len(self._cancelled)
+
+    def at(self, due, name, action, priority=0):
+        """
+        due번째 틱에 실행할 이벤트를 등록합니다.
+
+        Returns:
+            int: 이벤트 번호 (cancel()에 사용)
+        """
+        self._seq += 1
+        heapq.heappush(self._queue, Event(due, priority, self._seq, name, action))
+        return self._seq
+
+    def after(self, ticks, name, action, priority=0):
+        """지금(now)부터 ticks틱 뒤에 실행할 이벤트를 등록합니다."""
+        return self.at(self.now + ticks, name, action, priority)
+
+    def cancel(self, seq):
+        """at()/after()가 돌려준 번호의 이벤트를 취소합니다."""
+        if seq is not None:
+            self._cancelled.add(seq)
+
+    def cancel_named(self, *names):
+        """
+        이름이 names 중 하나인 이벤트를 모두 취소합니다.
+
+        Returns:
+            dict: 이름 -> 취소된 이벤트 중 가장 빠른 due (일시정지 후 다시 등록할 때 사용)
+        """
+        removed = {}
+        kept = []
+        for event in self._queue:
+            if event.seq in self._cancelled:
+                continue
+            if event.name in names:
+                removed[event.name] = min(event.due, removed.get(event.name, event.due))
+            else:
+                kept.append(event)
+        heapq.heapify(kept)
+        self._queue = kept
+        self._cancelled.clear()
+        return removed
+
+    def clear(self):
+        """기다리는 이벤트를 모두 지웁니다 (now는 그대로)."""
+        self._queue = []
+        self._cancelled.clear()
+
+    def run_due(self, now, max_priority=None):
+        """
+        now번째 틱까지 시간이 된 이벤트를 (due, priority, 등록 순서)대로 실행합니다.
+
+        Args:
+            now: 현재 틱 번호
+            max_priority: 지정하면 priority가 이 값 이하인 이벤트까지만 실행
+                          (틱 안에서 단계를 나눠 실행할 때 사용)
+
+        Returns:
+            int: 실행한 이벤트 수
+        """
+        self.now = now
+        queue = self._queue
+        count = 0
+        while queue and queue[0].due <= now:
+            event = queue[0]
+            if max_priority is not None and event.priority > max_priority:
+                break
+            heapq.heappop(queue)
+            if event.seq in self._cancelled:
+                self._cancelled.discard(event.seq)
+                continue
+            event.action()
+            count += 1
+        self.executed += count
+        return count
+
+    def pending(self):
+        """
+        기다리는 이벤트 목록을 실행 순서대로 반환합니다.
+
+        Returns:
+            list: [(due, name), ...]
+        """
+        return [(event.due, event.name) for event in sorted(self._queue)
+                if event.seq not in self._cancelled]
+
+    def next_due(self, name):
+        """이름이 name인 다음 이벤트의 due (없으면 None)"""
+        dues = [event.due for event in self._queue if event.name == name and event.seq not in self._cancelled]
+        return min(dues) if dues else None
+
+    def snapshot(self):
+        """
+        기다리는 이벤트를 함수(action) 없이 저장합니다.
+
+        Returns:
+            tuple: (now, seq, ((due, priority, seq, name), ...))
+        """
+        events = tuple((event.due, event.priority, event.seq, event.name) for event in self._queue
+                       if event.seq not in self._cancelled)
+        return (self.now, self._seq, events)
+
+    def restore(self, state, actions):
+        """
+        snapshot()으로 저장한 이벤트를 다시 등록합니다.
+
+        Args:
+            state: snapshot()의 반환값
+            actions: 이벤트 이름 -> 실행할 함수 (예: {"cat": session._spawn_cat})
+
+        Raises:
+            KeyError: actions에 없는 이름의 이벤트가 있음
+        """
+        now, seq, events = state
+        self.now = now
+        self._seq = seq
+        self._queue = [Event(due, priority, event_seq, name, actions[name])
+                       for due, priority, event_seq, name in events]
+        heapq.heapify(self._queue)
+        self._cancelled.clear()
@@ -0,0 +1,885 @@
+# session.py
+
+import random
+from collections import namedtuple
+from functools import partial
+
+import pygame
+
+import asset_cache
+import config
+import entity_store
+import gamelog
+import snapshot
+from pool import ProjectilePool
+from scheduler import (
+    Scheduler, ticks_until, PRIORITY_BOSS_MOVE, PRIORITY_CAT, PRIORITY_MOUSE,
+    PRIORITY_SNACK, PRIORITY_PUPPY, PRIORITY_STAGE_START,
+)
+from spatial_hash import SpatialHash
+from sprites import (
+    Player, Shuriken, GoldShuriken, EnemyCat, MouseEnemy, BossCat,
+    Snack, Puppy, Stone, get_touch_rect,
+)
+
+# ============================================================================
+# 🧠 게임 시뮬레이션 (GameSession)
+# ============================================================================
+# 스프라이트 그룹, 타이머, 스폰 로직, 충돌 처리를 모두 이 클래스가 가지고 있습니다.
+# 화면, 폰트, 오디오를 전혀 사용하지 않으므로 창 없이(헤드리스) 실행할 수 있고,
+# main.py는 입력을 모아 step()을 호출한 뒤 결과를 그리기만 합니다.
+
+# 카테고리별 로거 (출력 레벨은 config.LOG_LEVELS에서 설정)
+_log_game = gamelog.get_logger("game")
+_log_spawn = gamelog.get_logger("spawn")
+_log_item = gamelog.get_logger("item")
+_log_defense = gamelog.get_logger("defense")
+_log_collision = gamelog.get_logger("collision")
+
+# 매 틱 반복되는 상태 로그는 호출 위치별로 config.LOG_RATE_LIMIT_MS에 한 번만 출력
+_ONCE_PER_SEC = gamelog.every(config.LOG_RATE_LIMIT_MS)
+
+# 한 번의 step()/tick()에 전달되는 플레이어 입력
+# left/right/jump: 키를 누르고 있는지, throw: 이번 프레임에 발사 키를 누른 횟수 (0이면 없음)
+PlayerInput = namedtuple("PlayerInput", ["left", "right", "jump", "throw"], defaults=(False, False, False, 0))
+
+NO_INPUT = PlayerInput()
+
+# config의 이동 속도/중력(틱당 픽셀)이 맞춰진 초당 틱 수 (config.TICK_RATE는 이 값으로 고정)
+TUNED_TICK_RATE = 60
+
+
+def input_from_keys(keys, throw=False):
+    """
+    pygame.key.get_pressed() 결과를 PlayerInput으로 변환합니다.
+
+    Args:
+        keys: pygame.key.get_pressed()로 얻은 키 입력 상태
+        throw: 이번 프레임에 발사 키(스페이스바)를 누른 횟수
+    """
+    return PlayerInput(
+        left=bool(keys[pygame.K_LEFT]),
+        right=bool(keys[pygame.K_RIGHT]),
+        jump=bool(keys[pygame.K_UP]),
+        throw=throw,
+    )
+
+
+class GameSession:
+    """
+    게임 한 판의 시뮬레이션 상태
+
+    주요 기능:
+    - 스프라이트 그룹과 플레이어 관리
+    - 고양이/마우스/간식/puppy 스폰 타이머 관리
+    - 수리검, 적, 돌, 아이템 충돌 처리와 점수 계산
+    - 스테이지 클리어 연출과 다음 스테이지 전환
+
+    state 값:
+    - "playing": 게임 진행 중
+    - "stage_clear": 보스 처치 후 다음 스테이지 대기 (3초)
+    - "game_over": 플레이어 사망
+    - "game_clear": 마지막 스테이지 클리어
+
+    시간은 pygame.time.get_ticks()가 아니라 고정 틱(config.TICK_MS)을 누적한
+    시뮬레이션 시간(ms)을 사용하므로, CPU가 허용하는 만큼 빠르게 돌릴 수 있습니다.
+
+    고정 틱 진행:
+    - step(inputs, dt)는 렌더링 프레임 시간 dt를 누적하고, 쌓인 만큼 tick()을 여러 번 실행
+    - 렌더링 FPS(30, 60, 240...)가 달라도 같은 입력이면 게임 결과가 같음
+    - alpha는 다음 틱까지 진행된 비율로, 화면 보간(interpolation)에 사용
+
+    랜덤 요소(고양이 색상, 마우스/돌 속도, 보스 이동 간격, puppy 간격)는 모두
+    세션의 self.rng(random.Random)에서 뽑습니다. 같은 시드(seed)로 reset()하고
+    틱마다 같은 입력을 주면 항상 같은 게임이 재현됩니다 (replay.py가 이것을 이용).
+
+    스폰과 보스 공격/이동, 스테이지 전환은 타이머를 매 틱 검사하지 않고
+    scheduler(틱 번호 기반 이벤트 큐)에 등록해 두었다가 시간이 된 것만 실행합니다.
+
+    엔티티 저장 방식(backend):
+    - "sprites": 고양이/마우스/돌/수리검이 모두 스프라이트 (기본값)
+    - "numpy": 이 네 종류를 entity_store.EntityStore의 배열로 관리 (self.entities)
+      보스, 플레이어, 간식, puppy는 어느 방식이든 스프라이트입니다.
+    """
+
+    BACKENDS = ("sprites", "numpy")
+    COLLISION_MODES = ("rect", "mask")
+
+    def __init__(self, backend=None, seed=None):
+        """
+        Args:
+            backend: 엔티티 저장 방식 (기본값: config.ENTITY_BACKEND)
+            seed: 첫 게임의 랜덤 시드 (없으면 매번 새로 뽑음)
+        """
+        # 게임의 모든 랜덤 요소가 쓰는 생성기 (reset()할 때 시드로 초기화)
+        self.rng = random.Random()
+        self.recorder = None  # 틱마다 입력을 기록할 replay.ReplayRecorder (없으면 기록하지 않음)
+        # 단계별 시간 측정기 (profiler.FrameProfiler, None이면 측정하지 않음)
+        # 틱마다 update, spawn, collision.* 단계를 lap()으로 기록
+        self.profiler = None
+
+        # ===== 스프라이트 그룹 =====
+        self.all_sprites = pygame.sprite.Group()
+        self.enemies = pygame.sprite.Group()
+        self.mice = pygame.sprite.Group()     # 마우스 적 그룹
+        self.shurikens = pygame.sprite.Group()
+        self.items = pygame.sprite.Group()
+        self.puppies = pygame.sprite.Group()  # 강아지 아이템 그룹
+        self.stones = pygame.sprite.Group()
+
+        # 모든 충돌 처리가 함께 쓰는 공간 해시 (매 틱 위치가 바뀐 스프라이트만 갱신)
+        self.grid = SpatialHash(config.COLLISION_CELL_SIZE)
+
+        # 투사체 재사용 풀 (kill()된 수리검/돌을 reset()해서 다시 씀)
+        self.shuriken_pool = ProjectilePool(Shuriken, (self.shurikens, self.all_sprites))
+        self.gold_shuriken_pool = ProjectilePool(GoldShuriken, (self.shurikens, self.all_sprites))
+        self.stone_pool = ProjectilePool(partial(Stone, rng=self.rng), (self.stones, self.all_sprites))
+
+        # 고양이/마우스/돌/수리검 배열 저장소 (numpy 방식일 때만, 아니면 None)
+        backend = backend or config.ENTITY_BACKEND
+        if backend not in self.BACKENDS:
+            raise ValueError(f"알 수 없는 엔티티 저장 방식: {backend}")
+        if backend == "numpy" and not entity_store.available():
+            _log_game.warning("⚠️ numpy가 설치되어 있지 않아 스프라이트 방식으로 실행합니다")
+            backend = "sprites"
+        self.backend = backend
+        self.entities = entity_store.EntityStore(self.rng) if backend == "numpy" else None
+
+        # 플레이어와 적/마우스/돌의 충돌 판정 방식 (config.COLLISION_MODE)
+        if config.COLLISION_MODE not in self.COLLISION_MODES:
+            raise ValueError(f"알 수 없는 충돌 판정 방식: {config.COLLISION_MODE}")
+        self.pixel_collision = config.COLLISION_MODE == "mask"
+
+        if config.TICK_RATE != TUNED_TICK_RATE:
+            # 속도/중력은 틱당 값이라 틱 수를 바꾸면 스폰 간격(밀리초)에 비해 모든 움직임이 빨라지거나 느려짐
+            _log_game.warning("⚠️ TICK_RATE=%d: 이동 속도와 중력은 %d틱 기준 값이라 게임 밸런스가 달라집니다",
+                              config.TICK_RATE, TUNED_TICK_RATE)
+
+        self.player = Player()
+        self.total_cats = config.TOTAL_CATS_TO_SPAWN
+        self.tick_ms = config.TICK_MS  # 틱 1회의 길이 (ms)
+        self.scheduler = Scheduler()  # 스폰, 보스 공격/이동, 스테이지 전환 이벤트
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        """
+        새 게임을 시작할 수 있도록 모든 상태를 초기화합니다.
+
+        Args:
+            seed: 이번 게임의 랜덤 시드 (없으면 새로 뽑음, 사용한 값은 self.seed에 남음)
+        """
+        if seed is None:
+            seed = random.randrange(1 << 32)
+        self.seed = seed
+        self.rng.seed(seed)
+        # 시뮬레이션 시간도 0부터 다시 셈 (누적 시간의 실수 오차까지 매 게임 같도록)
+        self.ticks = 0  # 시뮬레이션 누적 시간 (ms)
+        self.tick_count = 0  # 실행한 틱 수 (스케줄러의 시간 단위)
+        self.state = "playing"
+        self.accumulator = 0  # 아직 시뮬레이션하지 않은 프레임 시간 (ms)
+        self.pending_throws = 0  # 다음 틱에 처리할 발사 입력 수
+        self.current_stage = 1  # 스테이지 1부터 시작
+        self.stage_start_time = self.ticks  # 스테이지 시작 시간 기록
+        self.game_start_ticks = self.ticks  # 게임 시작 시간 기록
+        self.score = 0  # 점수 초기화
+        self.death_cause = None  # 게임 오버 원인 ("cat", "boss", "mouse", "stone")
+        self.stage_clear_start_time = 0  # 스테이지 클리어 시작 시간
+        self.stage_clear_jump_index = -1  # 스테이지 클리어 점프 인덱스
+
+        player = self.player
+        player.alive = True
+        player.rect.bottomleft = (config.PLAYER_START_X, config.PLAYER_START_Y)
+        player.vel_y = 0
+        player.on_ground = True
+        player.defense_count = 0  # 방어 횟수 초기화
+        player.defense_active = False  # 방어 효과 초기화
+        player.gold_shuriken_count = 0  # gold shuriken 갯수 초기화
+
+        # 스프라이트 그룹 초기화
+        for group in [self.enemies, self.mice, self.shurikens, self.items, self.puppies, self.stones]:
+            group.empty()
+        self.all_sprites.empty()
+        self.all_sprites.add(player)
+        if self.entities is not None:
+            self.entities.clear()
+
+        # 스폰 이벤트 초기화 (이전 게임에 등록된 이벤트는 모두 버림)
+        self.scheduler.clear()
+        self.scheduler.now = self.tick_count
+        self.cats_spawned = 0  # 고양이 스폰 개수
+        self.boss_spawned = False  # 보스 스폰 상태
+        self.snack_spawned = False  # 간식은 스테이지당 한 번만 스폰
+        # 마우스 스폰까지 남은 틱 (보스전 동안 멈췄다가 다음 스테이지에서 이어서 셈)
+        self.mouse_ticks_left = ticks_until(config.MOUSE_SPAWN_INTERVAL, self.tick_ms)
+        self.next_puppy_interval = self.rng.randint(config.PUPPY_SPAWN_MIN_INTERVAL, config.PUPPY_SPAWN_MAX_INTERVAL)
+        self._schedule_stage_spawns()
+
+        _log_game.info("🎮 게임 리셋 완료 - seed: %d, cats_spawned: %d, boss_spawned: %s",
+                       self.seed, self.cats_spawned, self.boss_spawned)
+        _log_spawn.debug("🐕 next_puppy_interval: %dms", self.next_puppy_interval)
+        if config.STRESS_SWARM_SIZE > 0:
+            self.spawn_swarm(config.STRESS_SWARM_SIZE)
+        if self.recorder is not None:
+            self.recorder.start(self)  # 새 게임의 기록 시작
+
+    # ------------------------------------------------------------------
+    # 시간 정보
+    # ------------------------------------------------------------------
+
+    @property
+    def elapsed_ms(self):
+        """게임 시작 후 경과한 시뮬레이션 시간 (ms)"""
+        return int(self.ticks - self.game_start_ticks)
+
+    @property
+    def stage_elapsed_ms(self):
+        """현재 스테이지 시작 후 경과한 시뮬레이션 시간 (ms)"""
+        return int(self.ticks - self.stage_start_time)
+
+    @property
+    def stage_clear_elapsed_ms(self):
+        """스테이지 클리어 연출 시작 후 경과한 시뮬레이션 시간 (ms)"""
+        return int(self.ticks - self.stage_clear_start_time)
+
+    @property
+    def enemy_count(self):
+        """살아 있는 적(고양이 + 보스) 수 (numpy 방식이면 배열의 고양이 포함)"""
+        count = len(self.enemies)
+        if self.entities is not None:
+            count += self.entities.cats.count
+        return count
+
+    @property
+    def boss(self):
+        """현재 살아 있는 보스 (없으면 None)"""
+        for enemy in self.enemies:
+            if isinstance(enemy, BossCat):
+                return enemy
+        return None
+
+    # ------------------------------------------------------------------
+    # 시뮬레이션 진행
+    # ------------------------------------------------------------------
+
+    @property
+    def alpha(self):
+        """마지막 틱 이후 다음 틱까지 진행된 비율 (0.0 ~ 1.0, 화면 보간용)"""
+        return self.accumulator / self.tick_ms
+
+    def step(self, inputs, dt):
+        """
+        렌더링 프레임 시간만큼 시뮬레이션을 진행합니다 (고정 틱 누적 방식).
+
+        Args:
+            inputs: PlayerInput (이번 프레임의 키 입력)
+            dt: 이번 프레임의 경과 시간 (ms)
+
+        Returns:
+            str: 진행 후의 state 값
+
+        dt가 틱 길이보다 짧으면 틱이 실행되지 않을 수 있으므로,
+        발사 입력은 다음 틱까지 모아 두었다가 처리합니다.
+        """
+        self.pending_throws += int(inputs.throw)
+        # 창을 옮기거나 멈췄을 때 한꺼번에 너무 많은 틱을 돌리지 않도록 제한
+        self.accumulator += min(dt, config.MAX_FRAME_TIME)
+        while self.accumulator >= self.tick_ms:
+            self.accumulator -= self.tick_ms
+            self.tick(inputs._replace(throw=self.pending_throws))
+            self.pending_throws = 0
+        return self.state
+
+    def tick(self, inputs):
+        """
+        고정 길이(config.TICK_MS)의 시뮬레이션 틱을 정확히 한 번 실행합니다.
+
+        Args:
+            inputs: PlayerInput (이번 틱의 키 입력, throw는 발사 횟수)
+
+        Returns:
+            str: 진행 후의 state 값
+
+        헤드리스 실행(테스트, 배치 작업)에서는 step() 대신 tick()을 직접 호출하면 됩니다.
+        """
+        if self.recorder is not None:
+            self.recorder.record(inputs)
+        self.ticks += self.tick_ms
+        self.tick_count += 1
+
+        # 화면 보간용으로 틱 시작 전 위치를 기록
+        for sprite in self.all_sprites:
+            sprite.prev_pos = sprite.rect.topleft
+        for pool in (self.shuriken_pool, self.gold_shuriken_pool, self.stone_pool):
+            pool.begin_tick()
+
+        if self.state == "playing":
+            self._update_playing(inputs)
+        elif self.state == "stage_clear":
+            self._update_stage_clear()
+        return self.state
+
+    def throw(self):
+        """플레이어가 수리검을 던집니다 (gold shuriken이 있으면 우선 사용)."""
+        player = self.player
+        if not player.alive:
+            return
+        if player.gold_shuriken_count > 0:
+            if player.throw_gold_shuriken():
+                if self.entities is not None:
+                    self.entities.spawn_shuriken(player.rect.right, player.rect.centery, gold=True)
+                else:
+                    self.gold_shuriken_pool.acquire(player.rect.right, player.rect.centery)
+        elif self.entities is not None:
+            self.entities.spawn_shuriken(player.rect.right, player.rect.centery)
+        else:
+            self.shuriken_pool.acquire(player.rect.right, player.rect.centery)
+
+    # ------------------------------------------------------------------
+    # 상태 저장/복원
+    # ------------------------------------------------------------------
+
+    def save(self):
+        """
+        지금 상태를 스냅샷으로 저장합니다 (이미지는 복사하지 않음).
+
+        Returns:
+            snapshot.Snapshot: restore()에 넘길 값 (snapshot.to_bytes()로 파일에 저장 가능)
+        """
+        return snapshot.capture(self)
+
+    def restore(self, saved):
+        """
+        save()로 저장한 상태로 되돌립니다. 같은 스냅샷으로 여러 번 되돌려도 됩니다.
+
+        기록 중인 리플레이(recorder)는 되돌리지 않으므로, 되돌린 뒤의 기록은 재현되지 않습니다.
+        """
+        snapshot.restore(self, saved)
+
+    def pool_stats(self):
+        """
+        투사체 풀 통계를 반환합니다.
+
+        Returns:
+            dict: {"shuriken": {...}, "gold_shuriken": {...}, "stone": {...}} (ProjectilePool.stats 참고)
+        """
+        return {
+            "shuriken": self.shuriken_pool.stats(),
+            "gold_shuriken": self.gold_shuriken_pool.stats(),
+            "stone": self.stone_pool.stats(),
+        }
+
+    def spawn_swarm(self, count, spacing=None):
+        """
+        스트레스 스테이지: 고양이 count마리를 화면 오른쪽 밖에 줄지어 한꺼번에 스폰합니다.
+
+        Args:
+            count: 스폰할 고양이 수
+            spacing: 고양이 사이 간격 (픽셀, 기본값: config.STRESS_SWARM_SPACING)
+
+        cats_spawned에는 세지 않으므로, 보스는 일반 고양이와 이 고양이들이 모두 사라진 뒤 나옵니다.
+        """
+        spacing = spacing or config.STRESS_SWARM_SPACING
+        colors = [self.rng.choice(["yellow", "black", "white"]) for _ in range(count)]
+        xs = [config.WIDTH + 50 + i * spacing for i in range(count)]
+        if self.entities is not None:
+            # 배열에 한 번에 추가 (스프라이트 객체를 만들지 않음)
+            self.entities.spawn_cats(xs, config.HEIGHT - 50, colors, self.current_stage)
+        else:
+            for x, color in zip(xs, colors):
+                EnemyCat(x, config.HEIGHT - 50, color, self.current_stage).add(self.enemies, self.all_sprites)
+        _log_spawn.info("🐱 고양이 떼 스폰됨 (%d마리, 저장 방식: %s)", count, self.backend)
+
+    def _update_playing(self, inputs):
+        profiler = self.profiler
+
+        for _ in range(int(inputs.throw)):
+            self.throw()
+
+        if self.entities is not None:
+            # 배열 엔티티를 먼저 움직임: 스프라이트 방식과 마찬가지로
+            # 이번 틱에 보스가 던진 돌은 다음 틱부터 움직입니다
+            self.entities.step()
+
+        # 이번 틱에 움직일 스프라이트를 먼저 정해 둔 뒤 보스 공격/이동 이벤트를 실행
+        # (보스가 방금 던진 돌은 all_sprites.update()를 쓸 때처럼 다음 틱부터 움직임)
+        sprites = self.all_sprites.sprites()
+        self.scheduler.run_due(self.tick_count, PRIORITY_BOSS_MOVE)
+        for sprite in sprites:
+            sprite.update(inputs)
+
+        if profiler is not None:
+            profiler.lap("update")
+
+        self._spawn()
+        if profiler is not None:
+            profiler.lap("spawn")
+
+        self.grid.sync(self.all_sprites)
+        if profiler is not None:
+            profiler.lap("collision.grid")
+        self._resolve_shuriken_hits()
+        if profiler is not None:
+            profiler.lap("collision.shuriken")
+        self._resolve_item_pickups()
+        if profiler is not None:
+            profiler.lap("collision.items")
+        self._resolve_player_hits()
+
+    def _schedule_stage_spawns(self):
+        """
+        스테이지 시작 시 스폰 이벤트(고양이, 마우스, 간식, puppy)를 등록합니다.
+
+        다음 틱부터 시간이 흐르므로 예전 타이머(0에서 시작해 매 틱 += TICK_MS)와 같은 틱에 스폰됩니다.
+        """
+        scheduler = self.scheduler
+        if self.total_cats > 0:
+            scheduler.after(ticks_until(config.ENEMY_SPAWN_INTERVAL, self.tick_ms), "cat",
+                            self._spawn_cat, PRIORITY_CAT)
+        scheduler.after(self.mouse_ticks_left, "mouse", self._spawn_mouse, PRIORITY_MOUSE)
+        scheduler.after(ticks_until(config.SNACK_SPAWN_INTERVAL, self.tick_ms), "snack",
+                        self._spawn_snack, PRIORITY_SNACK)
+        scheduler.after(ticks_until(self.next_puppy_interval, self.tick_ms), "puppy",
+                        self._spawn_puppy, PRIORITY_PUPPY)
+
+    def stage_spawn_schedule(self):
+        """
+        스테이지를 지금 상태에서 시작했을 때의 시간 기반 스폰 일정을 미리 계산합니다.
+
+        - 고양이: total_cats마리를 ENEMY_SPAWN_INTERVAL마다
+        - 마우스: 마지막 고양이가 나올 때까지 MOUSE_SPAWN_INTERVAL마다 (보스가 나오면 멈춤)
+        - 간식: 한 번
+        - puppy: 이미 정해진 다음 간격 한 번 (그다음 간격은 스폰할 때 랜덤으로 정함)
+        보스는 고양이를 모두 처치해야 나오므로 시간으로 정할 수 없어 포함하지 않습니다.
+        지금 기다리고 있는 실제 이벤트는 scheduler.pending()으로 볼 수 있습니다.
+
+        Returns:
+            list: [(스테이지 시작 후 ms, 이벤트 이름), ...] 실행 순서대로
+        """
+        events = []
+        cat_ticks = ticks_until(config.ENEMY_SPAWN_INTERVAL, self.tick_ms)
+        for n in range(1, self.total_cats + 1):
+            events.append((n * cat_ticks, PRIORITY_CAT, "cat"))
+        last_cat_tick = self.total_cats * cat_ticks
+        mouse_tick = self.mouse_ticks_left
+        while mouse_tick <= last_cat_tick:
+            events.append((mouse_tick, PRIORITY_MOUSE, "mouse"))
+            mouse_tick += ticks_until(config.MOUSE_SPAWN_INTERVAL, self.tick_ms)
+        events.append((ticks_until(config.SNACK_SPAWN_INTERVAL, self.tick_ms), PRIORITY_SNACK, "snack"))
+        events.append((ticks_until(self.next_puppy_interval, self.tick_ms), PRIORITY_PUPPY, "puppy"))
+        events.sort()
+        return [(int(round(tick * self.tick_ms)), name) for tick, _, name in events]
+
+    def _spawn_cat(self):
+        """cat 이벤트: 고양이를 스폰하고, 아직 남았으면 다음 고양이를 예약합니다."""
+        cat_type = self.rng.choice(["yellow", "black", "white"])
+        if self.entities is not None:
+            self.entities.spawn_cat(config.WIDTH + 50, config.HEIGHT - 50, cat_type, self.current_stage)
+        else:
+            cat = EnemyCat(config.WIDTH + 50, config.HEIGHT - 50, cat_type, self.current_stage)
+            cat.add(self.enemies, self.all_sprites)
+        self.cats_spawned += 1
+        _log_spawn.info("🐱 고양이 스폰됨 (타입: %s, 스폰된 수: %d/%d, enemies: %d)",
+                        cat_type, self.cats_spawned, self.total_cats, self.enemy_count)
+        if self.cats_spawned < self.total_cats:
+            self.scheduler.after(ticks_until(config.ENEMY_SPAWN_INTERVAL, self.tick_ms), "cat",
+                                 self._spawn_cat, PRIORITY_CAT)
+
+    def _spawn_mouse(self):
+        """mouse 이벤트: 마우스 적을 스폰하고 다음 마우스를 예약합니다 (고양이와 독립적)."""
+        # config.py에서 설정된 마우스 시작 위치 사용 (player와 동일한 높이)
+        if self.entities is not None:
+            self.entities.spawn_mouse(config.MOUSE_START_X, config.MOUSE_START_Y, self.current_stage)
+            _log_spawn.info("🐭 마우스 적 스폰됨 (mice: %d)", self.entities.mice.count)
+        else:
+            mouse = MouseEnemy(config.MOUSE_START_X, config.MOUSE_START_Y, self.current_stage, rng=self.rng)
+            mouse.add(self.mice, self.all_sprites)
+            _log_spawn.info("🐭 마우스 적 스폰됨 (위치: %d, %d, 속도: %d, mice: %d)",
+                            mouse.rect.x, mouse.rect.y, mouse.speed, len(self.mice))
+        self.scheduler.after(ticks_until(config.MOUSE_SPAWN_INTERVAL, self.tick_ms), "mouse",
+                             self._spawn_mouse, PRIORITY_MOUSE)
+
+    def _spawn_snack(self):
+        """snack 이벤트: 간식을 스폰합니다 (스테이지당 한 번)."""
+        snack = Snack(config.WIDTH + 30, config.HEIGHT - 80)
+        snack.add(self.items, self.all_sprites)
+        self.snack_spawned = True
+
+    def _spawn_puppy(self):
+        """puppy 이벤트: 강아지를 스폰하고 랜덤 간격 뒤의 다음 puppy를 예약합니다."""
+        puppy = Puppy(config.WIDTH + 30, config.HEIGHT - 80)
+        puppy.add(self.puppies, self.all_sprites)
+        self.next_puppy_interval = self.rng.randint(config.PUPPY_SPAWN_MIN_INTERVAL, config.PUPPY_SPAWN_MAX_INTERVAL)  # 다음 puppy 스폰 간격 업데이트
+        _log_spawn.info("🐕 puppy 스폰됨 (위치: %d, %d, puppies: %d, 다음 간격: %dms)",
+                        puppy.rect.x, puppy.rect.y, len(self.puppies), self.next_puppy_interval)
+        self.scheduler.after(ticks_until(self.next_puppy_interval, self.tick_ms), "puppy",
+                             self._spawn_puppy, PRIORITY_PUPPY)
+
+    def _spawn(self):
+        """시간이 된 스폰 이벤트를 실행하고, 고양이를 모두 처치했으면 보스를 스폰합니다."""
+        # 고양이, 마우스, 간식, puppy 순서로 이번 틱에 예약된 것만 실행
+        self.scheduler.run_due(self.tick_count)
+
+        if _log_spawn.isEnabledFor(gamelog.DEBUG):
+            if self.cats_spawned >= self.total_cats or self.boss_spawned:
+                # 고양이 스폰이 멈춘 이유 로깅 (매 틱 반복되므로 속도 제한)
+                _log_spawn.debug("🐱 고양이 스폰 중단 - 스폰된 수: %d/%d, 보스: %s, enemies: %d",
+                                 self.cats_spawned, self.total_cats, self.boss_spawned,
+                                 self.enemy_count, extra=_ONCE_PER_SEC)
+            puppy_due = self.scheduler.next_due("puppy")
+            if puppy_due is not None:
+                _log_spawn.debug("🐕 다음 puppy까지 %d틱 (간격: %dms)",
+                                 puppy_due - self.tick_count, self.next_puppy_interval, extra=_ONCE_PER_SEC)
+
+        # 모든 고양이를 처치했을 때 보스 스폰
+        if self.cats_spawned >= self.total_cats and not self.boss_spawned and self.enemy_count == 0:
+            # numpy 방식에서는 보스가 던진 돌이 스프라이트 대신 돌 배열에 추가됨
+            stone_pool = self.entities.stone_launcher if self.entities is not None else self.stone_pool
+            boss = BossCat(config.BOSS_START_X, config.BOSS_START_Y, self.current_stage,
+                           stone_groups=(self.stones, self.all_sprites), stone_pool=stone_pool,
+                           scheduler=self.scheduler, rng=self.rng, target=self.player)
+            boss.add(self.enemies, self.all_sprites)
+            self.boss_spawned = True
+            # 보스전 동안 마우스 스폰을 멈춤 (남은 틱은 다음 스테이지에서 이어서 셈)
+            paused = self.scheduler.cancel_named("mouse")
+            if "mouse" in paused:
+                self.mouse_ticks_left = paused["mouse"] - self.tick_count
+
+    def _resolve_shuriken_hits(self):
+        """수리검과 적(고양이, 보스)의 충돌을 처리합니다."""
+        if self.entities is not None:
+            self._resolve_shuriken_hits_arrays()
+            return
+        for shuriken in self.shurikens:
+            if len(self.enemies) > 0:
+                hit_cats = self.grid.query(shuriken.rect, self.enemies)
+            else:
+                hit_cats = []
+            for cat in hit_cats:
+                # Gold Shuriken인지 확인하여 데미지 결정
+                damage = 1
+                if isinstance(shuriken, GoldShuriken):
+                    damage = shuriken.damage_multiplier
+                    _log_item.debug("🥷 Gold Shuriken으로 %d배 데미지!", damage)
+
+                if isinstance(cat, BossCat):
+                    cat.hp -= damage
+                    if cat.hp <= 0:
+                        self._defeat_boss(cat)
+                    shuriken.kill()
+                else:
+                    cat.hp -= damage
+                    if cat.hp <= 0:
+                        if hasattr(cat, "archetype"):
+                            self.score += cat.archetype.score
+                        cat.kill()
+                    shuriken.kill()
+
+        # 마우스 적과 수리검 충돌 처리 (마우스는 표창보다 아래에 있어서 충돌하지 않음)
+        # 마우스는 표창에 맞지 않으므로 충돌 처리를 제거
+        # 표창이 마우스 위를 지나가도록 함
+
+    def _resolve_shuriken_hits_arrays(self):
+        """numpy 방식: 수리검 x 고양이 겹침을 배열 연산으로 한 번에 처리합니다."""
+        boss = self.boss
+        score, boss_damage = self.entities.shuriken_hits(boss.rect if boss is not None else None)
+        self.score += score
+        if boss_damage:
+            boss.hp -= boss_damage
+            if boss.hp <= 0:
+                self._defeat_boss(boss)
+
+    def _resolve_item_pickups(self):
+        """간식과 puppy 아이템 획득을 처리합니다."""
+        player = self.player
+        if len(self.items) > 0:
+            hit_snack = self.grid.query(player.rect, self.items)
+            for snack in hit_snack:
+                snack.kill()
+        else:
+            hit_snack = []
+        if hit_snack:
+            player.eat_snack()
+
+        # 강아지 충돌 감지
+        if len(self.puppies) > 0:
+            hit_puppy = self.grid.query(player.rect, self.puppies)
+            for puppy in hit_puppy:
+                puppy.kill()
+        else:
+            hit_puppy = []
+        if hit_puppy:
+            _log_item.debug("🐕 puppy 충돌 감지! hit_puppy 개수: %d", len(hit_puppy))
+            if not player.get_puppy():
+                # 이미 puppy를 가지고 있음 - hit_puppy를 다시 추가
+                for puppy in hit_puppy:
+                    puppy.add(self.puppies, self.all_sprites)
+
+    def _resolve_player_hits(self):
+        """플레이어와 적/마우스/돌의 충돌을 처리합니다 (puppy가 있으면 방어)."""
+        player = self.player
+        # collision 카테고리가 꺼져 있으면 아래 디버그 로그는 이 검사 한 번으로 모두 건너뜀
+        debug = _log_collision.isEnabledFor(gamelog.DEBUG)
+
+        # numpy 방식이면 배열의 고양이/마우스/돌도 같은 순서로 검사 (스프라이트 방식이면 None)
+        entities = self.entities
+        profiler = self.profiler  # 적, 마우스, 돌 검사를 각각 한 단계로 기록
+
+        # 픽셀 충돌 방식이면 여백을 줄이지 않은 player.rect로 후보를 고른 뒤 마스크로 한 번 더 검사
+        # (puppy 유무와 관계없이 같은 판정 - 여백은 투명한 가장자리를 대신하던 값이므로 필요 없음)
+        player_mask = asset_cache.get_mask(player.image) if self.pixel_collision else None
+
+        # 적과의 충돌 시 방어 효과 적용
+        if self.enemy_count > 0:
+            # puppy가 있으면 정상 충돌 영역, 없으면 작은 충돌 영역 사용
+            if player.has_defense() or player_mask is not None:
+                collision_rect = player.rect
+            else:
+                # puppy가 없을 때는 더 작은 충돌 영역 사용
+                collision_rect = get_touch_rect(player, config.PUPPY_LESS_COLLISION_MARGIN)  # config에서 설정된 여백
+
+            touched_cat = -1  # 부딪힌 배열 고양이의 인덱스 (numpy 방식)
+            # 여러 마리와 동시에 부딪히면 가장 먼저 스폰된 고양이를 처리 (두 방식 모두 같은 선택):
+            # 스프라이트는 grid.query()의 스폰 순서, 배열은 순서를 유지하는 배열의 가장 작은 인덱스
+            if player_mask is not None:
+                touched_enemy = self._first_pixel_hit(self.enemies, player_mask)
+                if touched_enemy is None and entities is not None:
+                    touched_cat = entities.first_pixel_overlap(entities.cats, collision_rect, player_mask)
+            else:
+                touched_enemy = self.grid.first(collision_rect, self.enemies)
+                if touched_enemy is None and entities is not None:
+                    touched_cat = entities.cats.first_overlap(collision_rect)
+            if touched_enemy is not None or touched_cat >= 0:
+                if player.has_defense():
+                    # puppy가 있으면 방어 효과 적용
+                    _log_defense.info("🐕 방어 효과 적용! 현재 방어 횟수: %d", player.defense_count)
+                    # 충돌한 적 제거 + 점수 반영
+                    if touched_cat >= 0:
+                        self.score += entities.kill_cat(touched_cat)
+                    elif touched_enemy:
+                        if isinstance(touched_enemy, BossCat):
+                            # 보스와 충돌로 보스를 제거한 경우에도 동일한 스테이지 클리어 연출로 이동
+                            self._defeat_boss(touched_enemy)
+                        else:
+                            if hasattr(touched_enemy, "archetype"):
+                                self.score += touched_enemy.archetype.score
+                            touched_enemy.kill()
+                    # puppy 방어 효과 1회 소모
+                    player.remove_puppy_defense()
+                    # 방어 성공 - 게임 오버되지 않음
+                else:
+                    # puppy가 없으면 게임 오버
+                    enemy_name = type(touched_enemy).__name__ if touched_enemy is not None else "EnemyCat"
+                    _log_game.info("❌ 방어 효과 없음 - 게임 오버 (적: %s)", enemy_name)
+                    self._kill_player("boss" if isinstance(touched_enemy, BossCat) else "cat")
+        if profiler is not None:
+            profiler.lap("collision.player.enemies")
+
+        # 마우스 적과의 충돌 시 방어 효과 적용
+        if len(self.mice) > 0 or (entities is not None and entities.mice.count > 0):
+            mouse_touched = False
+            touched_mouse = None
+            touched_mouse_index = -1  # 부딪힌 배열 마우스의 인덱스 (numpy 방식)
+            # puppy가 있으면 정상 충돌 영역, 없으면 작은 충돌 영역 사용
+            if player.has_defense() or player_mask is not None:
+                collision_rect = player.rect
+            else:
+                # puppy가 없을 때는 더 작은 충돌 영역 사용
+                collision_rect = get_touch_rect(player, config.PUPPY_LESS_COLLISION_MARGIN)  # config에서 설정된 여백
+
+            # 디버깅: 충돌 영역 정보 출력
+            if debug:
+                _log_collision.debug("🔍 Player 충돌 영역: %s", collision_rect, extra=_ONCE_PER_SEC)
+
+            if player_mask is not None:
+                # 픽셀 충돌: 현재 위치의 마우스 이미지로만 판정 (스폰 위치의 collision_rect는 쓰지 않음)
+                touched_mouse = self._first_pixel_hit(self.mice, player_mask)
+                mouse_touched = touched_mouse is not None
+                if not mouse_touched and entities is not None:
+                    touched_mouse_index = entities.first_pixel_overlap(entities.mice, collision_rect, player_mask)
+                    mouse_touched = touched_mouse_index >= 0
+            else:
+                for mouse in self.grid.query(collision_rect, self.mice):
+                    if debug:
+                        _log_collision.debug("🔍 Mouse %d 위치: %s, 충돌 영역: %s",
+                                             id(mouse), mouse.rect, mouse.collision_rect)
+                    # 충돌 감지 테스트: rect와 collision_rect 모두 시도
+                    collision_detected = (collision_rect.colliderect(mouse.rect) or
+                                          collision_rect.colliderect(mouse.collision_rect))
+                    if collision_detected:
+                        mouse_touched = True
+                        touched_mouse = mouse
+                        break
+                if not mouse_touched and entities is not None:
+                    # 배열 마우스는 collision_rect(스폰 위치의 복사본) 없이 현재 위치로만 판정
+                    touched_mouse_index = entities.mice.first_overlap(collision_rect)
+                    mouse_touched = touched_mouse_index >= 0
+            if mouse_touched:
+                if debug:
+                    _log_collision.debug("💥 충돌 감지! Player와 Mouse %d",
+                                         id(touched_mouse) if touched_mouse else touched_mouse_index)
+                if player.has_defense():
+                    # puppy가 있으면 방어 효과 적용
+                    _log_defense.info("🐕 마우스 충돌 방어 효과 적용! 현재 방어 횟수: %d", player.defense_count)
+                    # 충돌한 마우스 제거 + 점수 반영
+                    if touched_mouse:
+                        self.score += config.SCORE_PER_MOUSE
+                        touched_mouse.kill()
+                    elif touched_mouse_index >= 0:
+                        self.score += config.SCORE_PER_MOUSE
+                        entities.mice.remove(touched_mouse_index)
+                    # puppy 방어 효과 1회 소모
+                    player.remove_puppy_defense()
+                    # 방어 성공 - 게임 오버되지 않음
+                else:
+                    # puppy가 없으면 게임 오버
+                    _log_game.info("❌ 마우스 충돌 방어 효과 없음 - 게임 오버")
+                    self._kill_player("mouse")
+        if profiler is not None:
+            profiler.lap("collision.player.mice")
+
+        # 돌 충돌도 동일하게
+        # puppy가 있으면 정상 충돌 영역, 없으면 작은 충돌 영역 사용
+        if player.has_defense() or player_mask is not None:
+            collision_rect = player.rect
+        else:
+            # puppy가 없을 때는 더 작은 충돌 영역 사용
+            collision_rect = get_touch_rect(player, config.PUPPY_LESS_COLLISION_MARGIN)  # config에서 설정된 여백
+
+        touched_stone_index = -1  # 부딪힌 배열 돌의 인덱스 (numpy 방식)
+        # 돌 여러 개와 동시에 부딪히면 (탄막 패턴) 가장 먼저 던진 돌을 처리 - numpy 방식의 first_overlap과 같은 선택
+        if player_mask is not None:
+            touched_stone = self._first_pixel_hit(self.stones, player_mask)
+            if touched_stone is None and entities is not None:
+                touched_stone_index = entities.first_pixel_overlap(entities.stones, collision_rect, player_mask)
+        else:
+            touched_stone = self.grid.first(collision_rect, self.stones)
+            if touched_stone is None and entities is not None:
+                touched_stone_index = entities.stones.first_overlap(collision_rect)
+        if touched_stone is not None or touched_stone_index >= 0:
+            if player.has_defense():
+                # puppy가 있으면 방어 효과 적용
+                _log_defense.info("🪨 돌 충돌 방어 효과 적용! 현재 방어 횟수: %d", player.defense_count)
+                # 충돌한 stone 제거
+                if touched_stone:
+                    touched_stone.kill()
+                elif touched_stone_index >= 0:
+                    entities.stones.remove(touched_stone_index)
+                # puppy 방어 효과 1회 소모
+                player.remove_puppy_defense()
+                # 방어 성공 - 게임 오버되지 않음
+            else:
+                # puppy가 없으면 게임 오버
+                _log_game.info("🪨 돌 충돌 방어 효과 없음 - 게임 오버")
+                self._kill_player("stone")
+        if profiler is not None:
+            profiler.lap("collision.player.stones")
+
+    def _first_pixel_hit(self, group, player_mask):
+        """
+        플레이어와 픽셀이 겹치는 group의 첫 번째(가장 먼저 스폰된) 스프라이트를 반환합니다 (없으면 None).
+
+        공간 해시로 player.rect와 사각형이 겹치는 후보만 고른 뒤(넓은 단계),
+        후보마다 이미지별로 미리 만들어 둔 마스크를 비교합니다(좁은 단계).
+        """
+        rect = self.player.rect
+        for sprite in self.grid.query(rect, group):
+            offset = (sprite.rect.x - rect.x, sprite.rect.y - rect.y)  # 플레이어 마스크 기준 상대 위치
+            if player_mask.overlap(asset_cache.get_mask(sprite.image), offset):
+                return sprite
+        return None
+
+    def _defeat_boss(self, boss):
+        """보스를 처치하고 다음 스테이지 연출 또는 게임 클리어로 전환합니다."""
+        boss.kill()
+        self.scheduler.cancel_named("boss_attack", "boss_move")
+        self.score += config.SCORE_BOSS
+        if self.current_stage < config.MAX_STAGE:
+            # 다음 스테이지로 진행 (커스텀 스테이지 클리어 연출)
+            self.state = "stage_clear"
+            self.stage_clear_start_time = self.ticks
+            self.stage_clear_jump_index = -1
+            # 플레이어를 화면 중앙으로 이동하고 바닥에 정렬
+            player = self.player
+            player.rect.centerx = config.WIDTH // 2
+            player.rect.bottom = config.HEIGHT - 50
+            player.vel_y = 0
+            player.on_ground = True
+            # 스테이지 클리어 시 표창(수리검), 돌, 마우스 적 즉시 제거
+            for group in [self.shurikens, self.stones, self.mice]:
+                for sprite in list(group):
+                    sprite.kill()
+            if self.entities is not None:
+                self.entities.clear("shurikens", "stones", "mice")
+            # 연출 중에는 스폰하지 않음 (간식/puppy는 다음 스테이지에서 처음부터 다시 셈)
+            self.scheduler.cancel_named("snack", "puppy")
+            # 3초 뒤 다음 스테이지로 전환
+            self.scheduler.after(ticks_until(3000, self.tick_ms, inclusive=True, start=self.ticks), "stage_start",
+                                 self._start_next_stage, PRIORITY_STAGE_START)
+        else:
+            # 모든 스테이지 클리어
+            self.state = "game_clear"
+        _log_game.info("👑 보스 처치! 스테이지 %d, 점수: %d, 다음 상태: %s",
+                       self.current_stage, self.score, self.state)
+
+    def _kill_player(self, cause):
+        """
+        플레이어 사망 처리 (state를 game_over로 전환).
+
+        Args:
+            cause: 게임 오버 원인 ("cat", "boss", "mouse", "stone" - self.death_cause에 남음)
+        """
+        self.player.alive = False
+        self.death_cause = cause
+        self.state = "game_over"
+
+    def _update_stage_clear(self):
+        """
+        스테이지 클리어 연출: 플레이어 중앙 정렬 + 점프 3회 + 3초 대기 후 다음 스테이지
+        """
+        player = self.player
+        elapsed_time = self.stage_clear_elapsed_ms
+
+        # 항상 중앙에 고정하고 바닥에 붙여둠 (수평은 고정, 수직은 점프 시에만 변경)
+        player.rect.centerx = config.WIDTH // 2
+        if player.rect.bottom > config.HEIGHT - 50:
+            player.rect.bottom = config.HEIGHT - 50
+
+        # 3초 동안 3번 점프 (각 1초마다 한번 트리거)
+        # 점프 트리거 타이밍: 0ms, 1000ms, 2000ms 근처에서 한 번만 실행
+        intended_index = min(elapsed_time // 1000, 2)  # 0,1,2 중 하나
+        if intended_index != self.stage_clear_jump_index and intended_index <= 2:
+            self.stage_clear_jump_index = intended_index
+            player.vel_y = config.PLAYER_JUMP_VELOCITY
+            player.on_ground = False
+
+        # 중력 적용 및 착지 처리
+        player.vel_y += config.GRAVITY
+        player.rect.y += player.vel_y
+        if player.rect.bottom >= config.HEIGHT - 50:
+            player.rect.bottom = config.HEIGHT - 50
+            player.vel_y = 0
+            player.on_ground = True
+
+        # 3초 경과 시 다음 스테이지로 전환 (stage_start 이벤트)
+        self.scheduler.run_due(self.tick_count)
+
+    def _start_next_stage(self):
+        """stage_start 이벤트: 다음 스테이지를 준비하고 스폰 이벤트를 다시 등록합니다."""
+        self.current_stage += 1
+        self.stage_start_time = self.ticks
+        # 다음 스테이지 준비
+        self.cats_spawned = 0
+        self.boss_spawned = False
+        self.next_puppy_interval = self.rng.randint(config.PUPPY_SPAWN_MIN_INTERVAL, config.PUPPY_SPAWN_MAX_INTERVAL)
+        self.snack_spawned = False
+        for group in [self.enemies, self.shurikens, self.items, self.puppies, self.stones]:
+            group.empty()
+        self.all_sprites.empty()
+        self.all_sprites.add(self.player)
+        if self.entities is not None:
+            self.entities.clear()
+        self.state = "playing"
+        _log_game.info("🎮 스테이지 %d 시작", self.current_stage)
+        self._schedule_stage_spawns()
+        if config.STRESS_SWARM_SIZE > 0:
+            self.spawn_swarm(config.STRESS_SWARM_SIZE)
@@ -0,0 +1,234 @@
+# snapshot.py
+
+import marshal
+import zlib
+from collections import namedtuple
+
+import pygame
+
+from sprites import (
+    Player, Shuriken, GoldShuriken, EnemyCat, MouseEnemy, BossCat,
+    Snack, Puppy, Stone,
+)
+
+# ============================================================================
+# 💾 게임 상태 스냅샷 (Snapshot)
+# ============================================================================
+# GameSession의 상태는 세션 변수(점수, 스테이지, 스폰 상태...), 스프라이트 속성(rect, 체력, 타이머),
+# 스케줄러의 이벤트, 랜덤 생성기, (numpy 방식이면) 엔티티 배열에 나뉘어 있습니다.
+#
+# capture()는 이것들을 숫자/문자열로만 된 튜플로 모읍니다.
+#   - 이미지(Surface)는 복사하지 않음: 복원할 때 스프라이트를 다시 만들면
+#     asset_cache/archetypes에서 같은 이미지를 공유해서 가져옴
+#   - 스케줄러 이벤트의 함수는 저장하지 않고 이름만 저장 (복원할 때 다시 연결)
+#   - 수리검과 돌은 투사체 풀에서 꺼내 재사용
+# restore()는 세션을 저장한 순간과 똑같은 상태로 되돌립니다.
+# 같은 스냅샷에서 여러 번 restore()해서 갈래별로 다른 입력을 시험해 볼 수 있습니다.
+#
+# to_bytes()/from_bytes()는 파일 저장(빠른 저장)용 형식입니다 (marshal + zlib).
+# 버전(SNAPSHOT_VERSION)이 다른 스냅샷은 복원하지 않습니다.
+
+SNAPSHOT_VERSION = 3
+MAGIC = b"CNSS"
+
+# 스냅샷 한 개
+# session: SESSION_FIELDS 순서의 값, rng: random.Random.getstate(),
+# scheduler: Scheduler.snapshot(), player: 플레이어 속성 튜플,
+# sprites: all_sprites 순서의 (종류, 속성 튜플) - 플레이어는 순서만 ("player", ())
+# entities: EntityStore.snapshot() (sprites 방식이면 None)
+Snapshot = namedtuple("Snapshot", ["version", "backend", "session", "rng", "scheduler",
+                                   "player", "sprites", "entities"])
+
+# 저장할 세션 변수
+SESSION_FIELDS = (
+    "state", "seed", "ticks", "tick_count", "accumulator", "pending_throws",
+    "current_stage", "stage_start_time", "game_start_ticks", "score", "death_cause",
+    "stage_clear_start_time", "stage_clear_jump_index", "total_cats",
+    "cats_spawned", "boss_spawned", "snack_spawned", "mouse_ticks_left", "next_puppy_interval",
+)
+
+# 종류별로 저장할 스프라이트 속성 (이미지, 크기, 속도처럼 생성할 때 정해지고 바뀌지 않는 값은 제외)
+# "rect", "collision_rect"는 (x, y, w, h) 튜플로 저장
+SPRITE_FIELDS = {
+    "player": ("rect", "prev_pos", "vel_y", "on_ground", "alive",
+               "defense_count", "defense_active", "gold_shuriken_count"),
+    "cat": ("color_name", "rect", "prev_pos", "hp", "jump_timer", "vel_y", "on_ground"),
+    "mouse": ("rect", "collision_rect", "prev_pos", "hp", "speed"),
+    "boss": ("rect", "prev_pos", "hp", "attack_timer", "move_timer", "move_interval", "is_moving",
+             "attack_interval", "pattern_state"),
+    "snack": ("rect", "prev_pos"),
+    "puppy": ("rect", "prev_pos"),
+    "stone": ("rect", "prev_pos", "pos_x", "pos_y", "vel_x", "vel_y", "gravity"),
+    "shuriken": ("rect", "prev_pos"),
+    "gold_shuriken": ("rect", "prev_pos"),
+}
+
+# 스프라이트 클래스 -> 종류 이름 (GoldShuriken은 Shuriken을 상속하지 않으므로 정확히 일치)
+_KIND_OF = {
+    Player: "player",
+    EnemyCat: "cat",
+    MouseEnemy: "mouse",
+    BossCat: "boss",
+    Snack: "snack",
+    Puppy: "puppy",
+    Stone: "stone",
+    Shuriken: "shuriken",
+    GoldShuriken: "gold_shuriken",
+}
+
+_RECT_FIELDS = ("rect", "collision_rect")
+
+
+def _pack(value):
+    """Rect -> (x, y, w, h) 튜플, 나머지는 그대로"""
+    return tuple(value) if isinstance(value, pygame.Rect) else value
+
+
+def _fields(sprite, kind):
+    """스프라이트 -> 속성 튜플 (prev_pos는 아직 틱을 거치지 않았으면 None)"""
+    return tuple(_pack(getattr(sprite, name, None)) for name in SPRITE_FIELDS[kind])
+
+
+def _sprite_record(sprite):
+    """스프라이트 -> (종류, 속성 튜플)"""
+    kind = _KIND_OF[type(sprite)]
+    if kind == "player":
+        return (kind, ())  # 플레이어 속성은 따로 저장 (그룹에 없을 때도 복원해야 하므로)
+    return (kind, _fields(sprite, kind))
+
+
+def _apply_fields(sprite, kind, values):
+    """속성 튜플을 스프라이트에 다시 씀"""
+    for name, value in zip(SPRITE_FIELDS[kind], values):
+        if name in _RECT_FIELDS:
+            value = pygame.Rect(value)
+        setattr(sprite, name, value)
+
+
+def capture(session):
+    """
+    세션의 현재 상태를 스냅샷으로 저장합니다.
+
+    Returns:
+        Snapshot
+    """
+    return Snapshot(
+        version=SNAPSHOT_VERSION,
+        backend=session.backend,
+        session=tuple(getattr(session, name) for name in SESSION_FIELDS),
+        rng=session.rng.getstate(),
+        scheduler=session.scheduler.snapshot(),
+        player=_fields(session.player, "player"),
+        sprites=tuple(_sprite_record(sprite) for sprite in session.all_sprites),
+        entities=session.entities.snapshot() if session.entities is not None else None,
+    )
+
+
+def _make_sprite(session, kind, values):
+    """
+    저장된 종류의 스프라이트를 만들어 알맞은 그룹에 넣습니다 (속성은 호출한 쪽에서 덮어씀).
+
+    Returns:
+        스프라이트 (그룹에 이미 추가됨)
+    """
+    if kind == "player":
+        sprite = session.player
+        sprite.add(session.all_sprites)
+        return sprite
+    if kind == "stone":
+        return session.stone_pool.acquire(0, 0)
+    if kind == "shuriken":
+        return session.shuriken_pool.acquire(0, 0)
+    if kind == "gold_shuriken":
+        return session.gold_shuriken_pool.acquire(0, 0)
+    if kind == "cat":
+        sprite = EnemyCat(0, 0, values[0], session.current_stage)
+        group = session.enemies
+    elif kind == "mouse":
+        sprite = MouseEnemy(0, 0, session.current_stage, rng=session.rng)
+        group = session.mice
+    elif kind == "boss":
+        # 이벤트는 스케줄러 스냅샷에서 복원하므로 scheduler 없이 만들고 나중에 연결
+        stone_pool = session.entities.stone_launcher if session.entities is not None else session.stone_pool
+        sprite = BossCat(0, 0, session.current_stage, stone_groups=(session.stones, session.all_sprites),
+                         stone_pool=stone_pool, rng=session.rng, target=session.player)
+        sprite.scheduler = session.scheduler
+        group = session.enemies
+    elif kind == "snack":
+        sprite = Snack(0, 0)
+        group = session.items
+    else:  # "puppy"
+        sprite = Puppy(0, 0)
+        group = session.puppies
+    sprite.add(group, session.all_sprites)
+    return sprite
+
+
+def restore(session, snapshot):
+    """
+    세션을 스냅샷을 저장한 순간의 상태로 되돌립니다.
+
+    Raises:
+        ValueError: 스냅샷 버전이나 엔티티 저장 방식이 다름
+    """
+    if snapshot.version != SNAPSHOT_VERSION:
+        raise ValueError(f"지원하지 않는 스냅샷 버전: {snapshot.version}")
+    if snapshot.backend != session.backend:
+        raise ValueError(f"엔티티 저장 방식이 다릅니다 (스냅샷: {snapshot.backend}, 세션: {session.backend})")
+
+    for name, value in zip(SESSION_FIELDS, snapshot.session):
+        setattr(session, name, value)
+
+    # 지금 있는 스프라이트를 모두 빼고 (수리검/돌은 풀로 돌아감) 저장된 순서대로 다시 넣음
+    # 종류별 그룹의 순서도 all_sprites 순서를 따르므로 충돌 처리 순서까지 같아짐
+    for group in [session.enemies, session.mice, session.shurikens, session.items, session.puppies, session.stones]:
+        group.empty()
+    session.all_sprites.empty()
+    for pool in (session.shuriken_pool, session.gold_shuriken_pool, session.stone_pool):
+        pool.collect()  # 방금 뺀 투사체를 바로 재사용하도록 회수
+    _apply_fields(session.player, "player", snapshot.player)
+    boss = None
+    for kind, values in snapshot.sprites:
+        sprite = _make_sprite(session, kind, values)
+        _apply_fields(sprite, kind, values)
+        if kind == "boss":
+            boss = sprite
+    session.grid.clear()
+    if session.entities is not None:
+        session.entities.restore(snapshot.entities)
+
+    # 이벤트 이름 -> 함수 다시 연결
+    actions = {
+        "cat": session._spawn_cat,
+        "mouse": session._spawn_mouse,
+        "snack": session._spawn_snack,
+        "puppy": session._spawn_puppy,
+        "stage_start": session._start_next_stage,
+    }
+    if boss is not None:
+        actions["boss_attack"] = boss.attack
+        actions["boss_move"] = boss.start_move
+    session.scheduler.restore(snapshot.scheduler, actions)
+
+    # 스프라이트를 만들면서 뽑은 랜덤 값은 버리고 저장된 상태로 되돌림 (마지막에)
+    session.rng.setstate(snapshot.rng)
+
+
+def to_bytes(snapshot):
+    """Snapshot -> 파일에 쓸 bytes (매직 + 버전 + 압축된 marshal 데이터)"""
+    return MAGIC + bytes((snapshot.version,)) + zlib.compress(marshal.dumps(tuple(snapshot)))
+
+
+def from_bytes(data):
+    """
+    파일에서 읽은 bytes -> Snapshot
+
+    Raises:
+        ValueError: 스냅샷 파일이 아니거나 지원하지 않는 버전
+    """
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("스냅샷 파일이 아닙니다")
+    version = data[len(MAGIC)]
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"지원하지 않는 스냅샷 버전: {version}")
+    return Snapshot(*marshal.loads(zlib.decompress(data[len(MAGIC) + 1:])))
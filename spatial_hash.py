@@ -0,0 +1,176 @@
+# spatial_hash.py
+
+# ============================================================================
+# 🧱 공간 해시 (Spatial Hash) - 충돌 판정 1차 필터
+# ============================================================================
+# 화면을 일정한 크기의 격자(cell)로 나누고, 각 스프라이트가 걸쳐 있는 칸에 등록합니다.
+# 충돌을 검사할 때는 같은 칸에 있는 스프라이트만 후보로 꺼내 rect 검사를 하므로,
+# "수리검 수 × 적 수" 전체를 비교하지 않아도 됩니다.
+#
+# 매 틱 sync()를 호출하면 칸이 바뀐 스프라이트만 옮기고,
+# 사라진 스프라이트는 제거합니다 (전체를 다시 만들지 않음).
+#
+# 칸 안의 등록 순서는 언제 칸을 옮겼는지(sync 이력)에 따라 달라지므로 결과 순서로 쓰지 않습니다.
+# query()는 겹친 스프라이트를 sync()에 전달된 목록 순서(보통 all_sprites = 추가된 순서)로 돌려주므로
+# "겹친 첫 번째 스프라이트"는 기존 spritecollideany()처럼 그룹에 가장 먼저 추가된 스프라이트입니다.
+
+
+class SpatialHash:
+    """
+    균일 격자 기반 공간 해시
+
+    주요 기능:
+    - sync(): 스프라이트 위치 변화를 반영 (칸이 바뀐 것만 갱신)
+    - query(): rect와 겹치는 스프라이트 후보를 찾고 rect 충돌까지 확인
+    - 한 개의 해시를 적, 마우스, 돌, 아이템 충돌 처리가 함께 사용
+
+    query() 결과는 sync()에 전달된 목록 순서입니다. 스프라이트를 all_sprites와 다른 그룹에
+    함께 추가하므로 그룹 순서(= 스폰 순서)와 같고, 같은 입력이면 항상 같은 순서입니다 (리플레이/결정성 보장).
+    """
+
+    def __init__(self, cell_size):
+        """
+        Args:
+            cell_size: 격자 한 칸의 크기 (픽셀)
+        """
+        self.cell_size = cell_size
+        self._cells = {}    # (칸 x, 칸 y) -> {스프라이트: 스프라이트의 rect}
+        self._entries = {}  # 스프라이트 -> (칸 범위, 등록된 rect 객체)
+        self._order = {}    # 스프라이트 -> 마지막 sync() 목록에서의 위치 (query 결과 정렬용)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _cell_range(self, rect):
+        """rect가 걸쳐 있는 칸 범위 (x0, y0, x1, y1)를 반환합니다."""
+        size = self.cell_size
+        return (rect.left // size, rect.top // size,
+                (rect.right - 1) // size, (rect.bottom - 1) // size)
+
+    def _add_cells(self, sprite, cells):
+        x0, y0, x1, y1 = cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self._cells.get((cx, cy))
+                if bucket is None:
+                    bucket = self._cells[(cx, cy)] = {}
+                # 값으로 rect 객체 자체를 넣어 두면 Rect.collidedictall()로
+                # 칸 안의 충돌 검사를 C 코드에서 한 번에 처리할 수 있음
+                bucket[sprite] = sprite.rect
+
+    def _remove_cells(self, sprite, cells):
+        x0, y0, x1, y1 = cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self._cells.get((cx, cy))
+                if bucket is not None:
+                    bucket.pop(sprite, None)
+                    if not bucket:
+                        del self._cells[(cx, cy)]
+
+    def update(self, sprite):
+        """
+        스프라이트 하나를 등록하거나, 칸이 바뀌었으면 옮깁니다.
+
+        Returns:
+            bool: 칸이 새로 등록/변경되었으면 True
+        """
+        rect = sprite.rect
+        cells = self._cell_range(rect)
+        entry = self._entries.get(sprite)
+        if entry is not None:
+            # rect 객체가 새로 바뀐 경우(스프라이트 재사용 등)에는 칸이 같아도 다시 등록
+            if entry[0] == cells and entry[1] is rect:
+                return False  # 같은 칸 안에서만 움직임 - 갱신 불필요
+            self._remove_cells(sprite, entry[0])
+        self._add_cells(sprite, cells)
+        self._entries[sprite] = (cells, rect)
+        self._order.setdefault(sprite, len(self._order))  # sync() 밖에서 등록하면 맨 뒤
+        return True
+
+    def remove(self, sprite):
+        """스프라이트를 해시에서 제거합니다."""
+        entry = self._entries.pop(sprite, None)
+        if entry is not None:
+            self._remove_cells(sprite, entry[0])
+
+    def sync(self, sprites):
+        """
+        스프라이트 목록의 현재 위치를 반영합니다.
+
+        Args:
+            sprites: 해시에 있어야 할 스프라이트들 (보통 all_sprites)
+
+        Returns:
+            int: 칸이 바뀌어 갱신된 스프라이트 수
+
+        목록에 없는 스프라이트(kill()된 것 등)는 해시에서 제거됩니다.
+        """
+        size = self.cell_size
+        entries = self._entries
+        sprites = list(sprites)
+
+        for sprite in entries.keys() - set(sprites):
+            self.remove(sprite)
+        self._order = dict(zip(sprites, range(len(sprites))))
+
+        moved = 0
+        for sprite in sprites:
+            rect = sprite.rect
+            entry = entries.get(sprite)
+            if (entry is not None and entry[1] is rect
+                    and entry[0] == (rect.left // size, rect.top // size,
+                                     (rect.right - 1) // size, (rect.bottom - 1) // size)):
+                continue  # 같은 칸 안에서만 움직임 - 갱신 불필요
+            self.update(sprite)
+            moved += 1
+        return moved
+
+    def clear(self):
+        """해시를 비웁니다."""
+        self._cells.clear()
+        self._entries.clear()
+        self._order.clear()
+
+    def query(self, rect, group=None):
+        """
+        rect와 실제로 겹치는 스프라이트 목록을 반환합니다.
+
+        Args:
+            rect: 검사할 영역 (pygame.Rect)
+            group: 지정하면 이 그룹에 속한 스프라이트만 반환
+
+        Returns:
+            list: 겹치는 스프라이트들 (sync()에 전달된 목록 순서 = 그룹에 추가된 순서)
+        """
+        size = self.cell_size
+        x0, x1 = rect.left // size, (rect.right - 1) // size
+        y0, y1 = rect.top // size, (rect.bottom - 1) // size
+        cells = self._cells
+        members = group.spritedict if group is not None else None
+
+        if x0 == x1 and y0 == y1:
+            # 한 칸 안에 들어가는 경우 (가장 흔함) - 중복 제거가 필요 없음
+            bucket = cells.get((x0, y0))
+            if not bucket:
+                return []
+            hits = [sprite for sprite, _ in rect.collidedictall(bucket, 1)
+                    if members is None or sprite in members]
+        else:
+            found = {}
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket:
+                        for sprite, _ in rect.collidedictall(bucket, 1):
+                            if members is None or sprite in members:
+                                found[sprite] = None
+            hits = list(found)
+        if len(hits) > 1:
+            hits.sort(key=self._order.__getitem__)
+        return hits
+
+    def first(self, rect, group=None):
+        """rect와 겹치는 첫 번째 스프라이트를 반환합니다 (없으면 None, 가장 먼저 추가된 스프라이트)."""
+        hits = self.query(rect, group)
+        return hits[0] if hits else None
@@ -0,0 +1,1210 @@
+# sprites.py
+
+import pygame
+import random
+import config
+import asset_cache
+import boss_patterns
+import gamelog
+from archetypes import get_cat_archetype
+from scheduler import PRIORITY_BOSS_ATTACK, PRIORITY_BOSS_MOVE, ticks_until
+
+# ============================================================================
+# 🎮 게임 스프라이트 클래스 모음
+# ============================================================================
+# 화면(display)이나 오디오 없이도 사용할 수 있도록 main.py에서 분리했습니다.
+# 창을 띄우는 코드는 main.py, 게임 로직은 session.py가 담당합니다.
+
+# 카테고리별 로거 (출력 레벨은 config.LOG_LEVELS에서 설정)
+_log_asset = gamelog.get_logger("asset")
+_log_item = gamelog.get_logger("item")
+_log_defense = gamelog.get_logger("defense")
+_log_spawn = gamelog.get_logger("spawn")
+_log_boss = gamelog.get_logger("boss")
+
+# 이미지 로드 실패 경고는 스폰마다 반복되므로 호출 위치별로 속도 제한
+_ONCE_PER_SEC = gamelog.every(config.LOG_RATE_LIMIT_MS)
+
+# ============================================================================
+# 🐕 플레이어 클래스 (Player Class)
+# ============================================================================
+# 플레이어는 게임의 주인공인 강아지 닌자입니다.
+# 이 클래스는 플레이어의 모든 동작과 상태를 관리합니다.
+
+class Player(pygame.sprite.Sprite):
+    """
+    플레이어(강아지 닌자) 클래스
+    
+    주요 기능:
+    - 좌우 이동 (← → 키)
+    - 점프 (스페이스바)
+    - 수리검 발사 (Z 키)
+    - puppy 방어 효과 사용
+    - 간식 효과 (더블 수리검)
+    
+    pygame.sprite.Sprite를 상속받아 Pygame의 스프라이트 시스템을 사용합니다.
+    """
+    
+    def __init__(self):
+        """
+        플레이어 초기화 - 플레이어 객체가 생성될 때 한 번만 실행됩니다.
+        
+        이 메서드에서:
+        - 플레이어의 이미지를 로드하고 크기를 조정합니다
+        - 플레이어의 초기 위치를 설정합니다
+        - 플레이어의 물리 속성(속도, 중력 등)을 초기화합니다
+        - 게임 상태 변수들을 초기화합니다
+        """
+        super().__init__()  # pygame.sprite.Sprite 초기화 (반드시 필요)
+        
+        # ===== 이미지 로드 및 설정 =====
+        try:
+            # assets/player.png 이미지를 config.py에 정의된 크기로 가져옵니다
+            # asset_cache가 로드/크기 조정을 한 번만 수행하고 결과를 공유합니다
+            self.image = asset_cache.get_image("assets/player.png", (config.PLAYER_WIDTH, config.PLAYER_HEIGHT))
+        except:
+            # 이미지 로드 실패 시 기본 사각형으로 대체 (갈색 사각형, 캐시에서 한 번만 만들어 공유)
+            self.image = asset_cache.get_fallback("player", (config.PLAYER_WIDTH, config.PLAYER_HEIGHT),
+                                                  (200, 150, 100))
+            _log_asset.warning("⚠️ 플레이어 이미지 로드 실패 - 기본 사각형 사용", extra=_ONCE_PER_SEC)
+        
+        # ===== 충돌 영역 설정 =====
+        # rect는 플레이어의 충돌 영역을 나타냅니다
+        # get_rect()로 이미지 크기에 맞는 사각형을 생성합니다
+        self.rect = self.image.get_rect()
+        
+        # 플레이어의 초기 위치 설정
+        # bottomleft는 사각형의 왼쪽 하단 모서리를 의미합니다
+        # config.py에서 설정된 위치를 사용합니다
+        self.rect.bottomleft = (config.PLAYER_START_X, config.PLAYER_START_Y)
+        
+        # ===== 물리 속성 초기화 =====
+        self.vel_y = 0        # Y축 속도 (점프, 낙하할 때 사용)
+        self.speed = config.PLAYER_SPEED  # 좌우 이동 속도 (config.py에서 가져옴)
+        self.on_ground = True # 지면 접촉 여부 (점프 가능 여부 판단용)
+        
+        # ===== 게임 상태 변수 초기화 =====
+        self.alive = True           # 생존 여부 (True = 살아있음, False = 죽음)
+        
+        # ===== puppy 방어 시스템 변수 =====
+        self.defense_count = 0      # 남은 방어 횟수 (0 = 방어 불가, 1 이상 = 방어 가능)
+        self.defense_active = False # 방어 효과 활성화 여부
+        
+        # ===== gold shuriken 시스템 변수 =====
+        self.gold_shuriken_count = 0  # 보유한 gold shuriken 갯수
+        
+        # ===== 함께 다니는 puppy (방어 효과 표시용 자식 스프라이트) =====
+        self.companion = PuppyCompanion()
+
+    def update(self, inputs):
+        """
+        플레이어 상태 업데이트 - 매 프레임마다 호출됩니다.
+        
+        Args:
+            inputs: session.PlayerInput 입력 상태
+                    (left, right, jump 값이 True면 해당 키를 누르고 있음)
+        
+        이 메서드에서:
+        - 키 입력에 따른 플레이어 이동을 처리합니다
+        - 점프와 낙하를 처리합니다
+        - 화면 경계를 벗어나지 않도록 제한합니다
+        - 더블 수리검 효과 시간을 체크합니다
+        """
+        # 플레이어가 죽어있으면 업데이트하지 않음
+        if not self.alive:
+            return
+        
+        # ===== 좌우 이동 처리 =====
+        if inputs.left:  # 왼쪽 화살표 키를 누르고 있으면
+            self.rect.x -= self.speed  # 왼쪽으로 이동 (X좌표 감소)
+            # 화면 왼쪽 경계 체크 - 화면 밖으로 나가지 않도록 제한
+            if self.rect.left < 0:
+                self.rect.left = 0  # 왼쪽 경계에 고정
+                
+        if inputs.right:  # 오른쪽 화살표 키를 누르고 있으면
+            self.rect.x += self.speed  # 오른쪽으로 이동 (X좌표 증가)
+            # 화면 오른쪽 경계 체크 - 화면 밖으로 나가지 않도록 제한
+            if self.rect.right > config.WIDTH:
+                self.rect.right = config.WIDTH  # 오른쪽 경계에 고정
+
+        # ===== 점프 처리 =====
+        if inputs.jump and self.on_ground:  # 위쪽 화살표 + 지면 접촉 시
+            self.vel_y = config.PLAYER_JUMP_VELOCITY  # 점프 속도 설정 (음수 = 위로)
+            self.on_ground = False  # 점프 중이므로 지면에서 떨어짐
+
+        # ===== 중력 적용 =====
+        self.vel_y += config.GRAVITY  # 중력으로 인해 아래로 가속
+        self.rect.y += self.vel_y     # Y축 위치 업데이트
+
+        # ===== 지면 처리 =====
+        if self.rect.bottom >= config.HEIGHT - 50:  # 바닥에 닿으면
+            self.rect.bottom = config.HEIGHT - 50   # 바닥에 고정
+            self.vel_y = 0                          # 낙하 속도 초기화
+            self.on_ground = True                   # 지면 접촉 상태로 변경
+
+
+
+    def eat_snack(self):
+        """
+        간식을 먹었을 때 gold shuriken을 최대치로 충전합니다.
+        
+        이 메서드는 간식과 충돌했을 때 자동으로 호출됩니다.
+        """
+        # gold shuriken 갯수를 최대치로 충전
+        self.gold_shuriken_count = config.GOLD_SHURIKEN_MAX_COUNT
+        _log_item.info("🍪 간식 획득! Gold Shuriken 최대 충전: %d/%d",
+                       self.gold_shuriken_count, config.GOLD_SHURIKEN_MAX_COUNT)
+
+    def get_puppy(self):
+        """
+        puppy 아이템을 획득하여 방어 효과를 활성화합니다.
+        
+        Returns:
+            bool: puppy 획득 성공 여부
+                  True = 획득 성공, False = 이미 보유 중
+        
+        이 메서드는 puppy와 충돌했을 때 자동으로 호출됩니다.
+        """
+        if self.defense_count == 0:  # puppy가 없을 때만 획득 가능
+            self.defense_count = config.PUPPY_DEFENSE_COUNT  # config에서 방어 횟수 가져오기
+            self.defense_active = True  # 방어 효과 활성화
+            _log_defense.info("🐕 puppy 획득 성공: defense_count=%d", self.defense_count)
+            return True  # puppy 획득 성공
+            
+        _log_defense.debug("🐕 이미 puppy 보유 중: defense_count=%d", self.defense_count)
+        return False  # 이미 puppy를 가지고 있음
+
+    def use_defense(self):
+        """
+        방어 효과 사용 (충돌 시 자동 호출) - 현재는 사용되지 않음
+        
+        Returns:
+            bool: 방어 효과 사용 성공 여부
+                  True = 방어 성공, False = 방어 실패
+        
+        이 메서드는 이전 버전에서 사용되었지만, 현재는 remove_puppy_defense()로 대체되었습니다.
+        """
+        if self.defense_count > 0:
+            self.defense_count -= 1  # 방어 횟수 1회 감소
+            if self.defense_count <= 0:
+                self.defense_active = False  # 방어 횟수가 0이 되면 비활성화
+            return True  # 방어 성공
+        return False  # 방어 실패
+
+    def has_defense(self):
+        """
+        현재 방어 효과 보유 여부를 확인합니다.
+        
+        Returns:
+            bool: 방어 효과 보유 여부
+                  True = 방어 효과 있음, False = 방어 효과 없음
+        
+        이 메서드는 충돌 감지 시 플레이어가 방어 효과를 가지고 있는지 확인하는 데 사용됩니다.
+        """
+        return self.defense_count > 0
+
+    def remove_puppy_defense(self):
+        """
+        puppy 방어 효과를 소모합니다 (충돌 시 자동 호출).
+        
+        Returns:
+            bool: 방어 효과 소모 성공 여부
+                  True = 소모 성공, False = 소모 실패
+        
+        이 메서드는 플레이어가 적이나 돌과 충돌했을 때 자동으로 호출됩니다.
+        방어 횟수가 1회 감소하고, 0이 되면 방어 효과가 비활성화됩니다.
+        """
+        if self.defense_count > 0:
+            self.defense_count -= 1  # 방어 횟수 1회 감소
+            if self.defense_count <= 0:
+                self.defense_active = False  # 방어 횟수가 0이 되면 비활성화
+                _log_defense.info("🐕 puppy 방어 효과 완전 소모됨")
+            else:
+                _log_defense.info("🐕 puppy 방어 효과 1회 소모, 남은 횟수: %d", self.defense_count)
+            return True
+        return False
+
+    def draw_puppy(self, screen, pos=None):
+        """
+        플레이어 오른쪽에 puppy를 표시합니다 (방어 효과 활성화 시).
+        
+        Args:
+            screen: pygame 화면 객체 (그리기 대상)
+            pos: 플레이어를 그린 위치 (왼쪽 위, 틱 사이 보간 위치), 없으면 self.rect 위치
+        
+        Returns:
+            pygame.Rect: 그린 영역 (puppy가 없어서 그리지 않았으면 None)
+        
+        이 메서드는 플레이어가 puppy 방어 효과를 가지고 있을 때만 그립니다.
+        이미지는 PuppyCompanion이 미리 준비해 두므로, 매 프레임 위치만 갱신합니다.
+        """
+        if self.defense_count > 0:  # puppy가 있을 때만 표시
+            self.companion.follow(self, pos)
+            return screen.blit(self.companion.image, self.companion.rect)
+        return None
+
+    def throw_gold_shuriken(self):
+        """
+        gold shuriken을 던집니다.
+        
+        Returns:
+            bool: gold shuriken 발사 성공 여부
+                  True = 발사 성공, False = 발사 실패 (gold shuriken 부족)
+        
+        이 메서드는 플레이어가 gold shuriken을 발사할 때 호출됩니다.
+        """
+        if self.gold_shuriken_count > 0:
+            self.gold_shuriken_count -= 1
+            _log_item.debug("🥷 Gold Shuriken 발사! 남은 갯수: %d", self.gold_shuriken_count)
+            return True
+        else:
+            _log_item.debug("🥷 Gold Shuriken이 부족합니다!")
+            return False
+
+
+# ============================================================================
+# 🐶 동행 강아지 클래스 (PuppyCompanion Class)
+# ============================================================================
+# 플레이어가 puppy 방어 효과를 가지고 있을 때 플레이어 옆에 표시되는 작은 강아지입니다.
+# 이미지는 생성할 때 한 번만 준비하고, 매 프레임 플레이어 위치만 따라갑니다.
+
+class PuppyCompanion(pygame.sprite.Sprite):
+    """
+    동행 강아지 클래스 (플레이어의 자식 스프라이트)
+    
+    주요 기능:
+    - 방어 효과가 있을 때 플레이어 오른쪽에 표시
+    - 이미지는 한 번만 준비 (매 프레임 파일을 읽지 않음)
+    - follow()로 플레이어 기준 위치를 갱신
+    
+    pygame.sprite.Sprite를 상속받아 Pygame의 스프라이트 시스템을 사용합니다.
+    """
+    
+    def __init__(self):
+        """
+        동행 강아지 초기화 - 플레이어가 생성될 때 한 번만 실행됩니다.
+        
+        이 메서드에서:
+        - puppy 이미지를 플레이어보다 작은 크기로 준비합니다 (원본 방향, 좌우 반전 없음)
+        - 이미지 로드 실패 시 주황색 원 이미지를 대신 만듭니다
+        """
+        super().__init__()  # pygame.sprite.Sprite 초기화 (반드시 필요)
+        
+        size = config.PUPPY_DISPLAY_SIZE  # 플레이어와 함께 표시될 때의 크기
+        try:
+            self.image = asset_cache.get_image("assets/puppy.png", (size, size))
+        except:
+            # 이미지 로드 실패 시 주황색 원으로 대체 (투명 배경 Surface에 한 번만 그림)
+            self.image = asset_cache.get_fallback("puppy_companion", (size, size), (255, 200, 100), "circle")
+        
+        self.rect = self.image.get_rect()
+    
+    def follow(self, player, pos=None):
+        """
+        플레이어 오른쪽에 위치하도록 rect를 갱신합니다.
+        
+        Args:
+            player: 따라갈 Player 객체
+            pos: 플레이어를 그린 위치 (왼쪽 위, 보간된 실수 좌표), 없으면 player.rect 위치
+        
+        puppy의 중심이 플레이어 오른쪽 10픽셀, 플레이어 중앙 높이에 오도록 맞춥니다.
+        보간 위치를 받으면 플레이어 스프라이트와 같은 위치를 기준으로 삼아 한 틱 앞서 그려지지 않습니다.
+        """
+        if pos is None:
+            x, y = player.rect.topleft
+        else:
+            x, y = int(pos[0]), int(pos[1])  # blit과 같이 소수점 아래를 버림
+        self.rect.center = (x + player.rect.width + 10, y + player.rect.height // 2)
+
+# ============================================================================
+# 🥷 수리검 클래스 (Shuriken Class)
+# ============================================================================
+# 수리검은 플레이어가 발사하는 무기입니다.
+# Z 키를 누르면 발사되며, 적을 공격할 수 있습니다.
+
+class Shuriken(pygame.sprite.Sprite):
+    """
+    수리검 클래스
+    
+    주요 기능:
+    - 플레이어가 발사하는 투척 무기
+    - 오른쪽으로 직선 이동
+    - 적과 충돌 시 데미지
+    - 화면 밖으로 나가면 자동 제거
+    
+    pygame.sprite.Sprite를 상속받아 Pygame의 스프라이트 시스템을 사용합니다.
+    """
+    
+    def __init__(self, x, y):
+        """
+        수리검 초기화 - 수리검 객체가 생성될 때 한 번만 실행됩니다.
+        
+        Args:
+            x: 수리검 시작 X 좌표 (보통 플레이어의 오른쪽 위치)
+            y: 수리검 시작 Y 좌표 (보통 플레이어의 중앙 높이)
+        
+        이 메서드에서:
+        - 수리검의 이미지를 로드하고 크기를 조정합니다
+        - 수리검의 초기 위치를 설정합니다
+        - 수리검의 이동 속도를 설정합니다
+        """
+        super().__init__()  # pygame.sprite.Sprite 초기화 (반드시 필요)
+        
+        # ===== 이미지 로드 및 설정 =====
+        try:
+            # assets/shuriken.png 이미지를 config.py에 정의된 크기로 가져옵니다
+            # 캐시된 Surface를 공유하므로 발사할 때마다 파일을 읽지 않습니다
+            self.image = asset_cache.get_image("assets/shuriken.png", (config.SHURIKEN_WIDTH, config.SHURIKEN_HEIGHT))
+        except:
+            # 이미지 로드 실패 시 검은색 사각형으로 대체 (캐시에서 한 번만 만들어 공유)
+            self.image = asset_cache.get_fallback("shuriken", (config.SHURIKEN_WIDTH, config.SHURIKEN_HEIGHT),
+                                                  config.BLACK)
+            _log_asset.warning("⚠️ 수리검 이미지 로드 실패 - 기본 사각형 사용", extra=_ONCE_PER_SEC)
+        
+        # ===== 충돌 영역 설정 =====
+        # rect는 수리검의 충돌 영역을 나타냅니다 (위치는 reset()에서 설정)
+        self.rect = self.image.get_rect()
+        self.reset(x, y)
+    
+    def reset(self, x, y):
+        """
+        수리검을 (x, y)에서 다시 발사할 상태로 되돌립니다.
+        
+        생성할 때, 그리고 ProjectilePool이 kill()된 수리검을 재사용할 때 호출됩니다.
+        이미지는 그대로 두고 위치와 속도만 다시 설정합니다.
+        """
+        # get_rect(center=(x, y))와 같이 이미지 중심을 기준으로 위치를 설정합니다
+        self.rect.center = (x, y)
+        
+        # ===== 이동 속도 설정 =====
+        # 수리검 이동 속도 (config.py에서 가져옴)
+        # 양수 값이므로 오른쪽으로 이동합니다
+        self.speed = config.SHURIKEN_SPEED
+    
+    def update(self, keys=None):
+        """
+        수리검 상태 업데이트 - 매 프레임마다 호출됩니다.
+        
+        Args:
+            keys: 키 입력 (수리검은 자동 이동하므로 사용하지 않음)
+        
+        이 메서드에서:
+        - 수리검을 오른쪽으로 이동시킵니다
+        - 화면 밖으로 나가면 자동으로 제거합니다
+        """
+        # ===== 수리검 이동 =====
+        # 수리검을 오른쪽으로 이동 (X좌표 증가)
+        self.rect.x += self.speed
+        
+        # ===== 화면 경계 체크 =====
+        # 화면 왼쪽 밖으로 나가면 자동 제거 (메모리 절약)
+        # 화면 왼쪽 경계는 0보다 작은 값입니다
+        if self.rect.left > config.WIDTH:
+            self.kill()  # 스프라이트를 제거하고 메모리에서 해제
+
+# ============================================================================
+# 🥷 골드 수리검 클래스 (GoldShuriken Class)
+# ============================================================================
+# 골드 수리검은 플레이어가 발사하는 강력한 무기입니다.
+# snack을 먹으면 획득할 수 있으며, 일반 수리검보다 2배 강력합니다.
+
+class GoldShuriken(pygame.sprite.Sprite):
+    """
+    골드 수리검 클래스
+    
+    주요 기능:
+    - 플레이어가 발사하는 강력한 투척 무기
+    - 오른쪽으로 직선 이동
+    - 적과 충돌 시 2배 데미지
+    - 화면 밖으로 나가면 자동 제거
+    
+    pygame.sprite.Sprite를 상속받아 Pygame의 스프라이트 시스템을 사용합니다.
+    """
+    
+    def __init__(self, x, y):
+        """
+        골드 수리검 초기화 - 골드 수리검 객체가 생성될 때 한 번만 실행됩니다.
+        
+        Args:
+            x: 골드 수리검 시작 X 좌표 (보통 플레이어의 오른쪽 위치)
+            y: 골드 수리검 시작 Y 좌표 (보통 플레이어의 중앙 높이)
+        
+        이 메서드에서:
+        - 골드 수리검의 이미지를 로드하고 크기를 조정합니다
+        - 골드 수리검의 초기 위치를 설정합니다
+        - 골드 수리검의 이동 속도를 설정합니다
+        """
+        super().__init__()  # pygame.sprite.Sprite 초기화 (반드시 필요)
+        
+        # ===== 이미지 로드 및 설정 =====
+        try:
+            # config.py에 정의된 크기로 골드 수리검 이미지 가져오기 (일반 수리검의 2배 크기)
+            # 캐시된 Surface를 공유하므로 발사할 때마다 파일을 읽지 않습니다
+            gold_width = config.SHURIKEN_WIDTH * config.GOLD_SHURIKEN_SIZE_MULTIPLIER
+            gold_height = config.SHURIKEN_HEIGHT * config.GOLD_SHURIKEN_SIZE_MULTIPLIER
+            self.image = asset_cache.get_image("assets/gold_shuriken.png", (gold_width, gold_height))
+        except:
+            # 이미지 로드 실패 시 노란색 사각형으로 대체 (캐시에서 한 번만 만들어 공유)
+            gold_width = config.SHURIKEN_WIDTH * config.GOLD_SHURIKEN_SIZE_MULTIPLIER
+            gold_height = config.SHURIKEN_HEIGHT * config.GOLD_SHURIKEN_SIZE_MULTIPLIER
+            self.image = asset_cache.get_fallback("gold_shuriken", (gold_width, gold_height), config.YELLOW)
+            _log_asset.warning("⚠️ 골드 수리검 이미지 로드 실패 - 기본 사각형 사용", extra=_ONCE_PER_SEC)
+        
+        # ===== 충돌 영역 설정 =====
+        # rect는 골드 수리검의 충돌 영역을 나타냅니다 (위치는 reset()에서 설정)
+        self.rect = self.image.get_rect()
+        self.reset(x, y)
+    
+    def reset(self, x, y):
+        """
+        골드 수리검을 (x, y)에서 다시 발사할 상태로 되돌립니다.
+        
+        생성할 때, 그리고 ProjectilePool이 kill()된 골드 수리검을 재사용할 때 호출됩니다.
+        """
+        # get_rect(center=(x, y))와 같이 이미지 중심을 기준으로 위치를 설정합니다
+        self.rect.center = (x, y)
+        
+        # ===== 이동 속도 설정 =====
+        # 골드 수리검 이동 속도 (config.py에서 가져옴)
+        # 양수 값이므로 오른쪽으로 이동합니다
+        self.speed = config.SHURIKEN_SPEED
+        
+        # ===== 데미지 배수 설정 =====
+        # 일반 수리검 대비 데미지 배수 (config.py에서 가져옴)
+        self.damage_multiplier = config.GOLD_SHURIKEN_DAMAGE_MULTIPLIER
+    
+    def update(self, keys=None):
+        """
+        골드 수리검 상태 업데이트 - 매 프레임마다 호출됩니다.
+        
+        Args:
+            keys: 키 입력 (골드 수리검은 자동 이동하므로 사용하지 않음)
+        
+        이 메서드에서:
+        - 골드 수리검을 오른쪽으로 이동시킵니다
+        - 화면 밖으로 나가면 자동으로 제거합니다
+        """
+        # ===== 골드 수리검 이동 =====
+        # 골드 수리검을 오른쪽으로 이동 (X좌표 증가)
+        self.rect.x += self.speed
+        
+        # ===== 화면 경계 체크 =====
+        # 화면 왼쪽 밖으로 나가면 자동 제거 (메모리 절약)
+        # 화면 왼쪽 경계는 0보다 작은 값입니다
+        if self.rect.left > config.WIDTH:
+            self.kill()  # 스프라이트를 제거하고 메모리에서 해제
+
+# ============================================================================
+# 🐱 적 고양이 클래스 (EnemyCat Class)
+# ============================================================================
+# 적 고양이는 플레이어를 공격하는 적입니다.
+# 노란색, 검은색, 흰색의 세 가지 타입이 있으며, 각각 다른 특성을 가집니다.
+
+class EnemyCat(pygame.sprite.Sprite):
+    """
+    적 고양이 클래스
+    
+    고양이 타입별 특성:
+    - 노란색: 빠른 점프 고양이 (낮은 점프, 빠른 점프 간격, 강한 중력)
+    - 검은색: 높은 점프 고양이 (높은 점프, 느린 점프 간격, 약한 중력)
+    - 흰색: 보통 점프 고양이 (보통 점프, 보통 점프 간격, 보통 중력)
+    
+    주요 기능:
+    - 왼쪽으로 자동 이동
+    - 플레이어와 충돌 시 게임오버
+    - 수리검에 맞으면 체력 감소
+    - 모든 고양이가 색상별로 다른 점프 패턴으로 이동
+    
+    pygame.sprite.Sprite를 상속받아 Pygame의 스프라이트 시스템을 사용합니다.
+    """
+    
+    def __init__(self, x, y, color_name, stage=1):
+        """
+        적 고양이 초기화 - 고양이 객체가 생성될 때 한 번만 실행됩니다.
+        
+        Args:
+            x: 고양이 시작 X 좌표 (보통 화면 오른쪽에서 시작)
+            y: 고양이 시작 Y 좌표 (보통 지면 높이)
+            color_name: 고양이 색상 ("yellow", "black", "white")
+            stage: 현재 스테이지 (체력 계산에 사용, 기본값: 1)
+        
+        이 메서드에서:
+        - 색상별 원형(archetype)을 가져옵니다 (크기, 이미지, 속도, 점프, 중력, 체력 표)
+        - 스테이지에 맞는 체력을 설정합니다
+        - 점프 관련 변수들을 초기화합니다
+        """
+        super().__init__()  # pygame.sprite.Sprite 초기화 (반드시 필요)
+        
+        # ===== 색상별 원형 =====
+        # config.py의 색상별 설정은 archetypes.py에서 처음 한 번만 읽어 둡니다.
+        # 고양이는 원형을 참조만 하므로 스폰할 때도, 매 틱에도 문자열로 값을 찾지 않습니다.
+        archetype = get_cat_archetype(color_name)
+        self.archetype = archetype
+        
+        # ===== 고양이 속성 설정 =====
+        self.color_name = color_name  # 색상 이름 저장 (예: "yellow", "black", "white")
+        self.color = archetype.color  # 실제 색상 값 (RGB)
+        self.hp = archetype.hp(stage)  # 체력 설정 (스테이지에 따라 증가)
+        
+        # ===== 고양이 크기 설정 =====
+        # 색상별로 다른 크기 (config.ENEMY_CAT_SIZE)
+        self.width, self.height = archetype.size
+        
+        # ===== 점프 관련 변수 (모든 고양이용) =====
+        self.vel_y = 0        # Y축 속도 (점프, 낙하할 때 사용)
+        self.on_ground = False # 지면 접촉 여부 (점프 가능 여부 판단용)
+        self.jump_timer = 0   # 점프 타이머 (점프 간격은 archetype.jump_interval)
+        
+        # ===== 고양이 이미지 =====
+        # 원형이 미리 크기 조정 + 좌우 반전해 둔 이미지를 모든 같은 색 고양이가 공유
+        self.image = archetype.image
+        
+        # ===== 고양이의 충돌 영역 설정 =====
+        # rect는 고양이의 충돌 영역을 나타냅니다
+        # midbottom=(x, y)는 사각형의 하단 중앙을 기준으로 위치를 설정합니다
+        self.rect = self.image.get_rect(midbottom=(x, y))
+        
+        # ===== 고양이 이동 속도 설정 =====
+        # 색상별로 다른 이동 속도 (config.ENEMY_CAT_SPEED)
+        self.speed = archetype.speed
+    
+    def update(self, keys=None):
+        """
+        적 고양이 상태 업데이트 - 매 프레임마다 호출됩니다.
+        
+        Args:
+            keys: 키 입력 (적은 자동 동작하므로 사용하지 않음)
+        
+        이 메서드에서:
+        - 색상별 간격으로 점프를 처리합니다
+        - 고양이를 왼쪽으로 이동시킵니다
+        - 화면 밖으로 나가면 자동으로 제거합니다
+        """
+        archetype = self.archetype
+        
+        # ===== 모든 고양이 점프 로직 =====
+        # 점프 타이머 증가 (고정 틱 1회만큼 증가, config.TICK_MS)
+        self.jump_timer += config.TICK_MS
+        
+        # 점프 간격에 도달하면 점프
+        if self.jump_timer >= archetype.jump_interval:
+            self.vel_y = archetype.jump_velocity  # 색상별 점프 속도 설정
+            self.jump_timer = 0  # 타이머 리셋
+        
+        # 중력 적용 (점프 후 낙하, 색상별 중력)
+        self.vel_y += archetype.gravity
+        
+        # Y축 위치 업데이트
+        self.rect.y += self.vel_y
+        
+        # ===== 지면 처리 =====
+        # 바닥에 닿으면 점프 속도 초기화
+        if self.rect.bottom >= config.HEIGHT - 50:
+            self.rect.bottom = config.HEIGHT - 50  # 바닥에 고정
+            self.vel_y = 0  # 낙하 속도 초기화
+        
+        # ===== 고양이 이동 =====
+        # 고양이를 왼쪽으로 이동 (X좌표 감소)
+        self.rect.x -= self.speed
+        
+        # ===== 화면 경계 체크 =====
+        # 화면 왼쪽 밖으로 나가면 자동 제거 (메모리 절약)
+        if self.rect.right < 0:
+            self.kill()  # 스프라이트를 제거하고 메모리에서 해제
+
+# ============================================================================
+# 🐭 마우스 적 클래스 (MouseEnemy Class)
+# ============================================================================
+# 마우스 적은 왼쪽에서 오른쪽으로 이동하는 작은 적입니다.
+# 랜덤한 속도로 이동하며, 좌우 반전된 이미지로 표시됩니다.
+
+class MouseEnemy(pygame.sprite.Sprite):
+    """
+    마우스 적 클래스
+    
+    주요 기능:
+    - 왼쪽에서 오른쪽으로 자동 이동
+    - 랜덤한 속도로 이동
+    - 좌우 반전된 이미지로 표시
+    - 플레이어와 충돌 시 게임오버
+    - 수리검에 맞으면 체력 감소
+    
+    pygame.sprite.Sprite를 상속받아 Pygame의 스프라이트 시스템을 사용합니다.
+    """
+    
+    def __init__(self, x, y, stage=1, rng=None):
+        """
+        마우스 적 초기화 - 마우스 객체가 생성될 때 한 번만 실행됩니다.
+        
+        Args:
+            x: 마우스 시작 X 좌표 (보통 화면 왼쪽에서 시작)
+            y: 마우스 시작 Y 좌표 (보통 지면 높이)
+            stage: 현재 스테이지 (체력 계산에 사용, 기본값: 1)
+            rng: 랜덤 생성기 (random.Random, 없으면 random 모듈 사용)
+        
+        이 메서드에서:
+        - 마우스의 크기와 이미지를 설정합니다
+        - 마우스의 체력을 설정합니다 (스테이지에 따라 증가)
+        - 마우스의 이동 속도를 랜덤하게 설정합니다
+        """
+        super().__init__()  # pygame.sprite.Sprite 초기화 (반드시 필요)
+        
+        # ===== 마우스 크기 설정 =====
+        self.width = config.MOUSE_WIDTH   # 마우스 너비 (config.py에서 가져옴)
+        self.height = config.MOUSE_HEIGHT # 마우스 높이 (config.py에서 가져옴)
+        
+        # ===== 마우스 체력 설정 =====
+        # 스테이지에 따라 체력이 증가합니다
+        self.hp = config.MOUSE_BASE_HP + (stage - 1) * config.MOUSE_HP_STAGE_MULTIPLIER
+        
+        # ===== 마우스 이미지 로드 및 크기 조정 =====
+        try:
+            # assets/mouse.png 이미지를 config.py에 정의된 크기로 가져오기
+            # 마우스가 왼쪽으로 이동하므로 이미지를 좌우 반전 (캐시된 변형 사용)
+            self.image = asset_cache.get_image("assets/mouse.png", (self.width, self.height), flip=True)
+        except:
+            # 이미지 로드 실패 시 회색 사각형으로 대체 (캐시에서 한 번만 만들어 공유)
+            self.image = asset_cache.get_fallback("mouse", (self.width, self.height), config.GRAY)
+            _log_asset.warning("⚠️ 마우스 이미지 로드 실패 - 기본 사각형 사용", extra=_ONCE_PER_SEC)
+        
+        # ===== 마우스의 충돌 영역 설정 =====
+        # rect는 마우스의 충돌 영역을 나타냅니다
+        # midbottom=(x, y)는 사각형의 하단 중앙을 기준으로 위치를 설정합니다
+        # 마우스는 표창보다 아래에 위치하도록 Y 좌표를 조정
+        self.rect = self.image.get_rect(midbottom=(x, y))
+        
+        # 마우스의 충돌 영역 설정
+        # player와의 충돌을 위해 전체 영역 사용
+        self.collision_rect = self.rect.copy()
+        _log_spawn.debug("🐭 Mouse 생성: rect=%s, collision_rect=%s", self.rect, self.collision_rect)
+        
+        # ===== 마우스 이동 속도 설정 =====
+        # 랜덤한 속도로 설정 (config.py에서 정의된 범위 내에서)
+        self.speed = (rng or random).randint(config.MOUSE_SPEED_MIN, config.MOUSE_SPEED_MAX)
+    
+    def update(self, keys=None):
+        """
+        마우스 적 업데이트 - 매 프레임마다 실행됩니다.
+        
+        Args:
+            keys: 키 입력 상태 (사용하지 않지만 다른 스프라이트와 호환성을 위해 받음)
+        
+        이 메서드에서:
+        - 마우스를 오른쪽으로 이동시킵니다
+        - 화면 경계를 체크하여 화면 밖으로 나가면 제거합니다
+        """
+        # ===== 마우스 이동 =====
+        # 마우스를 왼쪽으로 이동 (X좌표 감소)
+        self.rect.x -= self.speed
+        
+        # ===== 화면 경계 체크 =====
+        # 화면 왼쪽 밖으로 나가면 자동 제거 (메모리 절약)
+        if self.rect.right < 0:
+            self.kill()  # 스프라이트를 제거하고 메모리에서 해제
+
+# ============================================================================
+# 👑 보스 고양이 클래스 (BossCat Class)
+# ============================================================================
+# 보스 고양이는 각 스테이지의 최종 보스입니다.
+# 일반 고양이보다 훨씬 강하며, 돌을 던져서 공격합니다.
+
+class BossCat(pygame.sprite.Sprite):
+    """
+    보스 고양이 클래스
+    
+    주요 기능:
+    - 높은 체력과 공격력
+    - 주기적으로 돌을 던져서 공격
+    - 랜덤한 간격으로 왼쪽으로 이동
+    - 화면 왼쪽을 벗어나면 처음 위치에서 다시 나타남
+    - 수리검에 맞으면 체력 감소
+    - 체력이 0이 되면 다음 스테이지로 진행
+    - 스테이지가 올라갈수록 체력 증가
+    
+    pygame.sprite.Sprite를 상속받아 Pygame의 스프라이트 시스템을 사용합니다.
+    """
+    
+    def __init__(self, x, y, stage=1, stone_groups=(), stone_pool=None, scheduler=None, rng=None, target=None):
+        """
+        보스 고양이 초기화 - 보스 객체가 생성될 때 한 번만 실행됩니다.
+        
+        Args:
+            x: 보스 시작 X 좌표 (보통 화면 오른쪽에서 시작)
+            y: 보스 시작 Y 좌표 (보통 지면 높이)
+            stage: 현재 스테이지 (체력 계산에 사용, 기본값: 1)
+            stone_groups: 던진 돌을 추가할 스프라이트 그룹들 (예: (stones, all_sprites))
+            stone_pool: 돌 재사용 풀 (acquire(x, y)를 가진 객체, 없으면 매번 새로 만듦)
+            scheduler: 이벤트 스케줄러 (있으면 공격/이동을 이벤트로 등록, 없으면 매 틱 타이머 검사)
+            rng: 랜덤 생성기 (random.Random, 없으면 random 모듈 사용, 이동 간격과 돌 속도에 사용)
+            target: 조준 공격("aimed" 패턴)의 목표 스프라이트 (보통 플레이어)
+        
+        이 메서드에서:
+        - 보스의 크기와 이미지를 설정합니다
+        - 보스의 체력을 설정합니다 (스테이지에 따라 증가)
+        - 보스의 공격 관련 변수들을 초기화합니다
+        """
+        super().__init__()  # pygame.sprite.Sprite 초기화 (반드시 필요)
+        
+        # ===== 보스 크기 설정 =====
+        self.width = config.BOSS_CAT_WIDTH   # 보스 너비 (config.py에서 가져옴)
+        self.height = config.BOSS_CAT_HEIGHT # 보스 높이 (config.py에서 가져옴)
+        
+        # ===== 보스 이미지 로드 및 크기 조정 =====
+        try:
+            # assets/cat_boss.png 이미지를 config.py에 정의된 크기로 가져오기
+            # 보스 고양이도 왼쪽을 향하도록 이미지를 좌우 반전 (캐시된 변형 사용)
+            self.image = asset_cache.get_image("assets/cat_boss.png", (self.width, self.height), flip=True)
+        except:
+            # 이미지 로드 실패 시 빨간색 사각형으로 대체 (캐시에서 한 번만 만들어 공유)
+            self.image = asset_cache.get_fallback("boss", (self.width, self.height), config.RED)
+            _log_asset.warning("⚠️ 보스 고양이 이미지 로드 실패 - 기본 사각형 사용", extra=_ONCE_PER_SEC)
+        
+        # ===== 보스의 충돌 영역 설정 =====
+        # rect는 보스의 충돌 영역을 나타냅니다
+        # midbottom=(x, y)는 사각형의 하단 중앙을 기준으로 위치를 설정합니다
+        self.rect = self.image.get_rect(midbottom=(x, y))
+        
+        # ===== 보스 체력 설정 =====
+        # 스테이지에 따라 체력이 증가합니다
+        # 기본 체력 * 2^(스테이지-1) 공식으로 계산
+        # 예: 스테이지 1 = 50, 스테이지 2 = 100, 스테이지 3 = 200
+        self.hp = config.BASE_BOSS_HP * (2 ** (stage - 1))
+        
+        # 랜덤 생성기 (GameSession의 시드를 따르는 random.Random)
+        self.rng = rng or random
+        
+        # ===== 보스 공격 관련 변수 =====
+        self.stone_groups = stone_groups  # 던진 돌이 들어갈 그룹들
+        self.stone_pool = stone_pool      # 돌 재사용 풀 (있으면 새로 만들지 않고 꺼내 씀)
+        self.attack_timer = 0        # 공격 타이머 (공격 간격 조절용)
+        self.attack_interval = config.BOSS_ATTACK_INTERVAL  # 공격 간격 (config에서 가져옴)
+        self.target = target
+        # 공격 패턴 (config.BOSS_PATTERN, None이면 돌 하나씩 던지는 기본 공격)
+        # 패턴이 있으면 첫 공격부터 패턴의 발사 간격을 따름
+        self.pattern = None
+        if config.BOSS_PATTERN:
+            self.pattern = boss_patterns.PatternRunner(boss_patterns.get_pattern(config.BOSS_PATTERN))
+            self.attack_interval = self.pattern.volleys[0].interval
+        
+        # ===== 보스 이동 관련 변수 =====
+        self.move_timer = 0          # 이동 타이머 (이동 간격 조절용)
+        self.move_interval = self.rng.randint(config.BOSS_MOVE_INTERVAL_MIN, config.BOSS_MOVE_INTERVAL_MAX)  # 랜덤 이동 간격
+        self.move_speed = config.BOSS_MOVE_SPEED  # 이동 속도 (config에서 가져옴)
+        self.is_moving = False       # 이동 중인지 여부
+        
+        # ===== 이벤트 스케줄러 =====
+        # 스케줄러가 있으면 attack_timer/move_timer 대신 "몇 틱 뒤에 공격/이동"을 이벤트로 등록합니다.
+        # (보스가 처치되면 GameSession이 남은 boss_attack/boss_move 이벤트를 취소합니다)
+        self.scheduler = scheduler
+        if scheduler is not None:
+            self._schedule_attack()
+            self._schedule_move()
+        
+        # 보스 스폰 로그 (boss 카테고리)
+        _log_boss.info("👑 보스 고양이 스폰! 체력: %d, 스테이지: %d, 이동 간격: %dms",
+                       self.hp, stage, self.move_interval)
+    
+    def _schedule_attack(self):
+        """attack_interval 뒤에 공격 이벤트를 등록합니다 (타이머의 ">=" 비교와 같은 틱)."""
+        ticks = ticks_until(self.attack_interval, config.TICK_MS, inclusive=True)
+        self.scheduler.after(ticks, "boss_attack", self.attack, PRIORITY_BOSS_ATTACK)
+    
+    def _schedule_move(self):
+        """move_interval 뒤에 이동 시작 이벤트를 등록합니다."""
+        ticks = ticks_until(self.move_interval, config.TICK_MS, inclusive=True)
+        self.scheduler.after(ticks, "boss_move", self.start_move, PRIORITY_BOSS_MOVE)
+    
+    @property
+    def pattern_state(self):
+        """공격 패턴 진행 상태 (스냅샷용, 패턴이 없으면 None)"""
+        return self.pattern.state if self.pattern is not None else None
+    
+    @pattern_state.setter
+    def pattern_state(self, value):
+        if self.pattern is not None and value is not None:
+            self.pattern.state = value
+    
+    def attack(self):
+        """
+        돌을 던집니다 (공격 간격마다 호출).
+        
+        보스 위치에서 약간 오프셋된 위치에 돌을 만들어 stone_pool 또는 stone_groups에 넣습니다.
+        공격 패턴이 있으면 패턴의 이번 발사만큼 여러 개를 던지고, 다음 공격 간격도 패턴을 따릅니다.
+        """
+        # ===== 돌 생성 및 던지기 =====
+        # 보스 위치에서 약간 오프셋된 위치에 돌 생성
+        # config.py에서 설정된 오프셋 값 사용
+        stone_x = self.rect.centerx + config.STONE_SPAWN_OFFSET_X  # X축 오프셋
+        stone_y = self.rect.bottom + config.STONE_SPAWN_OFFSET_Y   # Y축 오프셋
+        
+        if self.pattern is not None:
+            target = self.target.rect.center if self.target is not None else None
+            launches, self.attack_interval = self.pattern.fire((stone_x, stone_y), target)
+            for velocity in launches:
+                self._throw(stone_x, stone_y, velocity)
+            _log_boss.debug("🌀 보스 패턴 발사! 돌 %d개, 다음 발사까지 %dms", len(launches), self.attack_interval)
+        else:
+            stone = self._throw(stone_x, stone_y)
+            # 돌 던지기 로그 (boss 카테고리, DEBUG)
+            if stone is not None:
+                _log_boss.debug("🪨 보스가 돌을 던졌습니다! 위치: (%d, %d)", stone_x, stone_y)
+        
+        if self.scheduler is not None:
+            self._schedule_attack()  # 다음 공격 예약
+    
+    def _throw(self, x, y, velocity=None):
+        """
+        (x, y)에서 돌 하나를 던집니다.
+        
+        Args:
+            velocity: (vx, vy, gravity), 없으면 Stone의 기본 속도 (왼쪽으로 랜덤 속도)
+        
+        Returns:
+            돌 (stone_pool이 가득 차서 버렸으면 None)
+        """
+        if self.stone_pool is not None:
+            # 풀에서 돌 꺼내기 (풀이 그룹에 추가, 가득 차서 버려지면 None)
+            return self.stone_pool.acquire(x, y, velocity=velocity)
+        # Stone 객체 생성 (새로운 돌 공격)
+        stone = Stone(x, y, rng=self.rng, velocity=velocity)
+        # 돌을 적절한 스프라이트 그룹에 추가 (돌 관리용 + 화면 표시용)
+        stone.add(*self.stone_groups)
+        return stone
+    
+    def start_move(self):
+        """왼쪽으로 이동을 시작하고 다음 이동 간격을 랜덤하게 정합니다 (이동 간격마다 호출)."""
+        self.is_moving = True  # 이동 상태로 변경
+        # 다음 이동 간격을 랜덤하게 설정
+        self.move_interval = self.rng.randint(config.BOSS_MOVE_INTERVAL_MIN, config.BOSS_MOVE_INTERVAL_MAX)
+        _log_boss.debug("👑 보스 이동 시작! 다음 이동 간격: %dms", self.move_interval)
+        
+        if self.scheduler is not None:
+            self._schedule_move()  # 다음 이동 예약
+    
+    def update(self, keys=None):
+        """
+        보스 고양이 상태 업데이트 - 매 프레임마다 호출됩니다.
+        
+        Args:
+            keys: 키 입력 (보스는 자동 동작하므로 사용하지 않음)
+        
+        이 메서드에서:
+        - 스케줄러가 없으면 공격/이동 타이머를 직접 관리합니다
+        - 공격 간격에 도달하면 돌을 던집니다 (attack())
+        - 이동 간격에 도달하면 이동을 시작합니다 (start_move())
+        - 이동 중이면 왼쪽으로 이동합니다
+        - 화면 왼쪽을 벗어나면 처음 위치에서 다시 나타납니다
+        """
+        # ===== 공격/이동 타이머 관리 =====
+        # 스케줄러가 있으면 공격과 이동 시작은 이벤트로 실행되므로 여기서는 움직이기만 합니다
+        if self.scheduler is None:
+            # 공격 타이머 증가 (고정 틱 1회만큼 증가, config.TICK_MS)
+            self.attack_timer += config.TICK_MS
+            # 공격 간격에 도달하면 돌 던지기
+            if self.attack_timer >= self.attack_interval:
+                self.attack_timer = 0  # 타이머 리셋
+                self.attack()
+            
+            # 이동 타이머 증가 (고정 틱 1회만큼 증가, config.TICK_MS)
+            self.move_timer += config.TICK_MS
+            # 이동 간격에 도달하면 이동 시작
+            if self.move_timer >= self.move_interval:
+                self.move_timer = 0  # 타이머 리셋
+                self.start_move()
+        
+        # 이동 중일 때 왼쪽으로 이동
+        if self.is_moving:
+            self.rect.x -= self.move_speed
+            
+            # 화면 왼쪽 밖으로 나가면 처음 위치에서 다시 나타남
+            if self.rect.right < 0:
+                self.rect.midbottom = (config.BOSS_START_X, config.BOSS_START_Y)  # 처음 위치로 복원
+                self.is_moving = False  # 이동 상태 해제
+                _log_boss.debug("👑 보스가 화면 왼쪽을 벗어나 처음 위치(%d, %d)에서 다시 나타남!",
+                                config.BOSS_START_X, config.BOSS_START_Y)
+
+# ============================================================================
+# 🍪 간식 클래스 (Snack Class)
+# ============================================================================
+# 간식은 플레이어가 획득하면 더블 수리검 효과를 주는 아이템입니다.
+# 각 스테이지마다 한 번만 스폰되며, 플레이어가 먹으면 효과가 적용됩니다.
+
+class Snack(pygame.sprite.Sprite):
+    """
+    간식 클래스
+    
+    주요 기능:
+    - 플레이어가 획득하면 더블 수리검 효과 활성화
+    - 효과 지속 시간 동안 두 개의 수리검을 동시에 발사
+    - 왼쪽으로 자동 이동
+    - 화면 밖으로 나가면 자동 제거
+    
+    pygame.sprite.Sprite를 상속받아 Pygame의 스프라이트 시스템을 사용합니다.
+    """
+    
+    def __init__(self, x, y):
+        """
+        간식 초기화 - 간식 객체가 생성될 때 한 번만 실행됩니다.
+        
+        Args:
+            x: 간식 시작 X 좌표 (보통 화면 오른쪽에서 시작)
+            y: 간식 시작 Y 좌표 (보통 지면 위쪽)
+        
+        이 메서드에서:
+        - 간식의 크기와 이미지를 설정합니다
+        - 간식의 초기 위치를 설정합니다
+        - 간식의 이동 속도를 설정합니다
+        """
+        super().__init__()  # pygame.sprite.Sprite 초기화 (반드시 필요)
+        
+        # ===== 간식 크기 설정 =====
+        self.size = config.SNACK_SIZE  # 간식 크기 (config.py에서 가져옴)
+        
+        # ===== 간식 이미지 로드 및 크기 조정 =====
+        try:
+            # assets/snack.png 이미지를 config.py에 정의된 크기로 가져오기
+            self.image = asset_cache.get_image("assets/snack.png", (self.size, self.size))
+        except:
+            # 이미지 로드 실패 시 초록색 사각형으로 대체 (캐시에서 한 번만 만들어 공유)
+            self.image = asset_cache.get_fallback("snack", (self.size, self.size), config.GREEN)
+            _log_asset.warning("⚠️ 간식 이미지 로드 실패 - 기본 사각형 사용", extra=_ONCE_PER_SEC)
+        
+        # ===== 간식의 충돌 영역 설정 =====
+        # rect는 간식의 충돌 영역을 나타냅니다
+        # center=(x, y)는 사각형의 중심을 기준으로 위치를 설정합니다
+        self.rect = self.image.get_rect(center=(x, y))
+        
+        # ===== 간식 이동 속도 설정 =====
+        # 간식 이동 속도 (config.py에서 가져옴)
+        # 양수 값이므로 오른쪽에서 왼쪽으로 이동합니다
+        self.speed = config.SNACK_SPEED
+    
+    def update(self, keys=None):
+        """
+        간식 상태 업데이트 - 매 프레임마다 호출됩니다.
+        
+        Args:
+            keys: 키 입력 (간식은 자동 이동하므로 사용하지 않음)
+        
+        이 메서드에서:
+        - 간식을 왼쪽으로 이동시킵니다
+        - 화면 밖으로 나가면 자동으로 제거합니다
+        """
+        # ===== 간식 이동 =====
+        # 간식을 왼쪽으로 이동 (X좌표 감소)
+        self.rect.x -= self.speed
+        
+        # ===== 화면 경계 체크 =====
+        # 화면 왼쪽 밖으로 나가면 자동 제거 (메모리 절약)
+        if self.rect.right < 0:
+            self.kill()  # 스프라이트를 제거하고 메모리에서 해제
+
+# ============================================================================
+# 🐕 강아지 방어 아이템 클래스 (Puppy Class)
+# ============================================================================
+# Puppy는 플레이어가 획득하면 방어 효과를 주는 특별한 아이템입니다.
+# 플레이어가 고양이, 보스, 돌과 충돌해도 게임오버되지 않게 해줍니다.
+
+class Puppy(pygame.sprite.Sprite):
+    """
+    강아지 방어 아이템 클래스
+    
+    주요 기능:
+    - 플레이어가 획득하면 방어 효과 활성화
+    - 충돌 시 자동으로 방어 효과 소모
+    - 방어 횟수만큼 충돌을 막아줌
+    - 왼쪽으로 자동 이동
+    - 화면 밖으로 나가면 자동 제거
+    
+    pygame.sprite.Sprite를 상속받아 Pygame의 스프라이트 시스템을 사용합니다.
+    """
+    
+    def __init__(self, x, y):
+        """
+        강아지 방어 아이템 초기화 - puppy 객체가 생성될 때 한 번만 실행됩니다.
+        
+        Args:
+            x: puppy 시작 X 좌표 (보통 화면 오른쪽에서 시작)
+            y: puppy 시작 Y 좌표 (보통 지면 위쪽)
+        
+        이 메서드에서:
+        - puppy의 크기와 이미지를 설정합니다
+        - puppy의 초기 위치를 설정합니다
+        - puppy의 이동 속도를 설정합니다
+        """
+        super().__init__()  # pygame.sprite.Sprite 초기화 (반드시 필요)
+        
+        # ===== puppy 크기 설정 =====
+        self.size = config.PUPPY_SIZE  # puppy 크기 (config.py에서 가져옴)
+        
+        # ===== puppy 이미지 로드 및 크기 조정 =====
+        try:
+            # assets/puppy.png 이미지를 크기 조정 후 좌우 반전하여 가져오기
+            # (왼쪽에서 오른쪽으로 이동하므로 반전 필요, 캐시된 변형 사용)
+            self.image = asset_cache.get_image("assets/puppy.png", (self.size, self.size), flip=True)
+        except:
+            # 이미지 로드 실패 시 연한 주황색 사각형으로 대체 (캐시에서 한 번만 만들어 공유)
+            self.image = asset_cache.get_fallback("puppy", (self.size, self.size), (255, 200, 100))
+            _log_asset.warning("⚠️ 강아지 이미지 로드 실패 - 기본 사각형 사용", extra=_ONCE_PER_SEC)
+        
+        # ===== puppy의 충돌 영역 설정 =====
+        # rect는 puppy의 충돌 영역을 나타냅니다
+        # center=(x, y)는 사각형의 중심을 기준으로 위치를 설정합니다
+        self.rect = self.image.get_rect(center=(x, y))
+        
+        # ===== puppy 이동 속도 설정 =====
+        # puppy 이동 속도 (고정값, config에서 가져오지 않음)
+        # 양수 값이므로 오른쪽에서 왼쪽으로 이동합니다
+        self.speed = 3
+    
+    def update(self, keys=None):
+        """
+        강아지 방어 아이템 상태 업데이트 - 매 프레임마다 호출됩니다.
+        
+        Args:
+            keys: 키 입력 (puppy는 자동 이동하므로 사용하지 않음)
+        
+        이 메서드에서:
+        - puppy를 왼쪽으로 이동시킵니다
+        - 화면 밖으로 나가면 자동으로 제거합니다
+        """
+        # ===== puppy 이동 =====
+        # puppy를 왼쪽으로 이동 (X좌표 감소)
+        self.rect.x -= self.speed
+        
+        # ===== 화면 경계 체크 =====
+        # 화면 왼쪽 밖으로 나가면 자동 제거 (메모리 절약)
+        if self.rect.right < 0:
+            self.kill()  # 스프라이트를 제거하고 메모리에서 해제
+
+# ============================================================================
+# 🪨 돌 공격 클래스 (Stone Class)
+# ============================================================================
+# Stone은 보스 고양이가 던지는 공격 무기입니다.
+# 플레이어와 충돌하면 게임오버가 되며, 중력의 영향을 받아 포물선을 그리며 이동합니다.
+
+class Stone(pygame.sprite.Sprite):
+    """
+    돌 공격 클래스
+    
+    주요 기능:
+    - 보스 고양이가 주기적으로 던지는 공격
+    - 중력의 영향을 받아 포물선 궤도로 이동
+    - 플레이어와 충돌 시 게임오버
+    - 화면 밖으로 나가면 자동 제거
+    
+    pygame.sprite.Sprite를 상속받아 Pygame의 스프라이트 시스템을 사용합니다.
+    """
+    
+    def __init__(self, x, y, rng=None, velocity=None):
+        """
+        돌 공격 초기화 - 돌 객체가 생성될 때 한 번만 실행됩니다.
+        
+        Args:
+            x: 돌 시작 X 좌표 (보통 보스 고양이 위치에서 시작)
+            y: 돌 시작 Y 좌표 (보통 보스 고양이 아래쪽)
+            rng: 랜덤 생성기 (random.Random, 없으면 random 모듈 사용)
+                 풀에서 재사용될 때도 같은 생성기로 속도를 뽑습니다.
+            velocity: (vx, vy, gravity) - 보스 공격 패턴의 돌 (없으면 왼쪽으로 랜덤 속도)
+        
+        이 메서드에서:
+        - 돌의 크기와 이미지를 설정합니다
+        - 돌의 초기 위치를 설정합니다
+        - 돌의 물리 속성(속도, 중력 등)을 설정합니다
+        """
+        super().__init__()  # pygame.sprite.Sprite 초기화 (반드시 필요)
+        
+        self.rng = rng or random
+        
+        # ===== 돌 크기 설정 =====
+        self.radius = config.STONE_RADIUS  # 돌 반지름 (config.py에서 가져옴)
+        
+        # ===== 돌 이미지 로드 및 크기 조정 =====
+        try:
+            # assets/stone.png 이미지를 (radius*2 x radius*2) 크기로 가져오기
+            # 돌의 지름은 반지름의 2배이므로 (radius*2, radius*2) 크기로 설정
+            self.image = asset_cache.get_image("assets/stone.png", (self.radius*2, self.radius*2))
+        except:
+            # 이미지 로드 실패 시 회색 원으로 대체 (투명 배경, 캐시에서 한 번만 만들어 공유)
+            self.image = asset_cache.get_fallback("stone", (self.radius*2, self.radius*2), config.GRAY, "circle")
+            _log_asset.warning("⚠️ 돌 이미지 로드 실패 - 기본 원형 사용", extra=_ONCE_PER_SEC)
+        
+        # ===== 돌의 충돌 영역 설정 =====
+        # rect는 돌의 충돌 영역을 나타냅니다 (위치는 reset()에서 설정)
+        self.rect = self.image.get_rect()
+        self.reset(x, y, velocity)
+    
+    def reset(self, x, y, velocity=None):
+        """
+        돌을 (x, y)에서 다시 던질 상태로 되돌립니다.
+        
+        생성할 때, 그리고 ProjectilePool이 kill()된 돌을 재사용할 때 호출됩니다.
+        새로 만들 때와 똑같이 랜덤 속도를 한 번 뽑습니다.
+        velocity (vx, vy, gravity)를 주면 랜덤 없이 그 속도로 던집니다 (보스 공격 패턴).
+        """
+        # center=(x, y)는 사각형의 중심을 기준으로 위치를 설정합니다
+        self.rect.center = (x, y)
+        
+        # 실수 위치 - 속도가 소수여도 틱마다 반올림으로 잘리지 않고 누적됨 (rect는 이 값을 반올림한 위치)
+        self.pos_x = float(self.rect.x)
+        self.pos_y = float(self.rect.y)
+        
+        if velocity is not None:
+            # 패턴 돌: 방향이 정해진 속도 (비스듬하거나 위로 던진 돌, 포물선)
+            self.vel_x, self.vel_y, self.gravity = velocity
+            return
+        
+        # ===== 돌의 물리 속성 설정 =====
+        # 왼쪽으로만 던지기 (랜덤 속도)
+        # random.randint(최소값, 최대값)으로 랜덤한 속도 생성
+        random_speed = self.rng.randint(config.STONE_SPEED_MIN, config.STONE_SPEED_MAX)
+        self.vel_x = -random_speed  # 왼쪽으로 이동 (음수 = 왼쪽, 랜덤 속도)
+        self.vel_y = 0              # 수평으로만 발사 (위아래 움직임 없음, 초기값)
+        
+        # ===== 중력 설정 =====
+        # 중력 설정 (config.py에서 가져옴)
+        # 양수 값이므로 아래쪽으로 가속됩니다
+        self.gravity = config.STONE_GRAVITY
+    
+    def update(self, keys=None):
+        """
+        돌 공격 상태 업데이트 - 매 프레임마다 호출됩니다.
+        
+        Args:
+            keys: 키 입력 (돌은 자동 이동하므로 사용하지 않음)
+        
+        이 메서드에서:
+        - 중력을 적용하여 돌을 아래쪽으로 가속시킵니다
+        - 돌의 위치를 업데이트합니다
+        - 화면 밖으로 나가면 자동으로 제거합니다
+        """
+        # ===== 중력 적용 =====
+        # 중력으로 인해 아래쪽으로 가속 (Y축 속도 증가)
+        self.vel_y += self.gravity
+        
+        # ===== 위치 업데이트 =====
+        # 실수 위치에 속도를 더한 뒤 rect는 반올림한 픽셀 위치로 (정수 속도면 rect에 바로 더한 것과 같음)
+        self.pos_x += self.vel_x  # X축 이동 (왼쪽으로 일정한 속도)
+        self.pos_y += self.vel_y  # Y축 이동 (중력의 영향을 받아 가속)
+        self.rect.x = self.pos_x
+        self.rect.y = self.pos_y
+        
+        # ===== 화면 경계 체크 및 제거 =====
+        # 아래쪽 경계: 화면 아래로 나가면 제거
+        if self.rect.top > config.HEIGHT:
+            self.kill()
+        # 위쪽 경계: 위로 던진 패턴 돌이 화면 높이만큼 더 올라가면 제거 (포물선은 그 전에 다시 내려옴)
+        if self.rect.bottom < -config.HEIGHT:
+            self.kill()
+        # 왼쪽 경계: 화면 왼쪽으로 나가면 제거
+        if self.rect.left < 0:
+            self.kill()
+        # 오른쪽 경계: 화면 오른쪽으로 나가면 제거
+        if self.rect.right > config.WIDTH:
+            self.kill()
+
+
+def get_touch_rect(sprite, margin):
+    rect = sprite.rect.copy()
+    rect.inflate_ip(-margin*2, -margin*2)
+    return rect
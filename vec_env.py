@@ -0,0 +1,386 @@
+# vec_env.py
+
+import multiprocessing
+from multiprocessing import shared_memory
+
+import pygame
+
+import config
+from batch_runner import init_headless_worker
+from sprites import BossCat
+from session import GameSession, PlayerInput
+
+try:
+    import numpy as np
+except ImportError:  # VecEnv는 numpy가 있어야 사용 가능
+    np = None
+
+# ============================================================================
+# 🧪 벡터 환경 (VecEnv) - 봇 학습용 여러 게임 동시 진행
+# ============================================================================
+# main.py의 창 루프는 1초에 60틱만 진행합니다. 봇을 학습시키려면
+# 서로 다른 게임 N개를 화면 없이 최대 속도로, 한 번에 한 틱씩 같이(lockstep) 진행해야 합니다.
+#
+#     env = VecEnv(8, seed=0, workers=2, frames=True)
+#     obs = env.reset()                                 # (8, OBS_SIZE) float32
+#     while ...:
+#         actions = policy(obs)                         # (8, 4) - 왼쪽, 오른쪽, 점프, 발사 횟수
+#         obs, rewards, dones, infos = env.step(actions)
+#         env.frames                                    # (8, 75, 100) uint8 축소 화면
+#     env.close()
+#
+# - 관측(observation): 화면을 그리지 않고 세션의 엔티티 상태에서 바로 만든 고정 길이 벡터
+#     플레이어 PLAYER_FEATURES개 + 플레이어와 가까운 순서로 max_objects개 물체 × OBJECT_FEATURES개
+# - 보상(reward): 이번 틱의 점수(score) 증가량
+# - done: 게임 오버 / 게임 클리어 / max_ticks 초과. 끝난 게임은 다음 시드로 바로 reset()되고
+#   infos[i]에 끝난 게임의 결과가 들어갑니다 (돌려주는 관측은 새 게임의 첫 관측).
+# - frames=True: 물체를 종류별 밝기의 사각형으로 찍은 축소 흑백 화면 (이미지 blit 없음)
+#
+# workers > 0이면 게임들을 작업 프로세스에 나눠서 진행합니다.
+# 관측과 축소 화면은 공유 메모리(multiprocessing.shared_memory)에 있어서
+# 작업 프로세스가 직접 쓰고, 메인 프로세스는 복사하지 않고 같은 배열을 읽습니다.
+# 그래서 step()이 돌려준 obs / frames는 다음 step()에서 덮어써집니다 (보관하려면 .copy()).
+
+# 관측 벡터의 물체 종류 (종류별 one-hot)
+OBJECT_KINDS = ("cat", "boss", "mouse", "stone", "snack", "puppy")
+PLAYER_FEATURES = 8   # x, y, vel_y, on_ground, 방어, gold shuriken, 스테이지, 보스 체력 비율
+OBJECT_FEATURES = 4 + len(OBJECT_KINDS)  # dx, dy, w, h (화면 크기로 나눈 값) + 종류 one-hot
+MAX_OBJECTS = 16
+
+FRAME_SCALE = 8  # 축소 화면 = 원래 화면 / FRAME_SCALE (800x600 -> 100x75)
+
+# 축소 화면에서 종류별 밝기 (배경 0)
+_FRAME_VALUES = {
+    "cat": 150,
+    "boss": 200,
+    "mouse": 110,
+    "stone": 230,
+    "snack": 60,
+    "puppy": 80,
+    "player": 255,
+}
+
+_KIND_INDEX = {kind: index for index, kind in enumerate(OBJECT_KINDS)}
+
+
+def available():
+    """numpy를 사용할 수 있는지 여부 (False면 VecEnv를 쓸 수 없음)"""
+    return np is not None
+
+
+def observation_size(max_objects=MAX_OBJECTS):
+    """관측 벡터 길이"""
+    return PLAYER_FEATURES + max_objects * OBJECT_FEATURES
+
+
+def _objects(session):
+    """세션의 물체 목록 [(종류, x, y, w, h)] (스프라이트 + numpy 배열)"""
+    objects = []
+    for sprite in session.enemies:
+        r = sprite.rect
+        objects.append(("boss" if isinstance(sprite, BossCat) else "cat", r.x, r.y, r.w, r.h))
+    for kind, group in (("mouse", session.mice), ("stone", session.stones),
+                        ("snack", session.items), ("puppy", session.puppies)):
+        for sprite in group:
+            r = sprite.rect
+            objects.append((kind, r.x, r.y, r.w, r.h))
+    entities = session.entities
+    if entities is not None:
+        for kind, arrays in (("cat", entities.cats), ("mouse", entities.mice), ("stone", entities.stones)):
+            if arrays.count:
+                c = arrays.columns()
+                objects.extend(zip((kind,) * arrays.count, c["x"].tolist(), c["y"].tolist(),
+                                   c["w"].tolist(), c["h"].tolist()))
+    return objects
+
+
+def write_observation(session, out, max_objects=MAX_OBJECTS):
+    """
+    세션 상태를 관측 벡터로 out(길이 observation_size()의 float32 배열)에 씁니다.
+
+    - 플레이어: 위치(화면 크기로 나눔), 세로 속도, 땅 위 여부, 남은 방어 횟수,
+      gold shuriken 수, 스테이지(MAX_STAGE로 나눔), 보스 체력 비율(보스가 없으면 0)
+    - 물체: 플레이어 중심에서 가로 거리가 가까운 순서로 max_objects개, 모자라면 0
+    """
+    width, height = config.WIDTH, config.HEIGHT
+    player = session.player
+    rect = player.rect
+    boss = session.boss
+    boss_hp = 0.0
+    if boss is not None:
+        boss_hp = boss.hp / (config.BASE_BOSS_HP * (2 ** (session.current_stage - 1)))
+    out[:PLAYER_FEATURES] = (
+        rect.x / width, rect.y / height, player.vel_y / 20.0, float(player.on_ground),
+        player.defense_count, player.gold_shuriken_count / 10.0,
+        session.current_stage / config.MAX_STAGE, boss_hp,
+    )
+    out[PLAYER_FEATURES:] = 0.0
+
+    cx, cy = rect.center
+    objects = _objects(session)
+    objects.sort(key=lambda o: abs(o[1] + o[3] / 2 - cx))
+    offset = PLAYER_FEATURES
+    for kind, x, y, w, h in objects[:max_objects]:
+        out[offset:offset + 4] = ((x + w / 2 - cx) / width, (y + h / 2 - cy) / height, w / width, h / height)
+        out[offset + 4 + _KIND_INDEX[kind]] = 1.0
+        offset += OBJECT_FEATURES
+
+
+def write_frame(session, out):
+    """
+    세션 상태를 축소 흑백 화면으로 out((높이, 너비) uint8 배열)에 찍습니다.
+
+    물체마다 사각형을 종류별 밝기로 채우기만 하므로 이미지를 그리는 것보다 훨씬 빠릅니다.
+    """
+    scale_y = out.shape[0] / config.HEIGHT
+    scale_x = out.shape[1] / config.WIDTH
+    out.fill(0)
+    player = session.player.rect
+    for kind, x, y, w, h in _objects(session) + [("player", player.x, player.y, player.w, player.h)]:
+        top = max(0, int(y * scale_y))
+        left = max(0, int(x * scale_x))
+        # 작은 물체도 최소 1픽셀은 보이도록
+        bottom = max(top + 1, int((y + h) * scale_y))
+        right = max(left + 1, int((x + w) * scale_x))
+        out[top:bottom, left:right] = _FRAME_VALUES[kind]
+
+
+class _EnvGroup:
+    """
+    게임 여러 개를 한 프로세스에서 진행하는 묶음 (VecEnv 안에서, 또는 작업 프로세스에서 사용)
+
+    obs / frames는 이 묶음이 맡은 게임들의 배열 view이고, reset()/step()이 그 자리에 씁니다.
+    """
+
+    def __init__(self, start, count, num_envs, obs, frames, options):
+        self.start = start
+        self.num_envs = num_envs
+        self.obs = obs
+        self.frames = frames
+        self.seed = options["seed"]
+        self.max_objects = options["max_objects"]
+        self.max_ticks = options["max_ticks"]
+        self.episodes = [0] * count
+        self.sessions = [GameSession(options["backend"], seed=self._seed(i)) for i in range(count)]
+
+    def _seed(self, i):
+        """i번 게임의 이번 에피소드 시드 (모든 게임, 모든 에피소드가 서로 다른 시드)"""
+        return self.seed + self.start + i + self.episodes[i] * self.num_envs
+
+    def _observe(self, i):
+        write_observation(self.sessions[i], self.obs[i], self.max_objects)
+        if self.frames is not None:
+            write_frame(self.sessions[i], self.frames[i])
+
+    def reset(self):
+        for i, session in enumerate(self.sessions):
+            session.reset(self._seed(i))
+            self._observe(i)
+
+    def step(self, actions):
+        """
+        모든 게임을 한 틱씩 진행합니다.
+
+        Args:
+            actions: 게임마다 (왼쪽, 오른쪽, 점프, 발사 횟수)
+
+        Returns:
+            tuple: (보상 목록, done 목록, info 목록 - 끝난 게임만 결과 dict, 나머지는 None)
+        """
+        rewards = []
+        dones = []
+        infos = []
+        for i, (session, action) in enumerate(zip(self.sessions, actions)):
+            left, right, jump, throw = action
+            score = session.score
+            state = session.tick(PlayerInput(bool(left), bool(right), bool(jump), int(throw)))
+            rewards.append(session.score - score)
+            if state not in ("game_over", "game_clear") and session.tick_count >= self.max_ticks:
+                state = "timeout"
+            done = state in ("game_over", "game_clear", "timeout")
+            dones.append(done)
+            if done:
+                infos.append({"seed": session.seed, "state": state, "score": session.score,
+                              "stage": session.current_stage, "ticks": session.tick_count,
+                              "cause": session.death_cause})
+                self.episodes[i] += 1
+                session.reset(self._seed(i))
+            else:
+                infos.append(None)
+            self._observe(i)
+        return rewards, dones, infos
+
+
+def _worker_loop(conn, start, count, num_envs, shm_names, options):
+    """작업 프로세스: 공유 메모리에 붙고 메인 프로세스의 명령(reset, step, close)을 처리"""
+    init_headless_worker(options["overrides"])
+    blocks = [shared_memory.SharedMemory(name=name) for name in shm_names]
+    obs = np.ndarray((num_envs, observation_size(options["max_objects"])), np.float32, buffer=blocks[0].buf)
+    frames = None
+    if len(blocks) > 1:
+        frames = np.ndarray((num_envs,) + options["frame_shape"], np.uint8, buffer=blocks[1].buf)
+        frames = frames[start:start + count]
+    group = _EnvGroup(start, count, num_envs, obs[start:start + count], frames, options)
+    try:
+        while True:
+            command, data = conn.recv()
+            if command == "step":
+                conn.send(group.step(data))
+            elif command == "reset":
+                group.reset()
+                conn.send(None)
+            else:  # "close"
+                break
+    finally:
+        del obs, frames, group  # 공유 메모리를 닫기 전에 view를 모두 놓음
+        for block in blocks:
+            block.close()
+        conn.close()
+
+
+class VecEnv:
+    """
+    독립된 GameSession N개를 한 틱씩 같이 진행하는 벡터 환경
+
+    주요 기능:
+    - reset() / step(actions): 관측 (N, OBS_SIZE), 보상 (N,), done (N,), info 목록
+    - frames: (N, 높이, 너비) uint8 축소 화면 (frames=True일 때)
+    - workers > 0: 게임을 작업 프로세스에 나눠 진행 (관측과 화면은 공유 메모리로 복사 없이 전달)
+    - close(): 작업 프로세스 종료, 공유 메모리 해제 (with 문으로도 사용 가능)
+    """
+
+    def __init__(self, num_envs, seed=0, backend="sprites", workers=0, frames=False,
+                 max_objects=MAX_OBJECTS, max_ticks=None, overrides=None):
+        """
+        Args:
+            num_envs: 동시에 진행할 게임 수
+            seed: 첫 시드 (i번 게임의 k번째 에피소드 시드 = seed + i + k * num_envs)
+            backend: 엔티티 저장 방식 ("sprites" / "numpy")
+            workers: 작업 프로세스 수 (0이면 이 프로세스에서 진행)
+            frames: True면 축소 흑백 화면도 만듦 (원래 화면 / FRAME_SCALE)
+            max_objects: 관측에 넣을 물체 수
+            max_ticks: 한 게임의 최대 틱 수 (넘으면 done, state "timeout") (기본값: 10분)
+            overrides: {config 이름: 값} - 작업 프로세스의 config 덮어쓰기 (batch_runner --set과 같음)
+
+        Raises:
+            RuntimeError: numpy가 설치되어 있지 않음
+        """
+        if np is None:
+            raise RuntimeError("VecEnv는 numpy가 필요합니다")
+        self.num_envs = num_envs
+        self.observation_size = observation_size(max_objects)
+        self.frame_shape = (config.HEIGHT // FRAME_SCALE, config.WIDTH // FRAME_SCALE) if frames else None
+        options = {
+            "seed": seed,
+            "backend": backend,
+            "max_objects": max_objects,
+            "max_ticks": max_ticks or config.TICK_RATE * 600,
+            "frame_shape": self.frame_shape,
+            "overrides": overrides or {},
+        }
+        self._blocks = []
+        self._groups = []  # workers == 0: 이 프로세스의 _EnvGroup 하나
+        self._workers = []  # workers > 0: (Process, 연결, 시작 인덱스, 게임 수)
+
+        obs_bytes = num_envs * self.observation_size * np.dtype(np.float32).itemsize
+        if workers:
+            self._blocks.append(shared_memory.SharedMemory(create=True, size=obs_bytes))
+            if frames:
+                frame_bytes = num_envs * self.frame_shape[0] * self.frame_shape[1]
+                self._blocks.append(shared_memory.SharedMemory(create=True, size=frame_bytes))
+            self.obs = np.ndarray((num_envs, self.observation_size), np.float32, buffer=self._blocks[0].buf)
+            self.frames = (np.ndarray((num_envs,) + self.frame_shape, np.uint8, buffer=self._blocks[1].buf)
+                           if frames else None)
+            names = [block.name for block in self._blocks]
+            workers = min(workers, num_envs)
+            for w in range(workers):
+                start = num_envs * w // workers
+                count = num_envs * (w + 1) // workers - start
+                parent_conn, child_conn = multiprocessing.Pipe()
+                process = multiprocessing.Process(target=_worker_loop, name=f"vec-env-{w}", daemon=True,
+                                                  args=(child_conn, start, count, num_envs, names, options))
+                process.start()
+                child_conn.close()
+                self._workers.append((process, parent_conn, start, count))
+        else:
+            if pygame.display.get_surface() is None:
+                pygame.display.init()
+                pygame.display.set_mode((config.WIDTH, config.HEIGHT))  # 이미지 로드에 필요
+            self.obs = np.zeros((num_envs, self.observation_size), np.float32)
+            self.frames = np.zeros((num_envs,) + self.frame_shape, np.uint8) if frames else None
+            self._groups.append(_EnvGroup(0, num_envs, num_envs, self.obs, self.frames, options))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def reset(self):
+        """
+        모든 게임을 새로 시작합니다.
+
+        Returns:
+            numpy.ndarray: (N, OBS_SIZE) 관측 (공유 배열 - 다음 step()에서 덮어씀)
+        """
+        for group in self._groups:
+            group.reset()
+        for _, conn, _, _ in self._workers:
+            conn.send(("reset", None))
+        for _, conn, _, _ in self._workers:
+            conn.recv()
+        return self.obs
+
+    def step(self, actions):
+        """
+        모든 게임을 한 틱씩 진행합니다.
+
+        Args:
+            actions: (N, 4) 배열 - 게임마다 (왼쪽, 오른쪽, 점프, 발사 횟수)
+
+        Returns:
+            tuple: (관측 (N, OBS_SIZE), 보상 (N,) float32, done (N,) bool,
+                    info 목록 - 끝난 게임만 {seed, state, score, stage, ticks, cause}, 나머지는 None)
+        """
+        actions = np.asarray(actions, dtype=np.int64).reshape(self.num_envs, 4).tolist()
+        rewards = []
+        dones = []
+        infos = []
+        for group in self._groups:
+            results = group.step(actions)
+            rewards += results[0]
+            dones += results[1]
+            infos += results[2]
+        # 모든 작업 프로세스에 먼저 보내고 나서 받아야 동시에 진행됨
+        for _, conn, start, count in self._workers:
+            conn.send(("step", actions[start:start + count]))
+        for _, conn, _, _ in self._workers:
+            group_rewards, group_dones, group_infos = conn.recv()
+            rewards += group_rewards
+            dones += group_dones
+            infos += group_infos
+        return self.obs, np.asarray(rewards, np.float32), np.asarray(dones, bool), infos
+
+    def close(self):
+        """작업 프로세스를 끝내고 공유 메모리를 해제합니다."""
+        for process, conn, _, _ in self._workers:
+            try:
+                conn.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process, conn, _, _ in self._workers:
+            process.join(timeout=5.0)
+            if process.is_alive():
+                process.terminate()
+            conn.close()
+        self._workers = []
+        self._groups = []
+        self.obs = None
+        self.frames = None
+        for block in self._blocks:
+            try:
+                block.close()
+            except BufferError:
+                pass  # 호출한 쪽이 아직 obs/frames 배열을 들고 있음 (배열이 없어질 때 해제됨)
+            block.unlink()
+        self._blocks = []